@@ -0,0 +1,166 @@
+"""
+Moteur audio à faible latence de Pendu Deluxe
+- Le mixeur démarre avec un petit tampon : un son part quelques millisecondes après
+  play() au lieu de plusieurs dizaines
+- Chaque catégorie d'effet ('error', 'correct', 'victory', 'defeat') a ses propres
+  canaux réservés : la musique et les autres sons ne peuvent pas les occuper
+- Quand tous les canaux d'une catégorie sont pris, le son le plus ancien est coupé
+  (vol de voix) au lieu de perdre le nouveau
+- Un même effet redéclenché trop vite (touche maintenue, double appui) est ignoré
+- La latence entre la touche et l'appel à play() est mesurée pour chaque son joué
+"""
+import time     # Module pour mesurer la latence et l'anti-rebond
+from collections import deque  # Dernières mesures de latence
+
+import pygame   # Bibliothèque principale pour créer des jeux 2D
+
+DEFAULT_BUFFER = 256  # Échantillons par tampon du mixeur (~6 ms à 44,1 kHz)
+
+# Canaux réservés par catégorie d'effet
+CATEGORY_CHANNELS = {
+    "error": 2,
+    "correct": 2,
+    "victory": 1,
+    "defeat": 1,
+}
+
+# Délai minimal entre deux déclenchements d'une même catégorie (secondes)
+DEBOUNCE_SECONDS = {
+    "error": 0.03,
+    "correct": 0.03,
+    "victory": 0.5,
+    "defeat": 0.5,
+}
+
+FREE_CHANNELS = 4      # Canaux laissés aux sons non réservés (musique de secours...)
+LATENCY_SAMPLES = 256  # Nombre de mesures de latence conservées
+
+def init_mixer(buffer=DEFAULT_BUFFER):
+    """
+    Démarre le mixeur avec un tampon réduit
+    Un mixeur déjà démarré avec un autre tampon est redémarré
+    
+    Args:
+        buffer: taille du tampon en échantillons (puissance de 2 conseillée)
+    
+    Raises:
+        pygame.error: si aucun périphérique audio n'est disponible
+    """
+    if pygame.mixer.get_init():
+        pygame.mixer.quit()
+    pygame.mixer.init(buffer=buffer)
+
+def percentile(values, fraction):
+    """
+    Retourne le centile d'une liste de valeurs (0 si la liste est vide)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class AudioEngine:
+    """
+    Lecture des effets sonores sur des canaux réservés par catégorie
+    """
+    
+    def __init__(self, sounds, buffer=DEFAULT_BUFFER, latency_hook=None):
+        """
+        Args:
+            sounds: nom de l'effet -> pygame.mixer.Sound (les noms sont les catégories)
+            buffer: taille du tampon du mixeur (pour estimer la latence de sortie)
+            latency_hook: fonction appelée avec (nom, latence en secondes) à chaque son
+                joué avec un instant de déclenchement (optionnel)
+        """
+        self.sounds = sounds
+        self.latency_hook = latency_hook
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)  # Touche -> play(), en secondes
+        self.stats = {"played": 0, "stolen": 0, "debounced": 0}
+        
+        frequency = pygame.mixer.get_init()[0]
+        self.output_latency = buffer / frequency  # Délai ajouté par le tampon du mixeur
+        
+        # === RÉSERVATION DES CANAUX ===
+        # Sound.play() ne choisit jamais un canal réservé : la musique de secours et les
+        # sons hors catégorie ne prennent pas la place des effets
+        reserved = sum(CATEGORY_CHANNELS.values())
+        pygame.mixer.set_num_channels(reserved + FREE_CHANNELS)
+        pygame.mixer.set_reserved(reserved)
+        self.channels = {}    # Catégorie -> liste de pygame.mixer.Channel
+        self.started = {}     # Catégorie -> instant de départ du son de chaque canal
+        index = 0
+        for category, count in CATEGORY_CHANNELS.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            self.started[category] = [0.0] * count
+            index += count
+        self.last_trigger = {category: float("-inf") for category in CATEGORY_CHANNELS}
+    
+    def play(self, name, triggered_at=None):
+        """
+        Joue un effet sur un canal de sa catégorie
+        
+        Args:
+            name: nom de l'effet ('error', 'correct', 'victory', 'defeat')
+            triggered_at: instant de l'action du joueur (time.perf_counter()) pour la
+                mesure de latence (optionnel)
+        
+        Returns:
+            bool: True si le son a été lancé (False s'il est inconnu ou ignoré par l'anti-rebond)
+        """
+        sound = self.sounds.get(name)
+        if sound is None or name not in self.channels:
+            return False
+        
+        # === ANTI-REBOND ===
+        now = time.perf_counter()
+        if now - self.last_trigger[name] < DEBOUNCE_SECONDS[name]:
+            self.stats["debounced"] += 1
+            return False
+        self.last_trigger[name] = now
+        
+        # === CHOIX DU CANAL ===
+        # Un canal libre si possible, sinon celui dont le son a commencé le plus tôt
+        channels, started = self.channels[name], self.started[name]
+        slot = None
+        for i, channel in enumerate(channels):
+            if not channel.get_busy():
+                slot = i
+                break
+        if slot is None:
+            slot = started.index(min(started))
+            self.stats["stolen"] += 1
+        
+        channels[slot].play(sound)  # Coupe le son en cours sur ce canal
+        started[slot] = now
+        self.stats["played"] += 1
+        
+        # === MESURE DE LATENCE ===
+        if triggered_at is not None:
+            latency = time.perf_counter() - triggered_at
+            self.latencies.append(latency)
+            if self.latency_hook is not None:
+                self.latency_hook(name, latency)
+        return True
+    
+    def stop(self):
+        """
+        Coupe tous les effets en cours
+        """
+        for channels in self.channels.values():
+            for channel in channels:
+                channel.stop()
+    
+    def latency_summary(self):
+        """
+        Résume les latences mesurées
+        
+        Returns:
+            dict: nombre de mesures, médiane et 95e centile (ms), latence du tampon (ms)
+        """
+        samples = list(self.latencies)
+        return {
+            "samples": len(samples),
+            "p50_ms": percentile(samples, 0.5) * 1000,
+            "p95_ms": percentile(samples, 0.95) * 1000,
+            "output_ms": self.output_latency * 1000,
+        }
@@ -0,0 +1,570 @@
+"""
+Banc d'essai des performances de Pendu Deluxe
+Mesure le coût des différentes parties du rendu sans ouvrir de vraie fenêtre
+
+Usage:
+    python benchmark.py                 # Lance tous les bancs d'essai
+    python benchmark.py stickman        # Lance seulement le banc d'essai choisi
+"""
+import os       # Module pour configurer SDL avant l'import de pygame
+import sys      # Module système pour les arguments et la sortie
+import time     # Module pour mesurer les durées
+import argparse # Module pour lire les options de la ligne de commande
+import io       # Module pour faire taire les messages du jeu pendant les mesures
+import contextlib
+import gc       # Module du ramasse-miettes (comptage des surfaces vivantes)
+import tracemalloc  # Module de suivi des allocations mémoire
+import tempfile  # Dossier de l'état du tirage des parties mesurées
+
+# === MODE SANS FENÊTRE ===
+# Les pilotes "dummy" permettent de lancer les mesures sur un serveur ou en CI
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame   # Bibliothèque principale pour créer des jeux 2D
+import hangman  # Jeu à mesurer
+import renderer # Moteurs de rendu à comparer
+import audio    # Moteur des effets sonores
+import scheduler  # Cadence des frames selon l'activité
+import inputlatency  # Latence touche -> frame affichée
+import gcbudget  # Pauses du ramasse-miettes et allocations par frame
+import metrics  # Point de mesure HTTP (format Prometheus)
+import threading  # Collectes simultanées du point de mesure
+import urllib.request  # Client HTTP des collectes
+from rules import ALPHABET
+
+def time_frames(function, frames):
+    """
+    Mesure le temps moyen d'exécution d'une fonction appelée une fois par frame
+    
+    Args:
+        function: fonction appelée avec le numéro de frame
+        frames: nombre de frames mesurées
+    
+    Returns:
+        float: temps moyen par frame en microsecondes
+    """
+    start = time.perf_counter()
+    for frame in range(frames):
+        function(frame)
+    return (time.perf_counter() - start) / frames * 1e6
+
+def draw_stickman_direct(screen, penalties, animation_time):
+    """
+    Dessine le pendu primitive par primitive, comme avant la mise en cache des calques
+    Sert de référence pour le banc d'essai du pendu
+    """
+    x, y = hangman.STICKMAN_X, hangman.STICKMAN_Y
+    sway = hangman.math.sin(animation_time * 0.05) * 2
+    hangman.draw_gallows(screen, x, y, penalties)
+    if penalties >= 4:
+        hangman.draw_rope(screen, x + 30, int(y + sway * 0.3))
+    man_x, man_y = x + 30 + sway, y - 20
+    hangman.draw_stickman_figure(screen, int(man_x), man_y, penalties)
+    hangman.draw_stickman_arms(screen, man_x, man_y, penalties, animation_time)
+
+def bench_stickman(screen, frames):
+    """
+    Compare le coût par frame du pendu dessiné en primitives et avec les calques en cache
+    """
+    print("=== PENDU : coût par frame (µs) ===")
+    
+    # Coût unique de préparation des calques
+    hangman.STICKMAN_LAYERS.clear()
+    start = time.perf_counter()
+    hangman.build_stickman_layers()
+    print(f"Préparation des calques (11 niveaux): {(time.perf_counter() - start) * 1e3:.2f} ms")
+    
+    print(f"{'erreurs':>8} {'primitives':>12} {'cache':>10} {'gain':>7}")
+    for penalties in (0, 5, 10):
+        direct = time_frames(lambda frame: draw_stickman_direct(screen, penalties, frame), frames)
+        cached = time_frames(lambda frame: hangman.draw_animated_stickman(screen, penalties, frame), frames)
+        print(f"{penalties:>8} {direct:>12.1f} {cached:>10.1f} {direct / cached:>6.1f}x")
+
+def draw_word_direct(screen, word, font, animation_time):
+    """
+    Dessine un mot entièrement découvert en rendant chaque glyphe à chaque frame,
+    comme avant le pré-rendu des glyphes. Sert de référence pour le banc d'essai du mot
+    """
+    x_start = hangman.WINDOW_WIDTH // 2 - (len(word) * 40) // 2
+    for i, letter in enumerate(word):
+        x = x_start + i * 50
+        bounce = hangman.math.sin(animation_time * 0.1 + i * 0.5) * 3
+        screen.blit(font.render(letter, True, (0, 0, 0, 100)), (x + 2, 502 + bounce))
+        color = [hangman.LIGHT_BLUE, hangman.PURPLE, hangman.PINK, hangman.GREEN, hangman.YELLOW][i % 5]
+        screen.blit(font.render(letter, True, color), (x, 500 + bounce))
+
+def bench_word(screen, frames):
+    """
+    Compare le coût par frame du mot affiché avec rendu des glyphes et avec le cache
+    """
+    print("=== MOT À DEVINER : coût par frame (µs) ===")
+    font = pygame.font.Font(None, 48)
+    print(f"{'mot':>16} {'rendu':>10} {'cache':>10} {'gain':>7}")
+    for word in ("CHAT", "CLAUSTROPHOBIE"):
+        display = hangman.WordDisplay(word, font)
+        for letter in word:
+            display.reveal(letter)
+        direct = time_frames(lambda frame: draw_word_direct(screen, word, font, frame), frames)
+        cached = time_frames(lambda frame: display.draw(screen, frame), frames)
+        print(f"{word:>16} {direct:>10.1f} {cached:>10.1f} {direct / cached:>6.1f}x")
+
+# Les parties mesurées ne touchent ni la partie enregistrée ni les sacs du joueur
+STATE_DIRECTORY = tempfile.TemporaryDirectory(prefix="pendu-bench-")
+
+def new_game(quality=hangman.DEFAULT_QUALITY, **options):
+    """
+    Crée une partie isolée : sans reprise, état du tirage dans un dossier temporaire
+    """
+    return hangman.HangmanDeluxe(quality, resume=False,
+                                 sampler_state_path=os.path.join(STATE_DIRECTORY.name, "sampler_state.json"),
+                                 **options)
+
+def make_game(quality=hangman.DEFAULT_QUALITY):
+    """
+    Crée une partie sans les messages de la console et fait avancer les animations
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = new_game(quality)
+        for _ in range(120):  # Laisse les lettres tomber et les traînées se former
+            game.update()
+    return game
+
+def bench_renderer(screen, frames):
+    """
+    Compare le coût d'une frame complète (update + rendu) selon le moteur de rendu
+    """
+    print("=== FRAME COMPLÈTE PAR MOTEUR DE RENDU (µs) ===")
+    game = make_game()
+    
+    def frame_cost(target):
+        def step(frame):
+            game.update()
+            game.render(target)
+        return time_frames(step, frames)
+    
+    print(f"{'logiciel':>24} {frame_cost(renderer.SoftwareRenderer(screen)):>10.1f}")
+    
+    # Textures SDL2 : pilote accéléré si disponible, sinon pilote logiciel de SDL
+    for accelerated, label in ((True, "textures (accéléré)"), (False, "textures (SDL logiciel)")):
+        try:
+            texture_renderer = renderer.TextureRenderer(screen.get_size(), "benchmark", accelerated)
+        except (ImportError, pygame.error) as e:
+            print(f"{label:>24} {'indisponible':>10} ({e})")
+            continue
+        print(f"{label:>24} {frame_cost(texture_renderer):>10.1f}")
+        texture_renderer.close()
+        break
+
+def bench_scale(screen, frames):
+    """
+    Mesure les FPS d'une frame complète (update + rendu) à chaque échelle de rendu
+    """
+    print("=== FPS PAR ÉCHELLE DE RENDU (frame complète, sans limite de FPS) ===")
+    game = make_game()
+    for _ in range(30):  # Particules actives pendant la mesure
+        game.queue_burst(hangman.WINDOW_WIDTH // 2, 400, hangman.GREEN, 10)
+    
+    def frame_cost(target):
+        def step(frame):
+            game.update()
+            game.render(target)
+        return time_frames(step, frames)
+    
+    print(f"{'échelle':>8} {'µs/frame':>10} {'FPS':>8} {'particules réduites':>19} {'FPS':>8} "
+          f"{'lissé':>10} {'FPS':>8}")
+    for scale in renderer.RENDER_SCALES:
+        if scale == 1.0:
+            native = reduced = smooth = frame_cost(renderer.SoftwareRenderer(screen))
+        else:
+            native = frame_cost(renderer.ScaledRenderer(screen, scale))
+            reduced = frame_cost(renderer.ScaledRenderer(screen, scale, native_overlays=False))
+            smooth = frame_cost(renderer.ScaledRenderer(screen, scale, smooth=True))
+        print(f"{scale:>8g} {native:>10.1f} {1e6 / native:>8.0f} {reduced:>19.1f} {1e6 / reduced:>8.0f} "
+              f"{smooth:>10.1f} {1e6 / smooth:>8.0f}")
+
+def bench_field(screen, frames):
+    """
+    Compare une frame complète selon le nombre de lettres tombantes : tableaux NumPy
+    dessinés en lot (FallingLetterField) et un objet par lettre (FallingLetterGroup)
+    """
+    print("=== LETTRES TOMBANTES : frame complète (µs) ===")
+    if hangman.FallingLetterField is None:
+        print("NumPy indisponible : seul le repli objet est utilisable")
+        return
+    game = make_game("extreme")  # Sans traînées ni particules d'accompagnement
+    software = renderer.SoftwareRenderer(screen)
+    
+    def step(frame):
+        game.update()
+        game.render(software)
+    
+    print(f"{'lettres':>8} {'objets':>10} {'FPS':>6} {'NumPy':>10} {'FPS':>6} {'gain':>7}")
+    field = game.falling_letters
+    for count in (25, 500, 2000):
+        group = hangman.FallingLetterGroup(count, trail_length=1, sparkles=False)
+        game.falling_letters = group
+        for _ in range(10):  # Premières frames : sprites fabriqués
+            step(0)
+        objects = time_frames(step, max(1, frames // 10))
+        
+        field.resize(count)
+        game.falling_letters = field
+        for _ in range(600):  # Sprites (crans de rotation, transparence) presque tous fabriqués
+            step(0)
+        batched = time_frames(step, frames)
+        print(f"{count:>8} {objects:>10.1f} {1e6 / objects:>6.0f} {batched:>10.1f} "
+              f"{1e6 / batched:>6.0f} {objects / batched:>6.1f}x")
+
+def bench_audio(screen, frames):
+    """
+    Mesure la latence touche -> play() des effets et le comportement en frappe rapide
+    """
+    print("=== AUDIO : latence des effets ===")
+    print(f"{'tampon':>8} {'sortie (ms)':>12} {'touche->play p50':>17} {'p95 (ms)':>9} "
+          f"{'joués':>6} {'volés':>6} {'ignorés':>8}")
+    for buffer in (2048, 512, audio.DEFAULT_BUFFER):
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = new_game(audio_buffer=buffer)
+        if game.audio is None:
+            print("Mixeur indisponible")
+            return
+        
+        # Frappe rapide : une lettre toutes les 10 ms, parties enchaînées
+        with contextlib.redirect_stdout(io.StringIO()):
+            for press in range(min(frames, 200)):
+                if game.game_over:
+                    game.reset_game()
+                letters = [letter for letter in ALPHABET if letter not in game.guessed_letters]
+                game.guess_letter(letters[press % len(letters)], time.perf_counter())
+                time.sleep(0.01)
+        summary = game.audio.latency_summary()
+        stats = game.audio.stats
+        print(f"{buffer:>8} {summary['output_ms']:>12.1f} {summary['p50_ms']:>17.3f} "
+              f"{summary['p95_ms']:>9.3f} {stats['played']:>6} {stats['stolen']:>6} {stats['debounced']:>8}")
+
+def bench_idle(screen, frames):
+    """
+    Mesure la charge processeur de la boucle de jeu dans chaque mode de cadence
+    (même enchaînement que main : événements, mises à jour, rendu, attente)
+    """
+    print("=== CADENCE : charge processeur par mode ===")
+    seconds = max(1.0, min(frames, 300) / hangman.FPS)
+    game = make_game()
+    target = renderer.SoftwareRenderer(screen)
+    print(f"{'mode':>10} {'frames/s':>9} {'processeur':>11}")
+    scenarios = [
+        (scheduler.ACTIVE, {}, None),
+        (scheduler.IDLE, {"idle_seconds": 0.0}, None),
+        (scheduler.SUSPENDED, {}, pygame.WINDOWMINIMIZED),
+    ]
+    for mode, settings, event_type in scenarios:
+        frame_scheduler = scheduler.FrameScheduler(hangman.FPS, **settings)
+        if event_type is not None:
+            pygame.event.post(pygame.event.Event(event_type))
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            frame_scheduler.events()
+            if not frame_scheduler.frame_due():
+                continue
+            for _ in range(frame_scheduler.update_steps):
+                game.update()
+            game.render(target)
+            frame_scheduler.tick()
+        summary = frame_scheduler.summary()[mode]
+        print(f"{mode:>10} {summary['frames'] / summary['seconds']:>9.1f} {summary['cpu_percent']:>10.1f}%")
+
+def bench_input(screen, frames):
+    """
+    Mesure la latence touche -> frame affichée avec des rafales de touches
+    (même enchaînement que main : événements, coups, mises à jour, rendu, attente)
+    """
+    print("=== ENTRÉES : latence des rafales de touches ===")
+    game = make_game()
+    target = renderer.SoftwareRenderer(screen)
+    inputlatency.restrict_events()
+    frame_scheduler = scheduler.FrameScheduler(hangman.FPS, idle_fps=0)
+    tracker = inputlatency.LatencyTracker()
+    burst, letter_index = 8, 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(min(frames, 600)):
+            if frame % 10 == 0:  # Rafale de touches toutes les 10 frames
+                for _ in range(burst):
+                    key = pygame.K_a + letter_index % len(ALPHABET)
+                    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+                    letter_index += 7  # Ordre des lettres varié
+            events = frame_scheduler.events()
+            received = time.perf_counter()
+            tracker.events_read(received)
+            for event in events:
+                if event.type != pygame.KEYDOWN:
+                    continue
+                if game.game_over:
+                    game.reset_game()
+                if game.guess_letter(chr(event.key).upper(), received):
+                    tracker.input_handled(time.perf_counter())
+            game.update()
+            game.render(target)
+            pygame.display.flip()
+            tracker.frame_presented(time.perf_counter())
+            game.run_deferred()
+            frame_scheduler.tick()
+    pygame.event.set_allowed(None)
+    
+    print(f"{burst} touches toutes les 10 frames, frame = {1000 / hangman.FPS:.1f} ms")
+    print(f"{'étape':>8} {'touches':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'max (ms)':>9}")
+    for stage, summary in tracker.summary().items():
+        print(f"{stage:>8} {summary['samples']:>8} {summary['p50_ms']:>9.2f} "
+              f"{summary['p95_ms']:>9.2f} {summary['max_ms']:>9.2f}")
+    for line in tracker.histogram_lines("total"):
+        print(line)
+
+def bench_gc(screen, frames):
+    """
+    Compare la régularité des frames avec le ramasse-miettes par défaut et avec le
+    réglage de production (gc.freeze() et seuils), puis mesure les allocations par frame
+    """
+    print("=== RAMASSE-MIETTES : pauses et régularité des frames ===")
+    game = make_game()
+    target = renderer.SoftwareRenderer(screen)
+    defaults = gc.get_threshold()
+    frames = max(frames, 1000)
+    
+    def play(frame):
+        if frame % 20 == 0:  # Une touche toutes les 20 frames (particules, explosions)
+            if game.game_over:
+                game.reset_game()
+            game.guess_letter(ALPHABET[frame // 20 * 7 % len(ALPHABET)])
+        game.update()
+        game.render(target)
+        game.run_deferred()
+    
+    print(f"{'réglage':>14} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'écart (ms)':>11} "
+          f"{'collectes 0/1/2':>16} {'pause max':>10} {'signalées':>10} {'complète':>9}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(300):  # Caches de sprites remplis avant les deux mesures
+            play(frame)
+        results = []
+        for label, thresholds in (("défaut", None), ("gel + seuils", gcbudget.TUNED_THRESHOLDS)):
+            if thresholds is not None:
+                gcbudget.tune_gc(thresholds)
+            # Collecte complète : rare, mais c'est elle qui provoque les à-coups
+            start = time.perf_counter()
+            gc.collect()
+            full_collection = (time.perf_counter() - start) * 1000
+            monitor = gcbudget.GCMonitor()
+            monitor.start()
+            durations = []
+            for frame in range(frames):
+                start = time.perf_counter()
+                play(frame)
+                durations.append((time.perf_counter() - start) * 1000)
+                monitor.end_frame()
+            monitor.stop()
+            gc.unfreeze()
+            gc.set_threshold(*defaults)
+            results.append((label, durations, monitor.summary(), full_collection))
+        
+        # === ALLOCATIONS PAR FRAME (tracemalloc) ===
+        tracker = gcbudget.AllocationTracker()
+        tracker.start()
+        for frame in range(min(frames, 500)):
+            play(frame)
+            tracker.end_frame()
+        allocations = tracker.summary()
+        top_lines = tracker.top_lines(5)
+        tracker.stop()
+    
+    for label, durations, summary, full_collection in results:
+        mean = sum(durations) / len(durations)
+        deviation = (sum((d - mean) ** 2 for d in durations) / len(durations)) ** 0.5
+        collections = "/".join(str(count) for count in summary["collections"])
+        print(f"{label:>14} {audio.percentile(durations, 0.5):>9.2f} {audio.percentile(durations, 0.99):>9.2f} "
+              f"{max(durations):>9.2f} {deviation:>11.2f} {collections:>16} "
+              f"{summary['max_pause_ms']:>8.2f}ms {summary['flagged']:>10} {full_collection:>7.2f}ms")
+    print(f"Allocations par frame : pic médian {allocations['peak_p50'] / 1024:.1f} Kio, "
+          f"p95 {allocations['peak_p95'] / 1024:.1f} Kio, solde moyen {allocations['net_mean']:.0f} octets, "
+          f"{allocations['blocks_mean']:.1f} blocs")
+    for line in top_lines:
+        print(f"  {line}")
+
+def bench_metrics(screen, frames):
+    """
+    Mesure le coût des mesures par frame, celui d'une collecte, et la durée des frames
+    sans point de mesure puis avec des collectes simultanées toutes les 10 ms
+    (un serveur Prometheus collecte toutes les 15 s par défaut)
+    """
+    print("=== MESURES : coût sur la boucle de jeu et collectes HTTP ===")
+    game = make_game()
+    target = renderer.SoftwareRenderer(screen)
+    
+    # === COÛT PAR FRAME (trois horloges et trois histogrammes) ===
+    game_metrics = metrics.GameMetrics(game)
+    calls = 100000
+    start = time.perf_counter()
+    for _ in range(calls):
+        frame_started = time.perf_counter()
+        updated = time.perf_counter()
+        game_metrics.frame_presented(frame_started, updated, time.perf_counter())
+    per_frame_us = (time.perf_counter() - start) / calls * 1e6
+    renders = 1000
+    start = time.perf_counter()
+    for _ in range(renders):
+        page = game_metrics.registry.render()
+    render_ms = (time.perf_counter() - start) * 1000 / renders
+    print(f"Par frame : {per_frame_us:.2f} µs ; collecte : {render_ms:.3f} ms pour {len(page)} octets")
+    
+    def play(frame, instrument):
+        if frame % 20 == 0:  # Une touche toutes les 20 frames (particules, explosions)
+            if game.game_over:
+                game.reset_game()
+            game.guess_letter(ALPHABET[frame // 20 * 7 % len(ALPHABET)])
+        frame_started = time.perf_counter()
+        game.update()
+        updated = time.perf_counter()
+        game.render(target)
+        presented = time.perf_counter()
+        if instrument is not None:
+            instrument.frame_presented(frame_started, updated, presented)
+        game.run_deferred()
+    
+    def scrape(url, stop, counter):
+        while not stop.wait(0.01):
+            urllib.request.urlopen(url).read()
+            counter.append(1)
+    
+    print(f"{'mesures':>22} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'collectes':>10}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(300):  # Caches de sprites remplis avant les mesures
+            play(frame, None)
+        results = []
+        for label, serve in (("aucune", False), ("collectes / 10 ms", True)):
+            instrument = server = worker = None
+            stop, scrapes = threading.Event(), []
+            if serve:
+                instrument = metrics.GameMetrics(game)
+                server = metrics.MetricsServer(instrument.registry).start()
+                host, port = server.address
+                worker = threading.Thread(target=scrape, args=(f"http://{host}:{port}/metrics", stop, scrapes))
+                worker.start()
+            durations = []
+            for frame in range(frames):
+                start = time.perf_counter()
+                play(frame, instrument)
+                durations.append((time.perf_counter() - start) * 1000)
+            if serve:
+                stop.set()
+                worker.join()
+                server.close()
+            results.append((label, durations, len(scrapes)))
+    for label, durations, scrapes in results:
+        print(f"{label:>22} {audio.percentile(durations, 0.5):>9.2f} {audio.percentile(durations, 0.99):>9.2f} "
+              f"{max(durations):>9.2f} {scrapes:>10}")
+
+def bench_game_over(screen, frames):
+    """
+    Vérifie avec tracemalloc que l'écran de fin de partie n'alloue rien à chaque frame
+    et mesure son coût
+    
+    Returns:
+        bool: False si des allocations par frame ont été détectées
+    """
+    print("=== ÉCRAN DE FIN DE PARTIE ===")
+    game = make_game()
+    ok = True
+    
+    print(f"{'écran':>10} {'µs/frame':>10} {'octets nets':>12} {'pic (octets)':>13} {'surfaces':>9}")
+    for won in (True, False):
+        game.game_over = True
+        game.won = won
+        game.game_over_screen = None
+        
+        # Premier cycle de pulsation : composition de l'écran et remplissage du cache
+        for frame in range(130):
+            game.draw_game_over(screen)
+            game.animation_time += 1
+        
+        def step(frame):
+            game.draw_game_over(screen)
+            game.animation_time += 1
+        
+        # === MESURE DES ALLOCATIONS ===
+        surfaces_before = count_surfaces()
+        tracemalloc.start()
+        for frame in range(10):  # Quelques frames pour exclure le coût fixe du traçage
+            step(frame)
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for frame in range(frames):
+            step(frame)
+        end_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        new_surfaces = count_surfaces() - surfaces_before
+        
+        cost = time_frames(step, frames)
+        net = end_size - start_size
+        peak = peak_size - start_size
+        label = "victoire" if won else "défaite"
+        print(f"{label:>10} {cost:>10.1f} {net:>12} {peak:>13} {new_surfaces:>9}")
+        
+        # Quelques octets sont tolérés : entiers de la boucle de mesure encore référencés
+        # (la valeur ne dépend pas du nombre de frames)
+        if net > 64 or new_surfaces > 0 or peak > 1024:
+            ok = False
+    
+    print("Aucune allocation par frame: " + ("OK" if ok else "ÉCHEC"))
+    return ok
+
+def count_surfaces():
+    """
+    Compte les objets pygame.Surface vivants (pour détecter les allocations de surfaces)
+    """
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, pygame.Surface))
+
+# Bancs d'essai disponibles, dans l'ordre d'exécution
+BENCHMARKS = {
+    "stickman": bench_stickman,
+    "word": bench_word,
+    "renderer": bench_renderer,
+    "scale": bench_scale,
+    "field": bench_field,
+    "audio": bench_audio,
+    "idle": bench_idle,
+    "input": bench_input,
+    "gc": bench_gc,
+    "metrics": bench_metrics,
+    "gameover": bench_game_over,
+}
+
+def main(argv=None):
+    """
+    Lance les bancs d'essai demandés
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai de Pendu Deluxe")
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"bancs d'essai à lancer parmi {', '.join(BENCHMARKS)} (tous par défaut)")
+    parser.add_argument("--frames", type=int, default=2000,
+                        help="nombre de frames mesurées par scénario")
+    options = parser.parse_args(argv)
+    for name in options.names:
+        if name not in BENCHMARKS:
+            parser.error(f"banc d'essai inconnu: {name}")
+    
+    hangman.bootstrap()
+    screen = pygame.display.set_mode((hangman.WINDOW_WIDTH, hangman.WINDOW_HEIGHT))
+    failures = []
+    for name in options.names or BENCHMARKS:
+        # Les bancs d'essai qui contiennent une vérification retournent False en cas d'échec
+        if BENCHMARKS[name](screen, options.frames) is False:
+            failures.append(name)
+        print()
+    
+    pygame.quit()
+    if failures:
+        print(f"Vérifications échouées: {', '.join(failures)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
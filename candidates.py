@@ -0,0 +1,501 @@
+"""
+Cache des mots candidats de Pendu Deluxe
+Beaucoup de parties passent par les mêmes états (premier coup faux sur un mot de 7
+lettres...) : le filtrage du dictionnaire par un motif est fait une seule fois puis
+gardé en mémoire. Une entrée est identifiée par le motif visible ("C_A_") et un
+masque de 26 bits des lettres fausses ; elle contient les identifiants des mots
+compatibles et, pour chaque lettre, le nombre de ces mots qui la contiennent.
+
+- CandidateCache.lookup(pattern, wrong) : identifiants et comptes par lettre
+- CandidateCache.counts(pattern, wrong) : seulement les comptes (meilleur coup, indice)
+- La mémoire est bornée : au-delà du budget, les entrées les moins récemment utilisées
+  sont retirées (LRU)
+- SharedCountTable : table en mémoire partagée entre processus pour les comptes par
+  lettre (taille fixe par entrée) ; les identifiants restent dans le cache de chaque
+  processus
+
+Usage:
+    python candidates.py bench --games 20000          # Filtrage direct et avec le cache
+    python candidates.py match C_A_ --wrong XZ
+"""
+import re       # Module pour filtrer les mots d'une longueur en un seul passage
+import sys      # Module système pour la taille des objets et la sortie
+import time     # Module pour mesurer la vitesse
+import random   # Module pour tirer les mots du banc d'essai
+import struct   # Module pour les entrées de la table partagée
+import hashlib  # Module pour les clés de la table partagée
+import argparse # Module pour lire les options de la ligne de commande
+from array import array  # Identifiants et comptes compacts
+from collections import OrderedDict, namedtuple
+
+from dictionary import all_words
+from rules import ALPHABET, is_playable, masked_pattern
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024  # Budget mémoire du cache local
+ENTRY_OVERHEAD = 200                  # Octets par entrée hors tableaux (clé, nœud LRU...)
+DEFAULT_SHARED_SLOTS = 65536          # Entrées de la table partagée (8 Mo)
+
+FINGERPRINT_MODULUS = 1 << 64             # Empreinte du dictionnaire sur 64 bits
+PLAYABLE_BYTES = ("\n" + ALPHABET).encode("ascii")  # Octets d'un texte de mots jouables
+
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+
+# Résultat du filtrage pour un état de partie
+CandidateSet = namedtuple("CandidateSet", [
+    "ids",     # Identifiants des mots compatibles (array d'entiers, ordre du dictionnaire)
+    "counts",  # counts[i] : nombre de ces mots qui contiennent ALPHABET[i]
+])
+
+def wrong_mask(letters):
+    """
+    Convertit des lettres fausses en masque de 26 bits (bit i pour ALPHABET[i])
+    
+    Args:
+        letters: lettres proposées absentes du mot
+    
+    Returns:
+        int: masque des lettres
+    """
+    mask = 0
+    for letter in letters:
+        mask |= LETTER_BITS[letter]
+    return mask
+
+def mask_letters(mask):
+    """
+    Retourne les lettres d'un masque de 26 bits (inverse de wrong_mask)
+    """
+    return "".join(letter for letter, bit in LETTER_BITS.items() if mask & bit)
+
+def word_digest(word):
+    """
+    Empreinte de 64 bits d'un mot (l'empreinte d'un dictionnaire est leur somme)
+    """
+    return int.from_bytes(hashlib.blake2b(word.encode("ascii"), digest_size=8).digest(), "little")
+
+class SharedCountTable:
+    """
+    Table des comptes par lettre en mémoire partagée, lisible par plusieurs processus
+    Chaque clé tombe dans une case fixe (pas de liste chaînée) : une nouvelle entrée
+    remplace l'ancienne. L'empreinte de la clé est écrite au début et à la fin de la
+    case ; une lecture pendant une écriture voit deux empreintes différentes et est
+    traitée comme une absence.
+    """
+    
+    # Empreinte, nombre de candidats, 26 comptes, empreinte de fin (128 octets)
+    SLOT = struct.Struct("<QI26IQ4x")
+    BODY = struct.Struct("<QI26I")
+    TAIL = struct.Struct("<Q")
+    
+    def __init__(self, slots=DEFAULT_SHARED_SLOTS, name=None):
+        """
+        Args:
+            slots: nombre de cases (ignoré quand la table existe déjà)
+            name: nom d'une table créée par un autre processus (None pour en créer une)
+        
+        Raises:
+            FileNotFoundError: si la table nommée n'existe pas
+        """
+        from multiprocessing import shared_memory
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=slots * self.SLOT.size)
+            self.memory.buf[:] = bytes(len(self.memory.buf))
+            self.owner = True
+        else:
+            # Les processus lancés par le créateur partagent son suivi des ressources :
+            # la table n'est détruite que par close() du créateur
+            self.memory = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.memory.name
+        self.slots = len(self.memory.buf) // self.SLOT.size
+        self.tail_offset = self.SLOT.size - 4 - self.TAIL.size
+    
+    def get(self, digest):
+        """
+        Retourne (nombre de candidats, comptes) pour une empreinte, ou None si absente
+        """
+        offset = (digest % self.slots) * self.SLOT.size
+        body = self.BODY.unpack_from(self.memory.buf, offset)
+        tail, = self.TAIL.unpack_from(self.memory.buf, offset + self.tail_offset)
+        if body[0] != digest or tail != digest:
+            return None
+        return body[1], body[2:]
+    
+    def put(self, digest, total, counts):
+        """
+        Enregistre les comptes d'une empreinte (remplace l'occupant de la case)
+        """
+        offset = (digest % self.slots) * self.SLOT.size
+        buf = self.memory.buf
+        self.TAIL.pack_into(buf, offset + self.tail_offset, 0)  # Case invalide pendant l'écriture
+        self.BODY.pack_into(buf, offset, digest, total, *counts)
+        self.TAIL.pack_into(buf, offset + self.tail_offset, digest)
+    
+    def close(self):
+        """
+        Détache la table de ce processus (et la détruit si ce processus l'a créée)
+        """
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+class CandidateCache:
+    """
+    Cache LRU borné en mémoire des mots compatibles avec un état de partie
+    """
+    
+    def __init__(self, words=None, max_bytes=DEFAULT_MAX_BYTES, shared=None, store=None):
+        """
+        Args:
+            words: mots du dictionnaire (par défaut toute la base jouable au clavier)
+            max_bytes: budget mémoire estimé des entrées
+            shared: SharedCountTable commune à plusieurs processus (optionnel)
+            store: WordStore (wordstore.py) indexé à la place de words : les textes sont
+                lus dans le trie, sans créer une chaîne par mot
+        """
+        self.max_bytes = max_bytes
+        self.shared = shared
+        
+        # === MOTS REGROUPÉS PAR LONGUEUR ===
+        # Un texte par longueur ("CHAT\nCHIEN\n...") : l'expression régulière du motif le
+        # parcourt en C, et la position d'un mot donne son rang (toutes les lignes ont la
+        # même taille) ; ids[rang] est l'identifiant du mot
+        self.by_length = {}
+        if store is not None:
+            self.index_store(store)
+        else:
+            self.index_words([word for word in dict.fromkeys(words or all_words()) if is_playable(word)])
+        
+        self.entries = OrderedDict()  # (motif, masque) -> CandidateSet, du plus ancien au plus récent
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "shared_hits": 0}
+    
+    def index_words(self, words):
+        """
+        Indexe une liste de mots jouables (identifiant = position dans la liste)
+        """
+        groups = {}
+        for word_id, word in enumerate(words):
+            group = groups.setdefault(len(word), ([], array("I")))
+            group[0].append(word)
+            group[1].append(word_id)
+        for length, (group_words, word_ids) in groups.items():
+            self.index_length(length, group_words, word_ids)
+        self.next_id = len(words)  # Identifiant du prochain mot ajouté
+        # Les clés de la table partagée dépendent du dictionnaire : somme des empreintes
+        # des mots, mise à jour mot par mot quand le dictionnaire change
+        self.fingerprint = sum(map(word_digest, words)) % FINGERPRINT_MODULUS
+    
+    def index_store(self, store):
+        """
+        Indexe une base compacte (identifiant = numéro du mot dans la base)
+        Les groupes en A-Z sont décodés d'un bloc ; seuls ceux qui contiennent des
+        lettres accentuées ou des tirets sont découpés mot à mot pour les écarter
+        """
+        others = {}
+        for length, (text, first, count) in store.length_groups().items():
+            if not text.translate(None, PLAYABLE_BYTES):
+                self.by_length[length] = (text.decode("ascii"), array("I", range(first, first + count)))
+                continue
+            for word_id, word in enumerate(text.decode("utf-8").split("\n"), first):
+                if is_playable(word):
+                    group = others.setdefault(len(word), ([], array("I")))
+                    group[0].append(word)
+                    group[1].append(word_id)
+        # Mots jouables des groupes mélangés (longueur en lettres, pas en octets)
+        for length, (group_words, word_ids) in others.items():
+            if length in self.by_length:
+                text, ids = self.by_length[length]
+                group_words = text.split("\n") + group_words
+                word_ids = ids + word_ids
+            self.index_length(length, group_words, word_ids)
+        self.next_id = len(store)
+        # Empreinte de la base (les mots ajoutés ou retirés ensuite la modifient mot par mot)
+        self.fingerprint = int(store.fingerprint[:16], 16) % FINGERPRINT_MODULUS
+    
+    def __len__(self):
+        return sum(len(ids) for _, ids in self.by_length.values())
+    
+    def index_length(self, length, words, word_ids):
+        """
+        (Re)construit le texte des mots d'une longueur
+        """
+        if words:
+            self.by_length[length] = ("\n".join(words), array("I", word_ids))
+        else:
+            self.by_length.pop(length, None)
+    
+    def length_words(self, length):
+        """
+        Retourne les mots d'une longueur et leurs identifiants
+        """
+        text, word_ids = self.by_length.get(length, ("", array("I")))
+        return (text.split("\n") if text else []), word_ids
+    
+    def word(self, word_id):
+        """
+        Retourne le mot d'un identifiant (recherche dans chaque longueur)
+        
+        Raises:
+            KeyError: si aucun mot ne porte cet identifiant
+        """
+        for length, (text, word_ids) in self.by_length.items():
+            try:
+                position = word_ids.index(word_id) * (length + 1)
+            except ValueError:
+                continue
+            return text[position:position + length]
+        raise KeyError(word_id)
+    
+    def update_words(self, added=(), removed=()):
+        """
+        Ajoute et retire des mots sans reconstruire tout l'index
+        Les identifiants des autres mots ne changent pas (un mot retiré ne rend pas le
+        sien) ; seules les longueurs touchées sont réindexées et seules leurs entrées
+        quittent le cache
+        
+        Args:
+            added: nouveaux mots
+            removed: mots qui disparaissent
+        """
+        changes = {}  # Longueur -> (mots retirés, mots ajoutés)
+        for word in removed:
+            changes.setdefault(len(word), (set(), []))[0].add(word)
+        for word in added:
+            if is_playable(word):
+                changes.setdefault(len(word), (set(), []))[1].append(word)
+        
+        for length, (gone, new) in changes.items():
+            words, word_ids = self.length_words(length)
+            kept, kept_ids = [], array("I")
+            for word, word_id in zip(words, word_ids):
+                if word in gone:
+                    self.fingerprint = (self.fingerprint - word_digest(word)) % FINGERPRINT_MODULUS
+                else:
+                    kept.append(word)
+                    kept_ids.append(word_id)
+            present = set(kept)
+            for word in new:
+                if word not in present:
+                    present.add(word)
+                    kept.append(word)
+                    kept_ids.append(self.next_id)
+                    self.next_id += 1
+                    self.fingerprint = (self.fingerprint + word_digest(word)) % FINGERPRINT_MODULUS
+            self.index_length(length, kept, kept_ids)
+        for key in [key for key in self.entries if len(key[0]) in changes]:
+            self.bytes -= self.entry_bytes(key, self.entries.pop(key))
+    
+    def filter(self, pattern, mask):
+        """
+        Filtre le dictionnaire sans passer par le cache
+        
+        Args:
+            pattern: mot masqué, '_' pour les lettres cachées
+            mask: masque des lettres fausses
+        
+        Returns:
+            CandidateSet: mots compatibles et comptes par lettre
+        """
+        counts = array("I", bytes(4 * len(ALPHABET)))
+        group = self.by_length.get(len(pattern))
+        if group is None:
+            return CandidateSet(array("I"), counts)
+        text, word_ids = group
+        
+        # Une case cachée ne contient ni une lettre déjà révélée ni une lettre fausse
+        banned = "".join(sorted(set(pattern.replace("_", "")) | set(mask_letters(mask))))
+        hidden = f"[^{banned}\\n]" if banned else "[^\\n]"
+        regex = re.compile("^" + "".join(hidden if char == "_" else re.escape(char) for char in pattern) + "$",
+                           re.MULTILINE)
+        
+        line = len(pattern) + 1
+        matches = list(regex.finditer(text))
+        ids = array("I", [word_ids[match.start() // line] for match in matches])
+        index = {letter: i for i, letter in enumerate(ALPHABET)}
+        for letters in map(set, map(re.Match.group, matches)):
+            for letter in letters:
+                counts[index[letter]] += 1
+        return CandidateSet(ids, counts)
+    
+    def lookup(self, pattern, wrong_letters=""):
+        """
+        Retourne les mots compatibles avec un état de partie
+        
+        Args:
+            pattern: mot masqué, '_' pour les lettres cachées (ex: "C_A_")
+            wrong_letters: lettres proposées absentes du mot
+        
+        Returns:
+            CandidateSet: identifiants des mots et comptes par lettre (à ne pas modifier)
+        """
+        key = (pattern, wrong_mask(wrong_letters))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry
+        
+        self.stats["misses"] += 1
+        entry = self.filter(*key)
+        self.store(key, entry)
+        if self.shared is not None:
+            self.shared.put(self.digest(key), len(entry.ids), entry.counts)
+        return entry
+    
+    def counts(self, pattern, wrong_letters=""):
+        """
+        Retourne le nombre de mots compatibles et les comptes par lettre
+        Consulte la table partagée avant de filtrer le dictionnaire
+        
+        Returns:
+            tuple: (nombre de candidats, comptes par lettre dans l'ordre de ALPHABET)
+        """
+        key = (pattern, wrong_mask(wrong_letters))
+        entry = self.entries.get(key)
+        if entry is None and self.shared is not None:
+            found = self.shared.get(self.digest(key))
+            if found is not None:
+                self.stats["shared_hits"] += 1
+                return found
+        if entry is None:
+            entry = self.lookup(pattern, wrong_letters)
+        else:
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+        return len(entry.ids), entry.counts
+    
+    def best_letter(self, pattern, wrong_letters=""):
+        """
+        Lettre non proposée présente dans le plus grand nombre de mots compatibles
+        
+        Returns:
+            str ou None: lettre à jouer (None si aucun mot ne correspond)
+        """
+        guessed = set(pattern.replace("_", "")) | set(wrong_letters)
+        _, counts = self.counts(pattern, wrong_letters)
+        best, best_count = None, 0
+        for letter, count in zip(ALPHABET, counts):
+            if count > best_count and letter not in guessed:
+                best, best_count = letter, count
+        return best
+    
+    def store(self, key, entry):
+        """
+        Ajoute une entrée puis retire les plus anciennes tant que le budget est dépassé
+        """
+        self.entries[key] = entry
+        self.bytes += self.entry_bytes(key, entry)
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            old_key, old_entry = self.entries.popitem(last=False)
+            self.bytes -= self.entry_bytes(old_key, old_entry)
+            self.stats["evictions"] += 1
+    
+    @staticmethod
+    def entry_bytes(key, entry):
+        """
+        Estimation de la mémoire occupée par une entrée
+        """
+        return sys.getsizeof(key[0]) + sys.getsizeof(entry.ids) + sys.getsizeof(entry.counts) + ENTRY_OVERHEAD
+    
+    def digest(self, key):
+        """
+        Empreinte de 64 bits d'une clé, identique dans tous les processus (contrairement à hash())
+        """
+        pattern, mask = key
+        text = f"{self.fingerprint}|{pattern}|{mask}".encode("ascii")
+        return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), "little")
+    
+    def summary(self):
+        """
+        Résume l'état du cache
+        
+        Returns:
+            dict: compteurs, taux de succès, nombre d'entrées et mémoire estimée (octets)
+        """
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["shared_hits"]
+        hits = self.stats["hits"] + self.stats["shared_hits"]
+        return dict(self.stats, entries=len(self.entries), bytes=self.bytes, max_bytes=self.max_bytes,
+                    hit_rate=hits / lookups if lookups else 0.0)
+
+def play_states(cache, word, rng):
+    """
+    Parcourt les états d'une partie où la lettre proposée est toujours la plus fréquente
+    parmi les candidats (le joueur « meilleur coup » du banc d'essai)
+    
+    Yields:
+        tuple: (motif, lettres fausses) de chaque état
+    """
+    guessed, wrong = set(), ""
+    while len(wrong) < 10 and not all(letter in guessed for letter in word):
+        pattern = masked_pattern(word, guessed)
+        yield pattern, wrong
+        letter = cache.best_letter(pattern, wrong)
+        if letter is None:
+            letter = next(letter for letter in ALPHABET if letter not in guessed)
+        guessed.add(letter)
+        if letter not in word:
+            wrong += letter
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du cache
+    """
+    parser = argparse.ArgumentParser(description="Cache des mots candidats de Pendu Deluxe")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    bench_parser = commands.add_parser("bench", help="compare le filtrage direct et le cache")
+    bench_parser.add_argument("--games", type=int, default=20000)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--max-kb", type=int, default=DEFAULT_MAX_BYTES // 1024,
+                              help="budget mémoire du cache en Kio")
+    
+    match_parser = commands.add_parser("match", help="mots compatibles avec un motif")
+    match_parser.add_argument("pattern")
+    match_parser.add_argument("--wrong", default="", help="lettres fausses")
+    
+    options = parser.parse_args(argv)
+    
+    if options.command == "bench":
+        pool = [word for word in dict.fromkeys(all_words()) if is_playable(word)]
+        cache = CandidateCache(pool, max_bytes=options.max_kb * 1024)
+        rng = random.Random(options.seed)
+        words = [rng.choice(pool) for _ in range(options.games)]
+        
+        # === RELEVÉ DES ÉTATS, PUIS MÊMES ÉTATS FILTRÉS DIRECTEMENT ET AVEC LE CACHE ===
+        states = [(pattern, wrong_mask(wrong), wrong) for word in words
+                  for pattern, wrong in play_states(cache, word, rng)]
+        start = time.perf_counter()
+        for pattern, mask, _ in states:
+            cache.filter(pattern, mask)
+        direct = time.perf_counter() - start
+        
+        cache = CandidateCache(pool, max_bytes=options.max_kb * 1024)
+        start = time.perf_counter()
+        for pattern, _, wrong in states:
+            cache.lookup(pattern, wrong)
+        cached = time.perf_counter() - start
+        
+        summary = cache.summary()
+        print(f"{options.games} parties, {len(states)} états ({len(cache)} mots)")
+        print(f"Filtrage direct: {direct:.2f} s ({direct / len(states) * 1e6:.0f} µs par état)")
+        print(f"Avec le cache:   {cached:.2f} s ({cached / len(states) * 1e6:.0f} µs par état), "
+              f"{direct / cached:.1f}x plus rapide")
+        print(f"Succès: {summary['hit_rate']:.1%} | entrées: {summary['entries']} | "
+              f"retirées: {summary['evictions']} | mémoire: {summary['bytes'] / 1024:.0f} / "
+              f"{summary['max_bytes'] / 1024:.0f} Kio")
+    
+    elif options.command == "match":
+        cache = CandidateCache()
+        pattern, wrong = options.pattern.upper(), options.wrong.upper()
+        ids, counts = cache.lookup(pattern, wrong)
+        for word_id in ids:
+            print(cache.word(word_id))
+        ranking = sorted((count, letter) for letter, count in zip(ALPHABET, counts)
+                         if count and letter not in pattern)
+        print(f"{len(ids)} mot(s) | lettres: " + " ".join(f"{letter}={count}" for count, letter in reversed(ranking)))
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Capture des frames de Pendu Deluxe (clips vidéo et tests de non-régression visuelle)
+Les pixels de l'écran sont lus directement dans la mémoire de la surface
+(Surface.get_view, sans passer par une image intermédiaire) et copiés d'un bloc dans
+un tampon circulaire de taille fixe. Un fil d'écriture vide ce tampon vers un flux RGB
+brut ou une suite d'images PNG. Si l'écriture prend du retard, les nouvelles frames
+sont abandonnées (et comptées) : la boucle de jeu n'attend jamais le disque.
+
+En avance rapide (sans fenêtre ni limite de FPS), un joueur automatique enchaîne les
+parties et l'export va plus vite que le temps réel. Avec la même graine, deux exports
+sont identiques octet pour octet.
+
+Usage:
+    python capture.py clip.rgb --frames 600             # Flux RGB brut (1000x700, 60 FPS)
+    python capture.py images/ --format png --frames 300 --seed 7
+    python hangman.py --capture clip.rgb                # Enregistre une vraie partie
+
+Conversion du flux brut en vidéo :
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 1000x700 -r 60 -i clip.rgb clip.mp4
+"""
+import os       # Module pour configurer SDL et créer le dossier des images
+import sys      # Module système pour l'ordre des octets et la sortie
+import time     # Module pour mesurer la vitesse d'export
+import queue    # Files des cases libres et pleines du tampon circulaire
+import random   # Module pour rendre l'export reproductible
+import argparse # Module pour lire les options de la ligne de commande
+import threading  # Fil d'écriture en arrière-plan
+
+import numpy as np  # Copie et conversion des pixels
+
+CAPTURE_FORMATS = ["raw", "png"]
+DEFAULT_SLOTS = 8  # Frames en attente d'écriture au maximum
+
+class FrameCapture:
+    """
+    Capture des frames d'une surface vers un fichier, écrites par un fil d'arrière-plan
+    """
+    
+    def __init__(self, surface, path, format="raw", slots=DEFAULT_SLOTS):
+        """
+        Args:
+            surface: surface capturée à chaque appel de capture() (l'écran en général)
+            path: fichier du flux brut, ou dossier des images PNG
+            format: 'raw' (RGB 24 bits, frames à la suite) ou 'png' (une image par frame)
+            slots: taille du tampon circulaire en frames
+        
+        Raises:
+            ValueError: si le format est inconnu ou si la surface n'est pas en 32 bits
+            OSError: si le fichier ou le dossier ne peut pas être créé
+        """
+        import pygame  # Seulement pour l'enregistrement PNG et la lecture de la surface
+        self.pygame = pygame
+        
+        if format not in CAPTURE_FORMATS:
+            raise ValueError(f"format de capture inconnu: {format}")
+        if surface.get_bytesize() != 4:
+            raise ValueError("la capture demande une surface 32 bits")
+        self.surface = surface
+        self.format = format
+        self.path = path
+        self.width, self.height = surface.get_size()
+        
+        # Octet de chaque canal dans un pixel 32 bits (selon le format de la surface)
+        def channel_byte(shift):
+            return shift // 8 if sys.byteorder == "little" else 3 - shift // 8
+        self.channels = [channel_byte(shift) for shift in surface.get_shifts()[:3]]
+        
+        # === TAMPON CIRCULAIRE ===
+        # Cases allouées une fois pour toutes ; les files ne transportent que des numéros
+        self.slots = np.empty((slots, self.height, self.width), dtype=np.uint32)
+        self.free = queue.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+        self.filled = queue.Queue()
+        self.stats = {"captured": 0, "dropped": 0, "written": 0}
+        
+        # === DESTINATION ===
+        if format == "raw":
+            self.stream = open(path, "wb")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.stream = None
+        self.error = None  # Erreur du fil d'écriture, relancée par close()
+        self.writer = threading.Thread(target=self.write_frames, name="frame-writer", daemon=True)
+        self.writer.start()
+    
+    def capture(self, wait=False):
+        """
+        Copie la frame actuelle de la surface dans le tampon
+        
+        Args:
+            wait: attend une case libre au lieu d'abandonner la frame (export hors temps
+                réel, où chaque frame compte plus que la cadence)
+        
+        Returns:
+            bool: True si la frame a été gardée, False si le tampon était plein (frame abandonnée)
+        """
+        try:
+            slot = self.free.get(block=wait)
+        except queue.Empty:
+            self.stats["dropped"] += 1
+            return False
+        
+        # Vue directe sur les pixels (la surface est verrouillée tant que la vue existe)
+        view = self.surface.get_view("2")
+        np.copyto(self.slots[slot], np.asarray(view).T)
+        del view
+        self.filled.put((slot, self.stats["captured"]))
+        self.stats["captured"] += 1
+        return True
+    
+    def write_frames(self):
+        """
+        Boucle du fil d'écriture : convertit les frames en RGB et les écrit dans l'ordre
+        """
+        pygame = self.pygame
+        rgb = np.empty((self.height, self.width, 3), dtype=np.uint8)  # Frame convertie, réutilisée
+        while True:
+            item = self.filled.get()
+            if item is None:
+                return
+            slot, number = item
+            # Conversion 32 bits -> RGB, puis la case est rendue tout de suite au jeu
+            # (un canal à la fois : bien plus rapide qu'une indexation sur le dernier axe)
+            pixels = self.slots[slot].view(np.uint8).reshape(self.height, self.width, 4)
+            for channel, byte in enumerate(self.channels):
+                np.copyto(rgb[..., channel], pixels[..., byte])
+            self.free.put(slot)
+            if self.error is not None:
+                continue  # Écriture impossible : les frames restantes sont seulement libérées
+            try:
+                if self.stream is not None:
+                    self.stream.write(rgb.data)
+                else:
+                    image = pygame.image.frombuffer(rgb.data, (self.width, self.height), "RGB")
+                    pygame.image.save(image, os.path.join(self.path, f"frame_{number:06d}.png"))
+                self.stats["written"] += 1
+            except (OSError, pygame.error) as e:
+                self.error = e
+    
+    def close(self):
+        """
+        Attend l'écriture des frames en attente et ferme le fichier
+        
+        Returns:
+            dict: compteurs (frames capturées, abandonnées, écrites)
+        
+        Raises:
+            OSError, pygame.error: si l'écriture a échoué
+        """
+        self.filled.put(None)
+        self.writer.join()
+        if self.stream is not None:
+            self.stream.close()
+        if self.error is not None:
+            raise self.error
+        return self.stats
+
+def fast_forward(game, renderer, capture, frames, strategy, seed=0, every=20, pause=120):
+    """
+    Fait jouer le jeu sans limite de FPS et capture chaque frame
+    Hors temps réel, la boucle attend le fil d'écriture plutôt que d'abandonner des frames
+    
+    Args:
+        game: HangmanDeluxe
+        renderer: moteur de rendu logiciel qui dessine sur la surface capturée
+        capture: FrameCapture
+        frames: nombre de frames à produire
+        strategy: joueur automatique (voir strategies.py)
+        seed: graine de la suite de mots
+        every: frames entre deux coups du joueur
+        pause: frames affichées après la fin d'une partie
+    
+    Returns:
+        int: nombre de parties jouées
+    """
+    from dictionary import WORD_CATEGORIES
+    from rules import is_playable, is_solved, masked_pattern
+    from strategies import HINT, GameView
+    
+    words = random.Random(seed)
+    categories = sorted(WORD_CATEGORIES)
+    
+    def next_game():
+        category = words.choice(categories)
+        word = words.choice([word for word in WORD_CATEGORIES[category] if is_playable(word)])
+        game.start_game(word, category)
+        strategy.new_game(len(word))
+    
+    next_game()
+    games, over_since = 1, None
+    for frame in range(frames):
+        if game.game_over:
+            over_since = frame if over_since is None else over_since
+            if frame - over_since >= pause:
+                next_game()
+                games, over_since = games + 1, None
+        elif frame % every == every - 1:
+            # === COUP DU JOUEUR AUTOMATIQUE ===
+            view = GameView(masked_pattern(game.word_to_guess, game.guessed_letters),
+                            frozenset(game.wrong_letters), game.max_penalties - game.penalties,
+                            not is_solved(game.word_to_guess, game.guessed_letters))
+            decision = strategy.choose(view)
+            if decision == HINT:
+                game.give_hint()
+            else:
+                game.guess_letter(decision)
+        
+        game.update()
+        game.render(renderer)
+        capture.capture(wait=True)
+    return games
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande : export en avance rapide sans fenêtre
+    """
+    parser = argparse.ArgumentParser(description="Export de frames de Pendu Deluxe")
+    parser.add_argument("output", help="fichier du flux RGB brut, ou dossier des images PNG")
+    parser.add_argument("--format", choices=CAPTURE_FORMATS, default="raw")
+    parser.add_argument("--frames", type=int, default=600, help="frames à exporter")
+    parser.add_argument("--seed", type=int, default=0, help="graine (mots, effets, indices)")
+    parser.add_argument("--strategy", default="frequency", help="joueur automatique (voir strategies.py)")
+    parser.add_argument("--quality", default="high", help="niveau de qualité des effets")
+    parser.add_argument("--every", type=int, default=20, help="frames entre deux coups")
+    parser.add_argument("--slots", type=int, default=DEFAULT_SLOTS, help="taille du tampon en frames")
+    options = parser.parse_args(argv)
+    
+    # === MODE SANS FENÊTRE ===
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import io, contextlib
+    import pygame
+    import hangman
+    from renderer import SoftwareRenderer
+    from strategies import STRATEGIES
+    
+    if options.strategy not in STRATEGIES:
+        parser.error(f"stratégie inconnue: {options.strategy}")
+    if options.quality not in hangman.QUALITY_PRESETS:
+        parser.error(f"niveau de qualité inconnu: {options.quality}")
+    
+    random.seed(options.seed)
+    hangman.bootstrap()
+    screen = pygame.display.set_mode((hangman.WINDOW_WIDTH, hangman.WINDOW_HEIGHT))
+    with contextlib.redirect_stdout(io.StringIO()):  # Messages du jeu à chaque coup
+        game = hangman.HangmanDeluxe(options.quality)
+        game.sound_enabled = False
+        strategy = STRATEGIES[options.strategy](rng=random.Random(options.seed))
+    try:
+        capture = FrameCapture(screen, options.output, options.format, options.slots)
+    except (OSError, ValueError) as e:
+        print(f"Capture impossible: {e}")
+        return 1
+    
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        games = fast_forward(game, SoftwareRenderer(screen), capture, options.frames,
+                             strategy, options.seed, options.every)
+    try:
+        stats = capture.close()
+    except (OSError, pygame.error) as e:
+        print(f"Écriture impossible: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    
+    fps = options.frames / elapsed
+    print(f"{stats['written']} frames écrites dans {options.output} ({games} parties) en {elapsed:.2f} s : "
+          f"{fps:.0f} FPS, {fps / hangman.FPS:.1f}x le temps réel")
+    print(f"{stats['dropped']} frames abandonnées (tampon de {options.slots} frames plein)")
+    if options.format == "raw":
+        print(f"Vidéo : ffmpeg -f rawvideo -pix_fmt rgb24 -s {capture.width}x{capture.height} "
+              f"-r {hangman.FPS} -i {options.output} clip.mp4")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""
+Base de mots français de Pendu Deluxe
+Module sans dépendance à pygame : les outils (solveur, simulations, imports de
+dictionnaires) peuvent l'utiliser sans démarrer le jeu
+"""
+import os       # Module pour les chemins de fichiers
+import json     # Module pour le cache du dictionnaire
+
+# Cache des données calculées à partir des mots (difficulté mesurée...)
+DICTIONARY_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionary_cache.json")
+
+# === DICTIONNAIRE COMPILÉ ===
+# Fichier produit par importer.py, lisible ligne à ligne sans tout charger :
+#   PDDICT1          (en-tête)
+#   @ANIMAUX         (début d'une catégorie)
+#   ELEPHANT         (un mot par ligne, lettres A-Z uniquement)
+COMPILED_MAGIC = b"PDDICT1\n"
+CATEGORY_MARKER = b"@"
+
+# === MOTS PAR CATÉGORIES ===
+# Dictionnaire avec des catégories thématiques
+WORD_CATEGORIES = {
+    "ANIMAUX": [
+        "ELEPHANT", "GIRAFE", "KANGOUROU", "CROCODILE", "PAPILLON", "RHINOCEROS",
+        "LEOPARD", "HIPPOPOTAME", "CHIMPANZE", "GORILLE", "ANTILOPE", "GAZELLE",
+        "CHAMEAU", "DROMADAIRE", "ZEBRE", "AUTRUCHE", "FLAMANT", "PELICAN",
+        "MANCHOT", "PINGOUIN", "PHOQUE", "BALEINE", "DAUPHIN", "REQUIN",
+        "PIEUVRE", "MEDUSE", "HOMARD", "CRABE", "TORTUE", "SERPENT",
+        "LEZARD", "GRENOUILLE", "SALAMANDRE", "LIBELLULE", "COCCINELLE",
+        "ESCARGOT", "ARAIGNEE", "FOURMI", "ABEILLE", "GUEPE", "MOUCHE",
+        "MOUSTIQUE", "CHENILLE", "SCARABEE", "SAUTERELLE"
+    ],
+    "PAYS": [
+        "FRANCE", "ESPAGNE", "ITALIE", "ALLEMAGNE", "PORTUGAL", "GRECE",
+        "NORVEGE", "SUEDE", "DANEMARK", "FINLANDE", "ISLANDE", "IRLANDE",
+        "ECOSSE", "ANGLETERRE", "BELGIQUE", "SUISSE", "AUTRICHE",
+        "POLOGNE", "HONGRIE", "ROUMANIE", "BULGARIE", "CROATIE",
+        "JAPON", "CHINE", "COREE", "THAILANDE", "VIETNAM", "CAMBODGE",
+        "INDE", "PAKISTAN", "BANGLADESH", "NEPAL", "BHOUTAN",
+        "AUSTRALIE", "FIDJI", "VANUATU", "SAMOA", "TONGA",
+        "CANADA", "MEXIQUE", "GUATEMALA", "COSTA-RICA", "PANAMA",
+        "BRESIL", "ARGENTINE", "CHILI", "PEROU", "COLOMBIE", "VENEZUELA",
+        "EGYPTE", "MAROC", "ALGERIE", "TUNISIE", "LIBYE", "SOUDAN",
+        "KENYA", "TANZANIE", "OUGANDA", "RWANDA", "ETHIOPIE", "GHANA",
+        "RUSSIE", "UKRAINE", "BELARUS", "LITUANIE", "LETTONIE", "ESTONIE"
+    ],
+    "NOURRITURE": [
+        "BAGUETTE", "CROISSANT", "BRIOCHE", "PAIN", "FROMAGE", "CAMEMBERT",
+        "ROQUEFORT", "GRUYERE", "EMMENTAL", "BRIE", "CHEVRE", "YAOURT",
+        "CREPE", "GAUFFRE", "MACARON", "ECLAIR", "PROFITEROLE", "MADELEINE",
+        "RATATOUILLE", "BOUILLABAISSE", "CASSOULET", "COUSCOUS", "PAELLA",
+        "PIZZA", "LASAGNE", "SPAGHETTI", "RAVIOLI", "GNOCCHI", "RISOTTO",
+        "SUSHI", "SASHIMI", "TEMPURA", "RAMEN", "YAKITORI", "MISO",
+        "HAMBURGER", "SANDWICH", "SALADE", "SOUPE", "POTAGE", "VELOUTE",
+        "POMME", "POIRE", "BANANE", "ORANGE", "CITRON", "PAMPLEMOUSSE",
+        "FRAISE", "FRAMBOISE", "MYRTILLE", "CASSIS", "GROSEILLE", "CERISE",
+        "PECHE", "ABRICOT", "PRUNE", "RAISIN", "MELON", "PASTEQUE",
+        "ANANAS", "MANGUE", "KIWI", "PASSION", "LITCHI", "PAPAYE",
+        "CHOCOLAT", "BONBON", "CARAMEL", "NOUGAT", "PRALINE", "TRUFFE"
+    ],
+    "METIERS": [
+        "MEDECIN", "INFIRMIERE", "CHIRURGIEN", "DENTISTE", "PHARMACIEN",
+        "VETERINAIRE", "PROFESSEUR", "INSTITUTEUR", "DIRECTEUR", "SECRETAIRE",
+        "AVOCAT", "JUGE", "NOTAIRE", "HUISSIER", "COMMISSAIRE", "POLICIER",
+        "POMPIER", "AMBULANCIER", "PILOTE", "STEWARD", "CAPITAINE", "MARIN",
+        "CUISINIER", "SERVEUR", "BARMAN", "PATISSIER", "BOULANGER", "BOUCHER",
+        "POISSONNIER", "EPICIER", "CAISSIER", "VENDEUR", "COMMERCIAL", "BANQUIER",
+        "COMPTABLE", "ECONOMISTE", "INGENIEUR", "ARCHITECTE", "DESIGNER", "ARTISTE",
+        "PEINTRE", "SCULPTEUR", "MUSICIEN", "CHANTEUR", "DANSEUR", "ACTEUR",
+        "JOURNALISTE", "PHOTOGRAPHE", "CAMERAMAN", "MONTEUR", "REALISATEUR",
+        "ELECTRICIEN", "PLOMBIER", "MENUISIER", "MAÇON", "COUVREUR", "JARDINIER"
+    ],
+    "OBJETS": [
+        "ORDINATEUR", "TELEPHONE", "TABLETTE", "CLAVIER", "SOURIS", "ECRAN",
+        "IMPRIMANTE", "SCANNER", "APPAREIL-PHOTO", "CAMERA", "TELEVISION",
+        "REFRIGERATEUR", "LAVE-LINGE", "LAVE-VAISSELLE", "ASPIRATEUR", "MICRO-ONDE",
+        "VOITURE", "BICYCLETTE", "MOTOCYCLETTE", "AUTOBUS", "TRAMWAY", "METRO",
+        "AVION", "HELICOPTERE", "BATEAU", "YACHT", "SOUS-MARIN", "FUSEE",
+        "MONTRE", "COLLIER", "BRACELET", "BAGUE", "BOUCLES-OREILLES", "LUNETTES",
+        "PARAPLUIE", "SAC", "VALISE", "PORTEFEUILLE", "CLES", "TELEPHONE",
+        "LIVRE", "MAGAZINE", "JOURNAL", "CAHIER", "STYLO", "CRAYON",
+        "GOMME", "REGLE", "CALCULATRICE", "DICTIONNAIRE", "ATLAS", "CARTE",
+        "CHAISE", "TABLE", "ARMOIRE", "COMMODE", "ETAGERE", "BIBLIOTHEQUE",
+        "LAMPE", "MIROIR", "RIDEAU", "TAPIS", "COUSSIN", "COUVERTURE"
+    ],
+    "SPORTS": [
+        "FOOTBALL", "BASKETBALL", "VOLLEYBALL", "HANDBALL", "RUGBY", "TENNIS",
+        "BADMINTON", "PING-PONG", "SQUASH", "GOLF", "BASEBALL", "CRICKET",
+        "NATATION", "PLONGEE", "SURF", "VOILE", "AVIRON", "CANOE",
+        "CYCLISME", "COURSE", "MARATHON", "TRIATHLON", "ATHLETISME", "SAUT",
+        "LANCER", "MUSCULATION", "BOXE", "KARATE", "JUDO", "TAEKWONDO",
+        "ESCRIME", "ARCHERIE", "TIR", "EQUITATION", "POLO", "DRESSAGE",
+        "SKI", "SNOWBOARD", "PATINAGE", "HOCKEY", "LUGE", "BOBSLEIGH",
+        "ESCALADE", "ALPINISME", "RANDONNEE", "CAMPING", "PECHE", "CHASSE",
+        "PARAPENTE", "DELTAPLANE", "PARACHUTISME", "BUNGEE", "RAFTING"
+    ],
+    "SCIENCE": [
+        "PHYSIQUE", "CHIMIE", "BIOLOGIE", "MATHEMATIQUES", "ASTRONOMIE",
+        "GEOLOGIE", "METEOROLOGIE", "OCEANOGRAPHIE", "BOTANIQUE", "ZOOLOGIE",
+        "ANATOMIE", "PHYSIOLOGIE", "GENETIQUE", "EVOLUTION", "ECOLOGIE",
+        "MOLECULE", "ATOME", "ELECTRON", "PROTON", "NEUTRON", "PHOTON",
+        "TELESCOPE", "MICROSCOPE", "LABORATOIRE", "EXPERIENCE", "HYPOTHESE",
+        "PLANETE", "ETOILE", "GALAXIE", "COMETE", "ASTEROIDE", "METEORITE",
+        "VOLCAN", "SEISME", "TSUNAMI", "OURAGAN", "TORNADE", "CYCLONE"
+    ],
+    "MUSIQUE": [
+        "PIANO", "GUITARE", "VIOLON", "VIOLONCELLE", "CONTREBASSE", "HARPE",
+        "FLUTE", "CLARINETTE", "SAXOPHONE", "TROMPETTE", "TROMBONE", "TUBA",
+        "BATTERIE", "TAMBOUR", "CYMBALE", "TRIANGLE", "XYLOPHONE", "ACCORDEON",
+        "HARMONICA", "BANJO", "MANDOLINE", "UKULELE", "SYNTHESISEUR", "ORGUE",
+        "CONCERT", "ORCHESTRA", "SYMPHONIE", "OPERA", "CHORALE", "MELODIE",
+        "RYTHME", "HARMONIE", "PARTITION", "PORTEE", "CLEF", "NOTE"
+    ]
+}
+
+# === MOTS PAR NIVEAU DE DIFFICULTÉ ===
+# Séparation par difficulté croissante pour adapter le défi
+DIFFICULTY_WORDS = {
+    "FACILE": [
+        "CHAT", "CHIEN", "MAISON", "VOITURE", "PAIN", "EAU", "FEU", "SOLEIL",
+        "LUNE", "ETOILE", "FLEUR", "ARBRE", "OISEAU", "POISSON", "LIVRE",
+        "TABLE", "CHAISE", "LIT", "PORTE", "FENETRE", "ROUGE", "BLEU",
+        "VERT", "JAUNE", "NOIR", "BLANC", "GRAND", "PETIT", "JOUR", "NUIT",
+        "MAIN", "PIED", "TETE", "COEUR", "YEUX", "NEZ", "BOUCHE", "OREILLE",
+        "BRAS", "JAMBE", "DOS", "VENTRE", "CHEVEUX", "DENT", "ONGLE"
+    ],
+    "MOYEN": [
+        "ORDINATEUR", "TELEPHONE", "REFRIGERATEUR", "TELEVISION", "PHARMACIE",
+        "RESTAURANT", "UNIVERSITE", "BIBLIOTHEQUE", "HOPITAL", "AEROPORT",
+        "PARAPLUIE", "CHOCOLAT", "SANDWICH", "PROGRAMME", "ALPHABET",
+        "DICTIONNAIRE", "PROBLEME", "SOLUTION", "QUESTION", "REPONSE",
+        "MONTAGNE", "RIVIERE", "OCEAN", "DESERT", "FORET", "PRAIRIE",
+        "VILLAGE", "QUARTIER", "AVENUE", "BOULEVARD", "CARREFOUR", "PARKING"
+    ],
+    "DIFFICILE": [
+        "EXTRATERRESTRE", "HIPPOPOTAME", "CHRYSANTHEME", "PSYCHOLOGIE",
+        "PHILOSOPHIE", "ARCHITECTURE", "PHOTOGRAPHIE", "GEOGRAPHIE",
+        "ORTHOGRAPHE", "SYNONYME", "ACRONYME", "PALINDROME", "ANAGRAMME",
+        "ONOMATOPEE", "METAPHORE", "ALLEGORIE", "OXYMORON", "EUPHEMISME",
+        "CACOPHONIE", "POLYPHONIE", "XENOPHOBIE", "CLAUSTROPHOBIE",
+        "AGORAPHOBIE", "PHILANTHROPE", "MISANTHROPE", "HYPERBOLE"
+    ]
+}
+
+def all_words():
+    """
+    Retourne tous les mots de la base, sans doublons, dans un ordre stable
+    (un même mot peut apparaître dans une catégorie et dans un niveau de difficulté)
+    
+    Returns:
+        list: mots en majuscules
+    """
+    words = {}
+    for group in (WORD_CATEGORIES, DIFFICULTY_WORDS):
+        for word_list in group.values():
+            for word in word_list:
+                words.setdefault(word, None)  # dict : dédoublonne en gardant l'ordre
+    return list(words)
+
+def load_dictionary_cache(path=DICTIONARY_CACHE_PATH):
+    """
+    Charge le cache du dictionnaire (une section par outil, ex: "difficulty")
+    
+    Args:
+        path: chemin du fichier JSON
+    
+    Returns:
+        dict: contenu du cache (vide si le fichier est absent ou illisible)
+    """
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_dictionary_cache(cache, path=DICTIONARY_CACHE_PATH):
+    """
+    Enregistre le cache du dictionnaire
+    Écrit dans un fichier temporaire puis le renomme : pas de cache à moitié écrit
+    
+    Args:
+        cache: contenu du cache
+        path: chemin du fichier JSON
+    """
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(temporary_path, path)
+
+class CompiledDictionaryWriter:
+    """
+    Écriture en continu d'un dictionnaire compilé (un mot à la fois, mémoire constante)
+    S'utilise avec with : le fichier est fermé à la sortie du bloc
+    """
+    
+    def __init__(self, path, append=False):
+        """
+        Args:
+            path: chemin du dictionnaire compilé
+            append: ajoute à la fin d'un dictionnaire existant au lieu de le remplacer
+        
+        Raises:
+            ValueError: si le fichier existant n'est pas un dictionnaire compilé
+        """
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as f:
+                if f.readline() != COMPILED_MAGIC:
+                    raise ValueError(f"{path} n'est pas un dictionnaire compilé")
+        self.file = open(path, "ab" if exists else "wb")
+        if not exists:
+            self.file.write(COMPILED_MAGIC)
+    
+    def begin_category(self, name):
+        """
+        Commence une catégorie : les mots suivants lui appartiennent
+        """
+        self.file.write(CATEGORY_MARKER + name.encode("ascii") + b"\n")
+    
+    def add(self, word):
+        """
+        Ajoute un mot (lettres A-Z uniquement) à la catégorie en cours
+        """
+        self.file.write(word.encode("ascii") + b"\n")
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def iter_compiled_dictionary(path):
+    """
+    Parcourt un dictionnaire compilé sans le charger entièrement
+    
+    Args:
+        path: chemin du dictionnaire compilé
+    
+    Yields:
+        tuple: (catégorie, mot)
+    
+    Raises:
+        ValueError: si le fichier n'est pas un dictionnaire compilé
+    """
+    with open(path, "rb") as f:
+        if f.readline() != COMPILED_MAGIC:
+            raise ValueError(f"{path} n'est pas un dictionnaire compilé")
+        category = None
+        for line in f:
+            line = line.rstrip(b"\n")
+            if line.startswith(CATEGORY_MARKER):
+                category = line[1:].decode("ascii")
+            elif line:
+                yield category, line.decode("ascii")
+
+def load_compiled_dictionary(path):
+    """
+    Charge un dictionnaire compilé sous la forme utilisée par le jeu
+    
+    Args:
+        path: chemin du dictionnaire compilé
+    
+    Returns:
+        dict: catégorie -> liste de mots
+    """
+    categories = {}
+    for category, word in iter_compiled_dictionary(path):
+        categories.setdefault(category, []).append(word)
+    return categories
@@ -0,0 +1,358 @@
+"""
+Difficulté mesurée des mots de Pendu Deluxe
+Chaque mot reçoit un score : le nombre d'erreurs commises par un joueur « fréquence »
+qui connaît tous les mots de même longueur et propose à chaque coup la lettre présente
+dans le plus grand nombre de mots encore compatibles avec le motif affiché.
+Un mot aux lettres rares ou au motif ambigu (ex: _ARTE pour CARTE, PARTE, TARTE...)
+coûte plus d'erreurs qu'un mot facile à isoler.
+La partie décimale du score départage les mots à nombre d'erreurs égal : elle croît
+avec le risque d'erreur couru en chemin (somme des probabilités d'erreur de chaque coup).
+
+Le joueur étant déterministe, ses parties forment un arbre de décision par longueur
+de mot : l'arbre est parcouru une seule fois (chaque mot descend jusqu'à sa feuille),
+en découpant les sous-arbres entre plusieurs processus. Les scores sont enregistrés
+dans le cache du dictionnaire, groupe de longueur par groupe de longueur : l'ajout
+d'un mot ne fait recalculer que les mots de sa longueur.
+
+Le jeu calcule les scores d'un dictionnaire importé dans un processus à part
+(DifficultyProcess) et garde les niveaux fixés à la main en attendant ; lancer ce
+module avant de jouer prépare le cache sur tous les cœurs.
+
+Usage:
+    python difficulty.py                        # Met à jour les scores de la base du jeu
+    python difficulty.py --words mots.txt -j 8  # Scores d'une liste de mots (un par ligne)
+"""
+import os       # Module pour compter les cœurs du processeur
+import sys      # Module système pour la sortie
+import time     # Module pour mesurer la durée du calcul
+import hashlib  # Module pour l'empreinte des groupes de mots
+import argparse # Module pour lire les options de la ligne de commande
+import multiprocessing  # Calcul en arrière-plan pour le jeu
+from array import array  # Indices des mots renvoyés par le processus de calcul
+from concurrent.futures import ProcessPoolExecutor  # Calcul sur plusieurs cœurs
+
+from dictionary import (all_words, load_dictionary_cache, save_dictionary_cache,
+                        DICTIONARY_CACHE_PATH)
+from rules import is_playable, letter_mask
+
+CACHE_SECTION = "difficulty"  # Section du cache du dictionnaire
+CACHE_VERSION = 2             # À incrémenter si la mesure change
+CACHE_MAX_WORDS = 1000000     # Scores gardés au plus (groupes des autres dictionnaires compris)
+DIFFICULTY_BANDS = ["FACILE", "MOYEN", "DIFFICILE"]  # Bandes de difficulté mesurée
+TASKS_PER_PROCESS = 4         # Sous-arbres par processus (équilibrage de la charge)
+
+def group_fingerprint(words):
+    """
+    Calcule l'empreinte d'un groupe de mots (indépendante de l'ordre)
+    """
+    return hashlib.sha1("\n".join(sorted(words)).encode("utf-8")).hexdigest()
+
+def split_node(candidates, guessed, errors, risk):
+    """
+    Joue le coup du joueur « fréquence » dans un nœud de l'arbre
+    
+    Args:
+        candidates: mots compatibles avec le motif affiché
+        guessed: lettres déjà proposées (frozenset)
+        errors: erreurs commises pour arriver à ce nœud
+        risk: somme des probabilités d'erreur des coups joués pour arriver à ce nœud
+    
+    Returns:
+        list: nœuds enfants (candidats, lettres proposées, erreurs, risque), un par
+        motif de révélation ; vide si le nœud est une feuille (mot isolé)
+    """
+    if len(candidates) <= 1:
+        return []
+    
+    # === LETTRE PRÉSENTE DANS LE PLUS DE MOTS ===
+    counts = {}
+    for word in candidates:
+        for letter in set(word).difference(guessed):
+            counts[letter] = counts.get(letter, 0) + 1
+    if not counts:
+        return []  # Candidats identiques : mot entièrement découvert
+    letter = min(counts, key=lambda candidate: (-counts[candidate], candidate))
+    
+    # === ENFANTS : UN PAR MOTIF DE RÉVÉLATION ===
+    children = {}
+    for word in candidates:
+        children.setdefault(letter_mask(word, letter), []).append(word)
+    guessed = guessed | {letter}
+    risk += 1 - counts[letter] / len(candidates)  # Probabilité que la lettre soit absente
+    return [(words, guessed, errors + (mask == 0), risk) for mask, words in children.items()]
+
+def score_subtree(node):
+    """
+    Parcourt un sous-arbre de décision et retourne le score de chaque mot
+    
+    Args:
+        node: (candidats, lettres proposées, erreurs, risque)
+    
+    Returns:
+        dict: mot -> score de difficulté
+    """
+    scores = {}
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        children = split_node(*node)
+        if children:
+            pending.extend(children)
+        else:
+            # Feuille : le joueur ne propose plus que des lettres du mot, sans erreur
+            candidates, _, errors, risk = node
+            score = round(errors + risk / (1 + risk), 3)  # Décimale < 1 : départage seulement
+            for word in candidates:
+                scores[word] = score
+    return scores
+
+def score_words(words, processes=1):
+    """
+    Calcule le score de difficulté de chaque mot
+    
+    Args:
+        words: mots jouables (A-Z uniquement)
+        processes: nombre de processus de calcul
+    
+    Returns:
+        dict: mot -> score de difficulté
+    """
+    groups = {}
+    for word in words:
+        groups.setdefault(len(word), []).append(word)
+    nodes = [(group, frozenset(), 0, 0.0) for group in groups.values()]
+    
+    if processes <= 1:
+        scores = {}
+        for node in nodes:
+            scores.update(score_subtree(node))
+        return scores
+    
+    # === DÉCOUPAGE EN SOUS-ARBRES ===
+    # Les plus gros nœuds sont développés ici jusqu'à avoir assez de tâches pour
+    # occuper tous les processus
+    scores = {}
+    while nodes and len(nodes) < processes * TASKS_PER_PROCESS:
+        nodes.sort(key=lambda node: len(node[0]))
+        largest = nodes.pop()
+        children = split_node(*largest)
+        if not children:
+            scores.update(score_subtree(largest))
+            continue
+        nodes.extend(children)
+        if len(largest[0]) < 1000:
+            break  # Arbre trop petit pour justifier des processus supplémentaires
+    
+    nodes.sort(key=lambda node: -len(node[0]))  # Gros sous-arbres en premier
+    with ProcessPoolExecutor(processes) as pool:
+        for subtree_scores in pool.map(score_subtree, nodes):
+            scores.update(subtree_scores)
+    return scores
+
+def update_difficulty(cache, words, processes=1, force=False):
+    """
+    Met à jour les scores de difficulté du cache du dictionnaire
+    Seuls les groupes de longueur dont la liste de mots a changé sont recalculés. Les
+    groupes sont rangés par empreinte : ceux d'un autre dictionnaire (base intégrée,
+    liste importée) restent dans le cache ; au-delà de CACHE_MAX_WORDS mots, les groupes
+    utilisés par les mises à jour les plus anciennes sont retirés
+    
+    Args:
+        cache: cache du dictionnaire (modifié sur place)
+        words: mots de la base
+        processes: nombre de processus de calcul
+        force: recalcule tous les groupes
+    
+    Returns:
+        tuple: (scores mot -> score de difficulté, nombre de mots recalculés)
+    """
+    section = cache.get(CACHE_SECTION)
+    if isinstance(section, dict) and section.get("version") == 1:
+        # Ancien format (un groupe par longueur) : mêmes scores, rangés par empreinte
+        section = {"version": CACHE_VERSION, "clock": 0,
+                   "groups": {group["fingerprint"]: {"scores": group["scores"], "used": 0}
+                              for group in section.get("groups", {}).values()}}
+    if not isinstance(section, dict) or section.get("version") != CACHE_VERSION or force:
+        section = {"version": CACHE_VERSION, "clock": 0, "groups": {}}
+    section["clock"] += 1  # Rang de cette mise à jour (groupes les plus anciens retirés d'abord)
+    
+    groups = {}
+    for word in dict.fromkeys(words):
+        if is_playable(word):
+            groups.setdefault(len(word), []).append(word)
+    
+    # === GROUPES INCHANGÉS / À RECALCULER ===
+    stale_words = []
+    fingerprints = {}
+    for length, group in groups.items():
+        fingerprints[length] = group_fingerprint(group)
+        if fingerprints[length] not in section["groups"]:
+            stale_words.extend(group)
+    
+    fresh_scores = score_words(stale_words, processes) if stale_words else {}
+    
+    scores = {}
+    for length, group in groups.items():
+        cached = section["groups"].get(fingerprints[length])
+        if cached is None:
+            cached = section["groups"][fingerprints[length]] = {
+                "scores": {word: fresh_scores[word] for word in group},
+            }
+        cached["used"] = section["clock"]
+        scores.update(cached["scores"])
+    
+    # === GROUPES DES AUTRES DICTIONNAIRES ===
+    # Gardés tant que le cache ne dépasse pas CACHE_MAX_WORDS (ceux en cours toujours)
+    total = sum(len(group["scores"]) for group in section["groups"].values())
+    for fingerprint, group in sorted(section["groups"].items(), key=lambda item: item[1]["used"]):
+        if total <= CACHE_MAX_WORDS or group["used"] == section["clock"]:
+            break
+        del section["groups"][fingerprint]
+        total -= len(group["scores"])
+    cache[CACHE_SECTION] = section
+    return scores, len(stale_words)
+
+def difficulty_bands(scores):
+    """
+    Répartit les mots en bandes de difficulté de tailles égales selon leur score
+    
+    Args:
+        scores: mot -> score de difficulté
+    
+    Returns:
+        dict: nom de bande (FACILE, MOYEN, DIFFICILE) -> liste de mots
+    """
+    ranked = sorted(scores, key=lambda word: (scores[word], word))
+    bands = {}
+    for i, band in enumerate(DIFFICULTY_BANDS):
+        start = len(ranked) * i // len(DIFFICULTY_BANDS)
+        end = len(ranked) * (i + 1) // len(DIFFICULTY_BANDS)
+        if end > start:
+            bands[band] = ranked[start:end]
+    return bands
+
+def load_difficulty_bands(words=None, path=DICTIONARY_CACHE_PATH):
+    """
+    Retourne les bandes de difficulté mesurée de la base de mots du jeu
+    Les scores manquants ou obsolètes sont recalculés (dans ce processus) et enregistrés
+    
+    Args:
+        words: mots de la base (par défaut toute la base de dictionary.py)
+        path: chemin du cache du dictionnaire
+    
+    Returns:
+        dict: nom de bande -> liste de mots
+    """
+    cache = load_dictionary_cache(path)
+    scores, recomputed = update_difficulty(cache, words or all_words())
+    if recomputed:
+        try:
+            save_dictionary_cache(cache, path)
+        except OSError as e:
+            print(f"Impossible d'enregistrer le cache du dictionnaire: {e}")
+    return difficulty_bands(scores)
+
+def send_difficulty_bands(words, path, connection):
+    """
+    Calcule les bandes de difficulté et les envoie sous forme d'indices dans words
+    (exécuté dans le processus de DifficultyProcess)
+    """
+    try:
+        bands = load_difficulty_bands(words, path)
+        positions = {}
+        for i, word in enumerate(words):
+            positions.setdefault(word, i)
+        connection.send({band: array("I", [positions[word] for word in band_words])
+                         for band, band_words in bands.items()})
+    finally:
+        connection.close()
+
+class DifficultyProcess:
+    """
+    Bandes de difficulté calculées dans un processus à part : le calcul des scores
+    d'un grand dictionnaire ne bloque pas le fil du jeu
+    """
+    
+    def __init__(self, words, path=DICTIONARY_CACHE_PATH):
+        """
+        Args:
+            words: mots de la base (liste : le résultat est relu par indices)
+            path: chemin du cache du dictionnaire (mis à jour par le processus)
+        """
+        self.words = words
+        # "spawn" : le processus ne partage ni les fils ni l'état SDL du jeu
+        context = multiprocessing.get_context("spawn")
+        self.receiver, sender = context.Pipe(duplex=False)
+        self.process = context.Process(target=send_difficulty_bands, args=(words, path, sender),
+                                       name="difficulty", daemon=True)
+        self.process.start()
+        sender.close()
+    
+    def poll(self):
+        """
+        Retourne les bandes si le calcul est terminé (sans attendre)
+        
+        Returns:
+            dict ou None: nom de bande -> liste de mots (None si pas encore prêtes ou
+                si le calcul a échoué)
+        """
+        if self.receiver is None or not self.receiver.poll():
+            return None
+        try:
+            indices = self.receiver.recv()
+        except EOFError:
+            indices = None  # Processus arrêté sans résultat
+        self.close()
+        if indices is None:
+            return None
+        return {band: [self.words[i] for i in band_indices] for band, band_indices in indices.items()}
+    
+    def close(self):
+        """
+        Abandonne le calcul s'il est en cours
+        """
+        if self.receiver is not None:
+            self.receiver.close()
+            self.receiver = None
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+def read_words(path):
+    """
+    Lit une liste de mots (un par ligne) et la met en majuscules
+    """
+    with open(path, encoding="utf-8") as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande : met à jour les scores de difficulté
+    """
+    parser = argparse.ArgumentParser(description="Difficulté mesurée des mots de Pendu Deluxe")
+    parser.add_argument("--words", help="fichier de mots, un par ligne (par défaut la base du jeu)")
+    parser.add_argument("--cache", default=DICTIONARY_CACHE_PATH, help="cache du dictionnaire")
+    parser.add_argument("-j", "--processes", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus de calcul")
+    parser.add_argument("--force", action="store_true", help="recalcule tous les mots")
+    options = parser.parse_args(argv)
+    
+    words = read_words(options.words) if options.words else all_words()
+    cache = load_dictionary_cache(options.cache)
+    
+    start = time.perf_counter()
+    scores, recomputed = update_difficulty(cache, words, options.processes, options.force)
+    elapsed = time.perf_counter() - start
+    save_dictionary_cache(cache, options.cache)
+    print(f"{len(scores)} mots jouables, {recomputed} recalculés en {elapsed:.2f} s "
+          f"({options.processes} processus) -> {options.cache}")
+    
+    # === RÉSUMÉ DES BANDES ===
+    for band, band_words in difficulty_bands(scores).items():
+        low, high = scores[band_words[0]], scores[band_words[-1]]
+        examples = ", ".join(band_words[::max(1, len(band_words) // 4)][:4])
+        print(f"{band:>10}: {len(band_words):>7} mots, score {low:.2f} à {high:.2f} (ex: {examples})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
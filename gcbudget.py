@@ -0,0 +1,203 @@
+"""
+Budget d'allocations et ramasse-miettes de Pendu Deluxe
+- GCMonitor : via gc.callbacks, compte les passages du ramasse-miettes cyclique de
+  chaque frame (par génération) et leur durée ; une frame dont les pauses dépassent le
+  budget est signalée
+- AllocationTracker : via tracemalloc, mémoire allouée par frame (pic au-dessus du
+  début de frame, solde en fin de frame) et blocs restés alloués (coûteux : mode
+  d'instrumentation seulement)
+- tune_gc : réglage de production ; les objets créés au démarrage (base de mots,
+  sprites, sons) sont gelés avec gc.freeze() et ne sont plus parcourus par les
+  collectes complètes, et les seuils espacent les collectes des jeunes objets
+"""
+import gc       # Module du ramasse-miettes
+import sys      # Module système pour compter les blocs alloués
+import time     # Module pour mesurer les pauses
+import tracemalloc  # Module de suivi des allocations mémoire
+from collections import deque  # Dernières mesures (centiles)
+
+from audio import percentile
+
+DEFAULT_GC_BUDGET_MS = 1.0            # Pause du ramasse-miettes tolérée par frame
+TUNED_THRESHOLDS = (10000, 20, 100)   # Seuils de production (Python 3.11 : 700, 10, 10)
+FRAME_SAMPLES = 4096                  # Frames conservées pour les centiles
+FLAGGED_SAMPLES = 20                  # Pires frames signalées gardées pour le rapport
+
+def tune_gc(thresholds=TUNED_THRESHOLDS):
+    """
+    Gèle les objets vivants (fin du démarrage) et règle les seuils du ramasse-miettes
+    
+    Args:
+        thresholds: seuils des générations 0, 1 et 2 (voir gc.set_threshold)
+    
+    Returns:
+        int: nombre d'objets gelés
+    """
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(*thresholds)
+    return gc.get_freeze_count()
+
+class GCMonitor:
+    """
+    Passages du ramasse-miettes par frame et frames qui dépassent le budget de pause
+    """
+    
+    def __init__(self, budget_ms=DEFAULT_GC_BUDGET_MS):
+        """
+        Args:
+            budget_ms: pause totale tolérée par frame (millisecondes)
+        """
+        self.budget_ms = budget_ms
+        self.frame = 0
+        self.started = None
+        self.frame_pause = 0.0                # Pauses de la frame en cours (secondes)
+        self.frame_generations = set()        # Générations collectées pendant la frame
+        self.collections = [0, 0, 0]          # Passages par génération depuis start()
+        self.pauses = [0.0, 0.0, 0.0]         # Durée totale par génération (secondes)
+        self.max_pause = 0.0
+        self.frames_with_gc = 0
+        self.flagged = 0
+        self.worst = []                       # (pause ms, frame, générations) des pires frames
+    
+    def start(self):
+        """
+        Commence la surveillance (enregistre le rappel du ramasse-miettes)
+        """
+        if self.callback not in gc.callbacks:
+            gc.callbacks.append(self.callback)
+    
+    def stop(self):
+        """
+        Arrête la surveillance
+        """
+        if self.callback in gc.callbacks:
+            gc.callbacks.remove(self.callback)
+    
+    def callback(self, phase, info):
+        """
+        Rappel de gc.callbacks : mesure chaque passage
+        """
+        if phase == "start":
+            self.started = time.perf_counter()
+            return
+        if self.started is None:
+            return
+        pause = time.perf_counter() - self.started
+        self.started = None
+        generation = info["generation"]
+        self.collections[generation] += 1
+        self.pauses[generation] += pause
+        self.max_pause = max(self.max_pause, pause)
+        self.frame_pause += pause
+        self.frame_generations.add(generation)
+    
+    def end_frame(self):
+        """
+        Termine une frame : la signale si ses pauses ont dépassé le budget
+        
+        Returns:
+            float: pause du ramasse-miettes pendant la frame (ms)
+        """
+        pause_ms = self.frame_pause * 1000
+        if self.frame_generations:
+            self.frames_with_gc += 1
+        if pause_ms > self.budget_ms:
+            self.flagged += 1
+            self.worst.append((pause_ms, self.frame, sorted(self.frame_generations)))
+            self.worst = sorted(self.worst, reverse=True)[:FLAGGED_SAMPLES]
+        self.frame += 1
+        self.frame_pause = 0.0
+        self.frame_generations = set()
+        return pause_ms
+    
+    def summary(self):
+        """
+        Résume la surveillance
+        
+        Returns:
+            dict: frames, passages et pauses par génération (ms), pire pause (ms),
+                frames signalées et les pires d'entre elles
+        """
+        return {
+            "frames": self.frame,
+            "frames_with_gc": self.frames_with_gc,
+            "collections": list(self.collections),
+            "pause_ms": [pause * 1000 for pause in self.pauses],
+            "max_pause_ms": self.max_pause * 1000,
+            "budget_ms": self.budget_ms,
+            "flagged": self.flagged,
+            "worst": list(self.worst),
+        }
+
+class AllocationTracker:
+    """
+    Mémoire allouée par frame, mesurée avec tracemalloc
+    """
+    
+    def __init__(self, samples=FRAME_SAMPLES):
+        """
+        Args:
+            samples: frames conservées pour les centiles
+        """
+        self.peak = deque(maxlen=samples)     # Pic au-dessus du début de frame (octets)
+        self.net = deque(maxlen=samples)      # Solde en fin de frame (octets)
+        self.blocks = deque(maxlen=samples)   # Blocs restés alloués en fin de frame
+        self.mark = 0
+        self.mark_blocks = 0
+    
+    def start(self):
+        """
+        Démarre tracemalloc (ralentit toutes les allocations : instrumentation seulement)
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.mark = tracemalloc.get_traced_memory()[0]
+        self.mark_blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+    
+    def stop(self):
+        """
+        Arrête tracemalloc (après top_lines : les traces sont perdues)
+        """
+        tracemalloc.stop()
+    
+    def end_frame(self):
+        """
+        Termine une frame et prépare la mesure de la suivante
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        self.peak.append(peak - self.mark)
+        self.net.append(current - self.mark)
+        self.blocks.append(blocks - self.mark_blocks)
+        self.mark, self.mark_blocks = current, blocks
+        tracemalloc.reset_peak()
+    
+    def summary(self):
+        """
+        Résume les allocations par frame
+        
+        Returns:
+            dict: médiane et 95e centile du pic (octets), solde moyen (octets) et blocs
+                restés alloués en moyenne
+        """
+        frames = max(1, len(self.net))
+        return {
+            "frames": len(self.net),
+            "peak_p50": percentile(self.peak, 0.5),
+            "peak_p95": percentile(self.peak, 0.95),
+            "net_mean": sum(self.net) / frames,
+            "blocks_mean": sum(self.blocks) / frames,
+        }
+    
+    def top_lines(self, limit=10):
+        """
+        Lignes de code qui retiennent le plus de mémoire tracée
+        
+        Returns:
+            list: textes "fichier:ligne taille (nombre de blocs)"
+        """
+        statistics = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+        return [f"{stat.traceback[0].filename.rsplit('/', 1)[-1]}:{stat.traceback[0].lineno} "
+                f"{stat.size / 1024:.1f} Kio ({stat.count} blocs)" for stat in statistics]
@@ -2,12 +2,27 @@ import pygame   # Bibliothèque principale pour créer des jeux 2D
 import random   # Module pour générer des valeurs aléatoires
 import math     # Module pour les fonctions mathématiques (sin, cos, pi, etc.)
 import sys      # Module système pour quitter proprement l'application
-from datetime import datetime  # Module pour gérer les dates/heures (non utilisé ici)
 import os       # Module pour interagir avec le système de fichiers
-
-# === INITIALISATION DE PYGAME ===
-pygame.init()        # Initialise tous les modules pygame
-pygame.mixer.init()  # Initialise spécifiquement le module audio de pygame
+from collections import deque  # File d'attente efficace pour les explosions différées
+import argparse # Module pour lire les options de la ligne de commande
+import time     # Module pour dater les appuis de touche (mesure de latence audio)
+from renderer import Scene, SpriteCache, SoftwareRenderer, RENDERER_BACKENDS, RENDER_SCALES, create_renderer
+from dictionary import WORD_CATEGORIES, DIFFICULTY_WORDS, load_compiled_dictionary  # Base de mots (sans pygame)
+from difficulty import DifficultyProcess, load_difficulty_bands  # Difficulté mesurée des mots
+from wordstore import WordStore, is_word_store  # Base compacte pour les grands dictionnaires
+from sampler import WordSampler, SamplerJournal, SAMPLER_STATE_PATH  # Tirage sans répétition
+from audio import AudioEngine, DEFAULT_BUFFER, init_mixer  # Effets sonores à faible latence
+from gcbudget import GCMonitor, AllocationTracker, tune_gc, DEFAULT_GC_BUDGET_MS  # Ramasse-miettes par frame
+from metrics import GameMetrics, MetricsServer, DEFAULT_METRICS_HOST  # Mesures exposées en HTTP
+from inputlatency import LatencyTracker, restrict_events  # Latence touche -> frame, file filtrée
+from hotreload import DictionaryReloader, rebuild_sampler  # Rechargement à chaud du dictionnaire
+from snapshot import GameSnapshot, SnapshotCodec, load_snapshot, save_snapshot  # Reprise de la partie
+from scheduler import FrameScheduler, ACTIVE, DEFAULT_IDLE_FPS, DEFAULT_IDLE_SECONDS  # Cadence selon l'activité
+from rules import MAX_PENALTIES, HINT_PENALTY, hint_letters, is_solved, masked_pattern  # Règles du pendu
+try:
+    from letterfield import FallingLetterField  # Lettres tombantes vectorisées (NumPy)
+except ImportError:
+    FallingLetterField = None  # Sans NumPy : une instance de FallingLetter par lettre
 
 # === CONSTANTES GLOBALES ===
 # Dimensions de la fenêtre de jeu
@@ -27,33 +42,129 @@ RED = (239, 68, 68)           # Rouge pour les erreurs
 WHITE = (255, 255, 255)       # Blanc pur
 BLACK = (0, 0, 0)             # Noir pur
 GRAY = (156, 163, 175)        # Gris moyen pour les éléments neutres
+# Couleurs vives des lettres tombantes
+FALLING_LETTER_COLORS = [LIGHT_BLUE, PURPLE, PINK, GREEN, YELLOW, WHITE]
 DARK_GRAY = (75, 85, 99)      # Gris foncé pour les ombres
 
 # Couleurs pour le dégradé d'arrière-plan
 GRADIENT_START = (30, 41, 59)  # Couleur du haut du dégradé
 GRADIENT_END = (15, 23, 42)    # Couleur du bas du dégradé
 
+# === POSITION DES PANNEAUX ===
+INFO_PANEL_X, INFO_PANEL_Y = 650, 150  # Coin haut-gauche du panneau d'informations
+
+# === EFFETS D'ARRIÈRE-PLAN ===
+MAX_BURST_PARTICLES_PER_FRAME = 60     # Particules d'explosion créées au maximum par frame
+MAX_PENDING_BURST_PARTICLES = 900      # Au-delà, les explosions en attente sont ignorées
+MAX_EFFECT_PARTICLES_PER_FRAME = 150   # Particules d'effet (coups, victoire) créées au maximum par frame
+
+# === NIVEAUX DE QUALITÉ ===
+# Densité des effets visuels pour chaque niveau (du plus léger au plus riche)
+QUALITY_LEVELS = ["low", "medium", "high", "ultra", "extreme"]
+QUALITY_PRESETS = {
+    "low": {
+        "falling_letters": 10,     # Lettres tombantes en arrière-plan
+        "trail_length": 1,         # Positions mémorisées pour la traînée (1 = pas de traînée)
+        "letter_sparkles": True,   # Petites particules autour des lettres tombantes
+        "explosion_particles": 5,  # Particules par lettre tombante qui explose
+        "victory_bursts": 15,      # Gerbes de particules à la victoire
+        "victory_particles": 6,    # Particules par gerbe
+        "title_glow": 0,           # Copies décalées pour le halo du titre
+    },
+    "medium": {
+        "falling_letters": 18,
+        "trail_length": 3,
+        "letter_sparkles": True,
+        "explosion_particles": 10,
+        "victory_bursts": 30,
+        "victory_particles": 8,
+        "title_glow": 2,
+    },
+    "high": {  # Réglages d'origine du jeu
+        "falling_letters": 25,
+        "trail_length": 5,
+        "letter_sparkles": True,
+        "explosion_particles": 15,
+        "victory_bursts": 50,
+        "victory_particles": 10,
+        "title_glow": 5,
+    },
+    "ultra": {
+        "falling_letters": 60,
+        "trail_length": 8,
+        "letter_sparkles": True,
+        "explosion_particles": 20,
+        "victory_bursts": 70,
+        "victory_particles": 12,
+        "title_glow": 6,
+    },
+    "extreme": {  # Champ dense : demande NumPy (FallingLetterField)
+        "falling_letters": 2000,
+        "trail_length": 1,
+        "letter_sparkles": False,  # Pas de particules autour de chaque lettre
+        "explosion_particles": 4,
+        "victory_bursts": 70,
+        "victory_particles": 12,
+        "title_glow": 6,
+    },
+}
+DEFAULT_QUALITY = "high"
+
+class FallingLetterIndex:
+    """
+    Index lettre -> lettres tombantes qui l'affichent
+    Permet de retrouver les lettres à faire exploser sans parcourir tout l'écran
+    """
+    
+    def __init__(self):
+        """
+        Constructeur qui crée un ensemble vide pour chaque lettre de l'alphabet
+        """
+        self.buckets = {letter: set() for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
+    
+    def move(self, falling_letter, old_letter):
+        """
+        Déplace une lettre tombante de l'ensemble de son ancienne lettre vers la nouvelle
+        
+        Args:
+            falling_letter: instance de FallingLetter qui vient de changer de lettre
+            old_letter: lettre affichée avant le changement (None si nouvelle instance)
+        """
+        if old_letter is not None:
+            self.buckets[old_letter].discard(falling_letter)
+        self.buckets[falling_letter.letter].add(falling_letter)
+    
+    def remove(self, falling_letter):
+        """
+        Retire une lettre tombante de l'index (quand elle quitte l'écran définitivement)
+        """
+        self.buckets[falling_letter.letter].discard(falling_letter)
+    
+    def matches(self, letter):
+        """
+        Retourne une copie des lettres tombantes qui affichent la lettre donnée
+        La copie permet de les réinitialiser pendant l'itération
+        
+        Returns:
+            tuple: instances de FallingLetter correspondantes
+        """
+        return tuple(self.buckets.get(letter, ()))
+
 class FallingLetter:
     """
     Classe qui gère les lettres qui tombent en arrière-plan
     Crée un effet visuel dynamique avec traînée et particules
     """
     
-    def __init__(self):
+    def __init__(self, letter_index=None):
         """
         Constructeur qui initialise une lettre tombante avec des propriétés aléatoires
-        """
-        # === POSITION ET MOUVEMENT ===
-        self.x = random.randint(0, WINDOW_WIDTH)     # Position X aléatoire sur la largeur
-        self.y = random.randint(-200, -50)           # Position Y au-dessus de l'écran
         
-        # === PROPRIÉTÉS VISUELLES ===
-        self.letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')  # Lettre aléatoire
-        # Couleur aléatoire parmi les couleurs vives
-        self.color = random.choice([LIGHT_BLUE, PURPLE, PINK, GREEN, YELLOW, WHITE])
-        self.speed = random.uniform(1, 4)            # Vitesse de chute variable
-        self.size = random.randint(32, 64)           # Taille de police variable
-        self.alpha = random.randint(200, 255)        # Transparence (presque opaque)
+        Args:
+            letter_index: FallingLetterIndex à tenir à jour lors des réapparitions (optionnel)
+        """
+        self.letter_index = letter_index  # Index partagé lettre -> instances
+        self.letter = None                # Définie par respawn()
         
         # === ROTATION ===
         self.rotation = random.uniform(0, 360)       # Angle de rotation initial
@@ -66,6 +177,37 @@ class FallingLetter:
         # === PARTICULES D'ACCOMPAGNEMENT ===
         self.particles = []            # Liste des petites particules autour de la lettre
         self.particle_timer = 0        # Compteur pour créer des particules périodiquement
+        self.sparkles = True           # Crée des particules (réglé par le niveau de qualité)
+        
+        # Position, lettre, couleur, vitesse, taille et transparence aléatoires
+        self.respawn()
+    
+    def respawn(self):
+        """
+        Replace la lettre au-dessus de l'écran avec de nouvelles propriétés aléatoires
+        Utilisé à la création, quand la lettre sort de l'écran et après une explosion
+        """
+        old_letter = self.letter
+        
+        # === POSITION ET MOUVEMENT ===
+        self.x = random.randint(0, WINDOW_WIDTH)     # Position X aléatoire sur la largeur
+        self.y = random.randint(-200, -50)           # Position Y au-dessus de l'écran
+        
+        # === PROPRIÉTÉS VISUELLES ===
+        self.letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')  # Lettre aléatoire
+        # Couleur aléatoire parmi les couleurs vives
+        self.color = random.choice(FALLING_LETTER_COLORS)
+        self.speed = random.uniform(1, 4)            # Vitesse de chute variable
+        self.size = random.randint(32, 64)           # Taille de police variable
+        self.alpha = random.randint(200, 255)        # Transparence (presque opaque)
+        
+        # Remet à zéro les effets visuels
+        self.trail_positions.clear()
+        self.particles.clear()
+        
+        # === MISE À JOUR DE L'INDEX ===
+        if self.letter_index is not None:
+            self.letter_index.move(self, old_letter)
     
     def update(self):
         """
@@ -87,7 +229,7 @@ class FallingLetter:
         self.particle_timer += 1  # Incrémente le compteur
         
         # Crée des particules à intervalles aléatoires
-        if self.particle_timer > random.randint(10, 30):
+        if self.sparkles and self.particle_timer > random.randint(10, 30):
             self.particle_timer = 0  # Remet le compteur à zéro
             
             # Ajoute 2 petites particules autour de la lettre
@@ -124,25 +266,17 @@ class FallingLetter:
         # Si la lettre est sortie de l'écran par le bas
         if self.y > WINDOW_HEIGHT + 100:
             # Remet la lettre en haut avec de nouvelles propriétés aléatoires
-            self.y = random.randint(-200, -50)
-            self.x = random.randint(0, WINDOW_WIDTH)
-            self.letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-            self.color = random.choice([LIGHT_BLUE, PURPLE, PINK, GREEN, YELLOW, WHITE])
-            self.speed = random.uniform(1, 4)
-            self.size = random.randint(32, 64)
-            self.alpha = random.randint(200, 255)
-            # Remet à zéro les effets visuels
-            self.trail_positions.clear()
-            self.particles.clear()
+            self.respawn()
     
-    def draw(self, screen, font):
+    def add_to_scene(self, scene):
         """
-        Dessine la lettre avec tous ses effets visuels
+        Ajoute la lettre et tous ses effets visuels à la scène de la frame
         
         Args:
-            screen: surface pygame où dessiner
-            font: police à utiliser pour le rendu du texte
+            scene: Scene où ajouter les sprites (voir renderer.py)
         """
+        sprite_key = ('glyph', self.letter, self.color)
+        
         # === DESSIN DE LA TRAÎNÉE ===
         # Parcourt toutes les positions de la traînée sauf la dernière (position actuelle)
         for i, (trail_x, trail_y, trail_alpha) in enumerate(self.trail_positions):
@@ -151,48 +285,99 @@ class FallingLetter:
                 fade_alpha = int(trail_alpha * (i / len(self.trail_positions)) * 0.3)
                 
                 if fade_alpha > 10:  # Seulement si suffisamment visible
-                    # Crée le texte de la traînée
-                    trail_text = font.render(self.letter, True, self.color)
-                    # Applique la rotation
-                    trail_rotated = pygame.transform.rotate(trail_text, self.rotation)
-                    
-                    # Crée une surface temporaire avec transparence
-                    temp_trail = pygame.Surface(trail_rotated.get_size(), pygame.SRCALPHA)
-                    temp_trail.set_alpha(fade_alpha)  # Applique la transparence
-                    temp_trail.blit(trail_rotated, (0, 0))
-                    
-                    # Centre et dessine la traînée
-                    trail_rect = temp_trail.get_rect()
-                    trail_rect.center = (trail_x, trail_y)
-                    screen.blit(temp_trail, trail_rect)
+                    # Même glyphe que la lettre, tourné, transparent et centré sur la position
+                    scene.sprite(sprite_key, trail_x, trail_y, self.rotation, fade_alpha, True)
         
         # === DESSIN DES PARTICULES D'ACCOMPAGNEMENT ===
         for particle in self.particles:
             if particle['alpha'] > 0:  # Seulement si visible
-                # Crée une petite surface pour la particule
-                particle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-                # Dessine un petit cercle coloré avec transparence
-                color_with_alpha = (*particle['color'], particle['alpha'])
-                pygame.draw.circle(particle_surf, color_with_alpha, (2, 2), 2)
-                # Positionne et dessine la particule
-                screen.blit(particle_surf, (particle['x'] - 2, particle['y'] - 2))
+                # Petit cercle coloré de rayon 2 avec transparence
+                scene.sprite(('dot', particle['color'], 2),
+                             particle['x'] - 2, particle['y'] - 2, 0, particle['alpha'])
         
         # === DESSIN DE LA LETTRE PRINCIPALE ===
-        # Crée le texte de la lettre avec sa couleur
-        letter_text = font.render(self.letter, True, self.color)
-        
-        # Applique la rotation à la lettre
-        rotated_letter = pygame.transform.rotate(letter_text, self.rotation)
-        
-        # Crée une surface temporaire pour appliquer la transparence
-        temp_surface = pygame.Surface(rotated_letter.get_size(), pygame.SRCALPHA)
-        temp_surface.set_alpha(self.alpha)  # Applique la transparence
-        temp_surface.blit(rotated_letter, (0, 0))
+        # Lettre tournée, avec sa transparence, centrée sur sa position
+        scene.sprite(sprite_key, self.x, self.y, self.rotation, self.alpha, True)
+
+class FallingLetterGroup:
+    """
+    Lettres tombantes sous forme d'objets FallingLetter (repli quand NumPy est absent)
+    Même interface que FallingLetterField : resize, set_trail_length, update, explode,
+    add_to_scene
+    """
+    
+    def __init__(self, count=0, trail_length=5, sparkles=True):
+        """
+        Args:
+            count: nombre de lettres
+            trail_length: positions mémorisées pour la traînée (1 = pas de traînée)
+            sparkles: crée les particules d'accompagnement
+        """
+        self.letters = []                      # Instances de FallingLetter
+        self.letter_index = FallingLetterIndex()  # Index lettre -> lettres tombantes
+        self.trail_length = trail_length
+        self.sparkles = sparkles
+        self.resize(count)
+    
+    def __len__(self):
+        return len(self.letters)
+    
+    def resize(self, count):
+        """
+        Ajoute ou retire des lettres
+        """
+        while len(self.letters) < count:
+            falling_letter = FallingLetter(self.letter_index)
+            falling_letter.trail_max_length = self.trail_length
+            falling_letter.sparkles = self.sparkles
+            self.letters.append(falling_letter)
+        while len(self.letters) > count:
+            self.letter_index.remove(self.letters.pop())
+    
+    def set_trail_length(self, trail_length):
+        """
+        Change la longueur des traînées (les positions les plus récentes sont gardées)
+        """
+        self.trail_length = trail_length
+        for falling_letter in self.letters:
+            falling_letter.trail_max_length = trail_length
+            del falling_letter.trail_positions[:-trail_length]
+    
+    def set_sparkles(self, sparkles):
+        """
+        Active ou désactive les particules d'accompagnement
+        """
+        self.sparkles = sparkles
+        for falling_letter in self.letters:
+            falling_letter.sparkles = sparkles
+    
+    def update(self):
+        """
+        Avance toutes les lettres d'une frame
+        """
+        for falling_letter in self.letters:
+            falling_letter.update()
+    
+    def explode(self, letter):
+        """
+        Replace toutes les lettres qui affichent la lettre donnée
+        L'index ne renvoie que les lettres concernées : coût proportionnel au nombre d'explosions
         
-        # Centre la lettre sur sa position et la dessine
-        letter_rect = temp_surface.get_rect()
-        letter_rect.center = (self.x, self.y)
-        screen.blit(temp_surface, letter_rect)
+        Returns:
+            list: positions (x, y) des lettres replacées, pour les explosions
+        """
+        positions = []
+        for falling_letter in self.letter_index.matches(letter):
+            positions.append((falling_letter.x, falling_letter.y))
+            falling_letter.respawn()  # Nouvelles propriétés (et mise à jour de l'index)
+        return positions
+    
+    def add_to_scene(self, scene):
+        """
+        Ajoute toutes les lettres à la scène
+        """
+        for falling_letter in self.letters:
+            falling_letter.add_to_scene(scene)
 
 class Particle:
     """
@@ -223,20 +408,18 @@ class Particle:
         self.life -= 3              # Réduit la durée de vie (disparition progressive)
         self.size *= 0.99           # Réduit légèrement la taille
     
-    def draw(self, screen):
+    def add_to_scene(self, scene):
         """
-        Dessine la particule si elle est encore visible
+        Ajoute la particule à la scène si elle est encore visible
+        
+        Args:
+            scene: Scene où ajouter le sprite (voir renderer.py)
         """
-        if self.life > 0:  # Vérifie si la particule est encore vivante
-            alpha = max(0, self.life)  # Calcule la transparence
-            color = (*self.color, alpha)  # Ajoute la transparence à la couleur
-            
-            # Crée une surface temporaire avec transparence
-            s = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            # Dessine un cercle coloré
-            pygame.draw.circle(s, color, (int(self.size), int(self.size)), int(self.size))
-            # Positionne et dessine la particule
-            screen.blit(s, (int(self.x - self.size), int(self.y - self.size)))
+        radius = int(self.size)
+        if self.life > 0 and radius > 0:  # Vérifie si la particule est encore vivante
+            # Cercle coloré dont la transparence suit la durée de vie
+            scene.sprite(('dot', self.color, radius),
+                         int(self.x - self.size), int(self.y - self.size), 0, self.life)
 
 class Button:
     """
@@ -317,22 +500,109 @@ def draw_gradient_background(screen):
         # Dessine une ligne horizontale avec cette couleur
         pygame.draw.line(screen, (r, g, b), (0, y), (WINDOW_WIDTH, y))
 
-def draw_animated_stickman(screen, penalties, animation_time):
+def make_gradient_sprite():
     """
-    Dessine le bonhomme pendu avec des animations selon le nombre d'erreurs
+    Pré-rend le fond dégradé une seule fois (sprite 'gradient' de la scène)
+    
+    Returns:
+        pygame.Surface: fond de la taille de la fenêtre
+    """
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    draw_gradient_background(surface)
+    # Convertit au format de l'écran pour des blits plus rapides (si la fenêtre existe)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+def make_dot_sprite(color, radius):
+    """
+    Crée le sprite d'une particule ronde (sprite 'dot' de la scène)
+    La transparence est appliquée au moment du dessin
     
     Args:
-        screen: surface où dessiner
-        penalties: nombre d'erreurs (détermine les parties visibles)
-        animation_time: temps pour les animations de balancement
+        color: couleur RGB du cercle
+        radius: rayon en pixels
     """
-    x, y = 200, 300  # Position de base de la potence
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    return surface
+
+def make_faded_dot_sprite(color, radius, alpha):
+    """
+    Crée le sprite d'une particule ronde avec sa transparence intégrée (sprite 'faded_dot',
+    dessiné en lot sans réglage de transparence)
     
-    # === ANIMATION DE BALANCEMENT ===
-    # Utilise une fonction sinusoïdale pour créer un mouvement de balancement
-    sway = math.sin(animation_time * 0.05) * 2  # Amplitude de 2 pixels
+    Args:
+        color: couleur RGB du cercle
+        radius: rayon en pixels
+        alpha: transparence (0 à 255)
+    """
+    surface = make_dot_sprite(color, radius)
+    surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+def make_turned_glyph_sprite(glyph, angle, alpha):
+    """
+    Crée une lettre tournée avec sa transparence intégrée (sprite 'turned_glyph',
+    dessiné en lot sans rotation ni réglage de transparence)
     
-    # === DESSIN PROGRESSIF DE LA POTENCE ===
+    Args:
+        glyph: surface de la lettre (sprite 'glyph')
+        angle: rotation en degrés (sens anti-horaire)
+        alpha: transparence (0 à 255)
+    """
+    surface = pygame.transform.rotate(glyph, angle)
+    surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    
+    # Recadre les bords transparents en gardant le même centre : en lot, des milliers de
+    # ces sprites sont mélangés par pixel à chaque frame
+    width, height = surface.get_size()
+    ink = surface.get_bounding_rect()
+    half_width = max(width // 2 - ink.left, ink.right - width // 2)
+    half_height = max(height // 2 - ink.top, ink.bottom - height // 2)
+    crop = pygame.Rect(width // 2 - half_width, height // 2 - half_height, half_width * 2, half_height * 2)
+    return surface.subsurface(crop.clip(surface.get_rect())).copy()
+
+def make_panel_sprite(width, height, alpha):
+    """
+    Crée le fond semi-transparent d'un panneau (sprite 'panel' de la scène)
+    
+    Args:
+        width, height: dimensions du panneau
+        alpha: transparence du fond bleu foncé
+    """
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (*DARK_BLUE, alpha), (0, 0, width, height), border_radius=15)
+    pygame.draw.rect(surface, WHITE, (0, 0, width, height), 2, border_radius=15)
+    return surface
+
+# === POSITION DU PENDU ===
+STICKMAN_X, STICKMAN_Y = 200, 300  # Position de base de la potence
+MAX_STICKMAN_STAGE = 10            # Au-delà, le dessin ne change plus
+
+# === CALQUES PRÉ-RENDUS DU PENDU ===
+# Pour chaque nombre d'erreurs (0 à 10) : (potence, corde, silhouette sans les bras)
+# Chaque calque est un tuple (surface, décalage x, décalage y) ou None s'il est vide
+STICKMAN_LAYERS = {}
+
+# Dimensions des sprites et position du point d'ancrage dans chaque sprite
+GALLOWS_SPRITE_SIZE = (125, 230)   # Couvre la base, le poteau et la traverse
+GALLOWS_ANCHOR = (60, 60)          # Position de (x, y) de la potence dans le sprite
+ROPE_SPRITE_SIZE = (6, 32)
+ROPE_ANCHOR = (3, 52)              # Position de (x + 30, y) dans le sprite de la corde
+FIGURE_SPRITE_SIZE = (50, 140)
+FIGURE_ANCHOR = (24, 24)           # Position du centre de la tête dans le sprite
+LAYER_COLORKEY = (255, 0, 255)     # Couleur du fond transparent des calques
+
+def draw_gallows(screen, x, y, penalties):
+    """
+    Dessine la potence (base, poteau et traverse) selon le nombre d'erreurs
+    
+    Args:
+        screen: surface où dessiner
+        x, y: position de base de la potence
+        penalties: nombre d'erreurs (détermine les parties visibles)
+    """
     if penalties >= 1:  # Base de la potence
         # Ombre de la base (plus foncée)
         pygame.draw.rect(screen, DARK_GRAY, (x-60, y+155, 120, 10))
@@ -346,45 +616,74 @@ def draw_animated_stickman(screen, penalties, animation_time):
     if penalties >= 3:  # Poteau horizontal
         # Traverse horizontale de la potence
         pygame.draw.rect(screen, (139, 69, 19), (x-35, y-60, 65, 8))
-        
-    if penalties >= 4:  # Corde animée
-        rope_color = (101, 67, 33)  # Couleur marron foncé
-        # Dessine la corde comme une série de petits cercles
-        for i in range(0, 30, 3):  # De 0 à 30 par pas de 3
-            rope_y = y - 50 + i + sway * 0.3  # Position avec léger balancement
-            pygame.draw.circle(screen, rope_color, (x+30, int(rope_y)), 2)
+
+def draw_rope(screen, rope_x, y):
+    """
+    Dessine la corde comme une série de petits cercles
     
-    # === POSITION DU BONHOMME AVEC BALANCEMENT ===
-    man_x = x + 30 + sway  # Position X avec effet de balancement
-    man_y = y - 20         # Position Y fixe
+    Args:
+        screen: surface où dessiner
+        rope_x: position horizontale de la corde
+        y: hauteur de base de la potence (la corde commence à y - 50)
+    """
+    rope_color = (101, 67, 33)  # Couleur marron foncé
+    for i in range(0, 30, 3):  # De 0 à 30 par pas de 3
+        pygame.draw.circle(screen, rope_color, (rope_x, y - 50 + i), 2)
+
+def draw_stickman_figure(screen, man_x, man_y, penalties):
+    """
+    Dessine la partie fixe du bonhomme : tête, visage, corps et jambes
+    Les bras, animés, sont dessinés séparément par draw_stickman_arms()
     
+    Args:
+        screen: surface où dessiner
+        man_x, man_y: position du centre de la tête
+        penalties: nombre d'erreurs (détermine les parties visibles)
+    """
     if penalties >= 5:  # Tête avec visage
         # Ombre de la tête pour l'effet de profondeur
-        pygame.draw.circle(screen, (0, 0, 0, 100), (int(man_x + 2), int(man_y + 2)), 22)
+        # (opaque : l'alpha était ignoré quand la tête était dessinée directement sur l'écran)
+        pygame.draw.circle(screen, BLACK, (man_x + 2, man_y + 2), 22)
         # Tête couleur chair
-        pygame.draw.circle(screen, (255, 220, 177), (int(man_x), int(man_y)), 20)
+        pygame.draw.circle(screen, (255, 220, 177), (man_x, man_y), 20)
         # Contour noir de la tête
-        pygame.draw.circle(screen, BLACK, (int(man_x), int(man_y)), 20, 3)
+        pygame.draw.circle(screen, BLACK, (man_x, man_y), 20, 3)
         
         # === EXPRESSION DU VISAGE ===
         if penalties >= 8:  # Visage de mort (yeux en X)
             # Œil gauche en X rouge
-            pygame.draw.line(screen, RED, (int(man_x - 8), int(man_y - 5)), (int(man_x - 4), int(man_y - 1)), 2)
-            pygame.draw.line(screen, RED, (int(man_x - 4), int(man_y - 5)), (int(man_x - 8), int(man_y - 1)), 2)
+            pygame.draw.line(screen, RED, (man_x - 8, man_y - 5), (man_x - 4, man_y - 1), 2)
+            pygame.draw.line(screen, RED, (man_x - 4, man_y - 5), (man_x - 8, man_y - 1), 2)
             # Œil droit en X rouge
-            pygame.draw.line(screen, RED, (int(man_x + 4), int(man_y - 5)), (int(man_x + 8), int(man_y - 1)), 2)
-            pygame.draw.line(screen, RED, (int(man_x + 8), int(man_y - 5)), (int(man_x + 4), int(man_y - 1)), 2)
+            pygame.draw.line(screen, RED, (man_x + 4, man_y - 5), (man_x + 8, man_y - 1), 2)
+            pygame.draw.line(screen, RED, (man_x + 8, man_y - 5), (man_x + 4, man_y - 1), 2)
             # Bouche triste (arc vers le bas)
-            pygame.draw.arc(screen, RED, (int(man_x - 8), int(man_y + 8), 16, 8), math.pi, 2 * math.pi, 2)
+            pygame.draw.arc(screen, RED, (man_x - 8, man_y + 8, 16, 8), math.pi, 2 * math.pi, 2)
         else:  # Visage normal
             # Yeux normaux (petits cercles noirs)
-            pygame.draw.circle(screen, BLACK, (int(man_x - 6), int(man_y - 3)), 2)
-            pygame.draw.circle(screen, BLACK, (int(man_x + 6), int(man_y - 3)), 2)
+            pygame.draw.circle(screen, BLACK, (man_x - 6, man_y - 3), 2)
+            pygame.draw.circle(screen, BLACK, (man_x + 6, man_y - 3), 2)
     
     if penalties >= 6:  # Corps
         # Ligne verticale pour le corps
-        pygame.draw.line(screen, BLACK, (int(man_x), int(man_y + 20)), (int(man_x), int(man_y + 80)), 4)
+        pygame.draw.line(screen, BLACK, (man_x, man_y + 20), (man_x, man_y + 80), 4)
+    
+    if penalties >= 9:  # Jambe gauche
+        pygame.draw.line(screen, BLACK, (man_x, man_y + 80), (man_x - 20, man_y + 110), 4)
+    
+    if penalties >= 10:  # Jambe droite (mort complète)
+        pygame.draw.line(screen, BLACK, (man_x, man_y + 80), (man_x + 20, man_y + 110), 4)
+
+def draw_stickman_arms(screen, man_x, man_y, penalties, animation_time):
+    """
+    Dessine les bras animés du bonhomme (seule partie redessinée à chaque frame)
     
+    Args:
+        screen: surface où dessiner
+        man_x, man_y: position du centre de la tête (balancement inclus)
+        penalties: nombre d'erreurs (détermine les bras visibles)
+        animation_time: temps pour l'animation des bras
+    """
     if penalties >= 7:  # Bras gauche animé
         # Position du bras avec animation sinusoïdale
         arm_end_x = man_x - 25 + math.sin(animation_time * 0.1) * 3
@@ -394,51 +693,334 @@ def draw_animated_stickman(screen, penalties, animation_time):
         # Animation déphasée (+ pi) pour un mouvement alterné
         arm_end_x = man_x + 25 + math.sin(animation_time * 0.1 + math.pi) * 3
         pygame.draw.line(screen, BLACK, (int(man_x), int(man_y + 40)), (int(arm_end_x), int(man_y + 55)), 4)
+
+def render_layer(size, anchor, draw_function, *args):
+    """
+    Pré-rend un calque du pendu sur une surface à fond transparent
     
-    if penalties >= 9:  # Jambe gauche
-        pygame.draw.line(screen, BLACK, (int(man_x), int(man_y + 80)), (int(man_x - 20), int(man_y + 110)), 4)
+    Args:
+        size: dimensions du sprite
+        anchor: position dans le sprite du point de référence du dessin
+        draw_function: fonction de dessin appelée avec (surface, *anchor, *args)
+        
+    Returns:
+        tuple: (surface, décalage x, décalage y) à soustraire à la position d'affichage
+    """
+    # Les calques sont entièrement opaques : une couleur transparente (colorkey)
+    # compressée en RLE se copie bien plus vite qu'une surface à alpha par pixel
+    surface = pygame.Surface(size)
+    surface.fill(LAYER_COLORKEY)
+    draw_function(surface, *anchor, *args)
+    # Convertit au format de l'écran pour des blits plus rapides (si la fenêtre existe)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+    return surface, anchor[0], anchor[1]
+
+def build_stickman_layers():
+    """
+    Pré-rend une fois pour toutes les calques du pendu pour chaque nombre d'erreurs
+    Les niveaux qui dessinent la même chose partagent la même surface
+    """
+    gallows_stages = {}  # Potence selon le nombre de parties visibles (0 à 3)
+    rope = render_layer(ROPE_SPRITE_SIZE, ROPE_ANCHOR, draw_rope)
     
-    if penalties >= 10:  # Jambe droite (mort complète)
-        pygame.draw.line(screen, BLACK, (int(man_x), int(man_y + 80)), (int(man_x + 20), int(man_y + 110)), 4)
+    for penalties in range(MAX_STICKMAN_STAGE + 1):
+        gallows_stage = min(penalties, 3)
+        if gallows_stage not in gallows_stages:
+            gallows_stages[gallows_stage] = (
+                render_layer(GALLOWS_SPRITE_SIZE, GALLOWS_ANCHOR, draw_gallows, gallows_stage)
+                if gallows_stage else None)
+        
+        figure = None
+        if penalties >= 5:
+            figure = render_layer(FIGURE_SPRITE_SIZE, FIGURE_ANCHOR,
+                                  draw_stickman_figure, penalties)
+        
+        STICKMAN_LAYERS[penalties] = (gallows_stages[gallows_stage],
+                                      rope if penalties >= 4 else None,
+                                      figure)
 
-def draw_word_display(screen, word, guessed_letters, font, animation_time):
+def draw_animated_stickman(screen, penalties, animation_time):
     """
-    Affiche le mot à deviner avec des animations colorées
-    Les lettres trouvées rebondissent, les autres sont des tirets animés
+    Dessine le bonhomme pendu avec des animations selon le nombre d'erreurs
+    Les parties fixes sont des sprites pré-rendus : seuls le balancement et les bras
+    sont calculés à chaque frame
     
     Args:
         screen: surface où dessiner
-        word: mot à deviner
-        guessed_letters: set des lettres déjà trouvées
-        font: police pour le rendu
-        animation_time: temps pour les animations
+        penalties: nombre d'erreurs (détermine les parties visibles)
+        animation_time: temps pour les animations de balancement
+    """
+    if not STICKMAN_LAYERS:
+        build_stickman_layers()  # Premier affichage : prépare les calques
+    
+    x, y = STICKMAN_X, STICKMAN_Y
+    gallows, rope, figure = STICKMAN_LAYERS[min(penalties, MAX_STICKMAN_STAGE)]
+    
+    # === ANIMATION DE BALANCEMENT ===
+    # Utilise une fonction sinusoïdale pour créer un mouvement de balancement
+    sway = math.sin(animation_time * 0.05) * 2  # Amplitude de 2 pixels
+    
+    # === POTENCE (FIXE) ===
+    if gallows is not None:
+        surface, anchor_x, anchor_y = gallows
+        screen.blit(surface, (x - anchor_x, y - anchor_y))
+    
+    # === CORDE ANIMÉE (léger balancement vertical) ===
+    if rope is not None:
+        surface, anchor_x, anchor_y = rope
+        screen.blit(surface, (x + 30 - anchor_x, int(y + sway * 0.3) - anchor_y))
+    
+    # === POSITION DU BONHOMME AVEC BALANCEMENT ===
+    man_x = x + 30 + sway  # Position X avec effet de balancement
+    man_y = y - 20         # Position Y fixe
+    
+    # === TÊTE, CORPS ET JAMBES (SPRITE) ===
+    if figure is not None:
+        surface, anchor_x, anchor_y = figure
+        screen.blit(surface, (int(man_x) - anchor_x, man_y - anchor_y))
+    
+    # === BRAS ANIMÉS ===
+    draw_stickman_arms(screen, man_x, man_y, penalties, animation_time)
+
+class WordDisplay:
+    """
+    Affiche le mot à deviner avec des animations colorées
+    Les lettres trouvées rebondissent, les autres sont des tirets animés
+    Les glyphes (lettre et ombre) sont rendus une seule fois par mot : chaque frame
+    ne fait que les copier avec leur décalage de rebond
     """
-    # Calcule la position de départ pour centrer le mot
-    x_start = WINDOW_WIDTH // 2 - (len(word) * 40) // 2
-    y_pos = 500
     
-    for i, letter in enumerate(word):  # Pour chaque lettre du mot
-        x = x_start + i * 50  # Position X (50 pixels d'espacement)
+    def __init__(self, word, font):
+        """
+        Prépare les positions et les glyphes de chaque lettre du mot
         
-        if letter in guessed_letters:  # Si la lettre a été devinée
-            # === ANIMATION DE REBOND ===
-            # Chaque lettre a son propre déphasage (i * 0.5) pour un effet de vague
-            bounce = math.sin(animation_time * 0.1 + i * 0.5) * 3
-            
-            # === EFFET D'OMBRE ===
-            shadow_surf = font.render(letter, True, (0, 0, 0, 100))
-            screen.blit(shadow_surf, (x + 2, y_pos + 2 + bounce))
-            
-            # === LETTRE COLORÉE ===
+        Args:
+            word: mot à deviner
+            font: police pour le rendu
+        """
+        self.word = word
+        self.y_pos = 500
+        
+        # Calcule la position de départ pour centrer le mot
+        x_start = WINDOW_WIDTH // 2 - (len(word) * 40) // 2
+        self.positions = [x_start + i * 50 for i in range(len(word))]  # 50 pixels d'espacement
+        
+        # === PRÉ-RENDU DES GLYPHES ===
+        # Les lettres répétées (même lettre, même couleur) partagent leurs surfaces
+        rendered = {}
+        self.glyphs = []  # (ombre, lettre colorée) pour chaque position
+        for i, letter in enumerate(word):
             # Choisit une couleur selon la position de la lettre (cycle de 5 couleurs)
             color = [LIGHT_BLUE, PURPLE, PINK, GREEN, YELLOW][i % 5]
-            letter_surf = font.render(letter, True, color)
-            screen.blit(letter_surf, (x, y_pos + bounce))
-        else:  # Si la lettre n'a pas été devinée
-            # === TIRET ANIMÉ ===
-            # Le tiret bouge légèrement avec une animation sinusoïdale
-            underscore_y = y_pos + 40 + math.sin(animation_time * 0.08 + i * 0.3) * 2
-            pygame.draw.line(screen, WHITE, (x, int(underscore_y)), (x + 30, int(underscore_y)), 4)
+            if (letter, color) not in rendered:
+                rendered[(letter, color)] = (font.render(letter, True, (0, 0, 0, 100)),
+                                             font.render(letter, True, color))
+            self.glyphs.append(rendered[(letter, color)])
+        
+        self.revealed = [False] * len(word)  # Positions déjà découvertes
+    
+    def reveal(self, letter):
+        """
+        Marque comme découvertes toutes les positions de la lettre
+        
+        Args:
+            letter: lettre qui vient d'être trouvée (ou révélée par un indice)
+        """
+        for i, word_letter in enumerate(self.word):
+            if word_letter == letter:
+                self.revealed[i] = True
+    
+    def draw(self, screen, animation_time):
+        """
+        Dessine le mot : glyphes pré-rendus pour les lettres trouvées, tirets sinon
+        
+        Args:
+            screen: surface où dessiner
+            animation_time: temps pour les animations
+        """
+        y_pos = self.y_pos
+        for i, x in enumerate(self.positions):
+            if self.revealed[i]:  # Si la lettre a été devinée
+                # === ANIMATION DE REBOND ===
+                # Chaque lettre a son propre déphasage (i * 0.5) pour un effet de vague
+                bounce = math.sin(animation_time * 0.1 + i * 0.5) * 3
+                shadow_surf, letter_surf = self.glyphs[i]
+                
+                # === EFFET D'OMBRE ===
+                screen.blit(shadow_surf, (x + 2, y_pos + 2 + bounce))
+                
+                # === LETTRE COLORÉE ===
+                screen.blit(letter_surf, (x, y_pos + bounce))
+            else:  # Si la lettre n'a pas été devinée
+                # === TIRET ANIMÉ ===
+                # Le tiret bouge légèrement avec une animation sinusoïdale
+                underscore_y = y_pos + 40 + math.sin(animation_time * 0.08 + i * 0.3) * 2
+                pygame.draw.line(screen, WHITE, (x, int(underscore_y)), (x + 30, int(underscore_y)), 4)
+
+class AdaptiveQuality:
+    """
+    Contrôleur qui ajuste automatiquement le niveau de qualité selon les temps de frame
+    Baisse la qualité quand le 95e centile dépasse le budget, la remonte quand il reste
+    de la marge. Les deux seuils sont écartés et chaque changement est suivi d'une
+    période d'attente pour éviter les oscillations.
+    """
+    
+    def __init__(self, level=DEFAULT_QUALITY, max_level=None, budget_ms=1000 / FPS,
+                 window=120, headroom=0.6, upgrade_windows=3, cooldown=180):
+        """
+        Constructeur du contrôleur
+        
+        Args:
+            level: niveau de qualité de départ
+            max_level: niveau maximum autorisé (par défaut le niveau de départ)
+            budget_ms: temps de calcul maximum souhaité pour une frame
+            window: nombre de frames mesurées avant chaque décision
+            headroom: fraction du budget sous laquelle on considère qu'il reste de la marge
+            upgrade_windows: fenêtres consécutives avec de la marge avant de remonter
+            cooldown: frames ignorées après un changement de niveau
+        """
+        self.level = level
+        self.max_index = QUALITY_LEVELS.index(max_level or level)
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.upgrade_windows = upgrade_windows
+        self.cooldown = cooldown
+        
+        self.samples = deque(maxlen=window)  # Temps des dernières frames (ms)
+        self.cooldown_left = cooldown        # Laisse le jeu démarrer avant de juger
+        self.calm_windows = 0                # Fenêtres consécutives avec de la marge
+        self.last_p95 = 0.0                  # Dernier 95e centile calculé
+    
+    def p95(self):
+        """
+        Calcule le 95e centile des temps de frame mesurés
+        
+        Returns:
+            float: temps en millisecondes (0 si aucune mesure)
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    
+    def record(self, frame_ms):
+        """
+        Enregistre le temps de calcul d'une frame et décide d'un éventuel changement
+        
+        Args:
+            frame_ms: temps passé dans la frame hors attente (clock.get_rawtime())
+            
+        Returns:
+            str ou None: nouveau niveau de qualité à appliquer, None si inchangé
+        """
+        if self.cooldown_left > 0:
+            self.cooldown_left -= 1
+            return None
+        
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.samples.maxlen:
+            return None  # Fenêtre pas encore pleine
+        
+        p95 = self.last_p95 = self.p95()
+        self.samples.clear()
+        index = QUALITY_LEVELS.index(self.level)
+        
+        # === DÉGRADATION : LE BUDGET EST DÉPASSÉ ===
+        if p95 > self.budget_ms:
+            self.calm_windows = 0
+            if index > 0:
+                return self._change(QUALITY_LEVELS[index - 1])
+            return None
+        
+        # === AMÉLIORATION : MARGE CONFORTABLE PLUSIEURS FOIS DE SUITE ===
+        if p95 < self.budget_ms * self.headroom:
+            self.calm_windows += 1
+            if self.calm_windows >= self.upgrade_windows and index < self.max_index:
+                self.calm_windows = 0
+                return self._change(QUALITY_LEVELS[index + 1])
+        else:
+            self.calm_windows = 0  # Zone intermédiaire : on ne bouge pas
+        return None
+    
+    def _change(self, level):
+        """
+        Mémorise le nouveau niveau et démarre la période d'attente
+        """
+        self.level = level
+        self.cooldown_left = self.cooldown
+        return level
+
+class GameOverScreen:
+    """
+    Écran de fin de partie (victoire ou défaite) composé une seule fois
+    Le voile semi-transparent et les textes fixes sont assemblés sur une seule surface ;
+    les tailles successives du texte "VICTOIRE!" qui pulse sont gardées en cache.
+    Une fois le cache rempli, l'affichage n'alloue plus rien à chaque frame.
+    """
+    
+    def __init__(self, won, word, big_font, medium_font, small_font):
+        """
+        Compose les parties fixes de l'écran
+        
+        Args:
+            won: True pour l'écran de victoire, False pour la défaite
+            word: mot à deviner (révélé en cas de défaite)
+            big_font, medium_font, small_font: polices du jeu
+        """
+        self.won = won
+        
+        # === OVERLAY SEMI-TRANSPARENT ===
+        self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, 100))
+        
+        if won:  # === ÉCRAN DE VICTOIRE ===
+            # Le titre pulse : il est redimensionné à l'affichage (voir draw)
+            self.win_text = big_font.render("VICTOIRE!", True, YELLOW)
+            self.congrats = medium_font.render("Félicitations!", True, GREEN)
+            self.scaled_frames = {}  # Taille -> (texte redimensionné, position, position du message)
+        else:  # === ÉCRAN DE DÉFAITE ===
+            defeat_text = big_font.render("DÉFAITE!", True, RED)
+            defeat_rect = defeat_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
+            self.background.blit(defeat_text, defeat_rect)
+            
+            # Révèle le mot correct
+            word_text = medium_font.render(f"Le mot était: {word}", True, WHITE)
+            self.background.blit(word_text, (WINDOW_WIDTH // 2 - word_text.get_width() // 2, defeat_rect.bottom + 20))
+        
+        # === INSTRUCTIONS POUR REJOUER ===
+        controls_text = small_font.render("F5 = Rejouer | F4 = Indice | F6 = Options | ESC = Quitter", True, LIGHT_BLUE)
+        self.background.blit(controls_text, (WINDOW_WIDTH // 2 - controls_text.get_width() // 2, WINDOW_HEIGHT - 100))
+    
+    def draw(self, screen, animation_time):
+        """
+        Dessine l'écran de fin de partie
+        
+        Args:
+            screen: surface où dessiner
+            animation_time: temps pour la pulsation du titre de victoire
+        """
+        screen.blit(self.background, (0, 0))
+        
+        if self.won:
+            # Animation de pulsation pour "VICTOIRE!"
+            scale = 1 + math.sin(animation_time * 0.1) * 0.1  # ±10% de variation
+            width = int(self.win_text.get_width() * scale)
+            
+            frame = self.scaled_frames.get(width)
+            if frame is None:  # Nouvelle taille : redimensionne une fois pour toutes
+                height = int(self.win_text.get_height() * scale)
+                win_text = pygame.transform.scale(self.win_text, (width, height))
+                win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
+                congrats_pos = (WINDOW_WIDTH // 2 - self.congrats.get_width() // 2, win_rect.bottom + 20)
+                frame = self.scaled_frames[width] = (win_text, win_rect.topleft, congrats_pos)
+            
+            win_text, win_pos, congrats_pos = frame
+            screen.blit(win_text, win_pos)
+            
+            # Message de félicitations
+            screen.blit(self.congrats, congrats_pos)
 
 class HangmanDeluxe:
     """
@@ -446,12 +1028,30 @@ class HangmanDeluxe:
     Inclut : base de mots étendue, sons, particules, lettres tombantes, options
     """
     
-    def __init__(self):
+    def __init__(self, quality=DEFAULT_QUALITY, dictionary=None, audio_buffer=DEFAULT_BUFFER,
+                 watch_dictionary=False, resume=True, sampler_state_path=SAMPLER_STATE_PATH):
         """
         Constructeur qui initialise tout le système de jeu
+        
+        Args:
+            quality: niveau de qualité des effets visuels (voir QUALITY_LEVELS)
+            dictionary: dictionnaire compilé par importer.py ou base compacte de wordstore.py
+                (par défaut la base intégrée)
+            audio_buffer: taille du tampon du mixeur en échantillons (petit = faible latence)
+            watch_dictionary: recharge le dictionnaire quand son fichier change
+            resume: reprend la partie laissée en cours au dernier lancement
+            sampler_state_path: fichier de l'état des sacs de tirage (relu et mis à jour)
         """
         # === INITIALISATION DE LA BASE DE DONNÉES ===
-        self.init_word_database()  # Charge tous les mots français
+        self.difficulty_process = None  # Calcul des bandes d'un dictionnaire importé
+        self.sampler_state_path = sampler_state_path
+        self.init_word_database(dictionary)  # Charge tous les mots français
+        # Surveillance du fichier : la nouvelle version est préparée en arrière-plan
+        self.dictionary_reloader = None
+        if watch_dictionary and dictionary is not None:
+            # Bandes lues dans une base compacte, calculées à part pour un dictionnaire importé
+            self.dictionary_reloader = DictionaryReloader(dictionary, self.word_categories,
+                                                          with_bands=is_word_store(dictionary))
         
         # === CRÉATION DES POLICES ===
         self.big_font = pygame.font.Font(None, 72)      # Grande police pour les titres
@@ -460,154 +1060,96 @@ class HangmanDeluxe:
         
         # === VARIABLES D'ÉTAT DU JEU ===
         self.particles = []          # Liste des particules d'effets
+        self.pending_bursts = deque()  # Explosions en attente (x, y, couleur, particules restantes)
+        self.pending_burst_particles = 0  # Total des particules encore à créer
+        self.pending_effects = deque()  # Gerbes d'effet en attente (x, y, couleur, particules restantes)
+        self.deferred_tasks = {}     # Travaux reportés après l'affichage de la frame (nom -> fonction)
         self.animation_time = 0      # Compteur global pour toutes les animations
         self.music_volume = 0.3      # Volume de la musique (0.0 à 1.0)
         self.sound_enabled = True    # État du son (activé/désactivé)
         self.show_options = False    # Affichage du panneau d'options
+        # Compteurs de la session (lus par le point de mesure HTTP, voir metrics.py)
+        self.stats = {"games_started": 0, "games_won": 0, "games_lost": 0,
+                      "guesses": 0, "hints_used": 0, "audio_errors": 0}
         
         # === SYSTÈME DE LETTRES TOMBANTES ===
-        self.falling_letters = []                    # Liste des lettres d'arrière-plan
+        # Tableaux NumPy dessinés en un lot si possible, sinon un objet par lettre
+        if FallingLetterField is not None:
+            self.falling_letters = FallingLetterField(
+                WINDOW_WIDTH, WINDOW_HEIGHT, FALLING_LETTER_COLORS,
+                lambda key: self.sprites.get(key).get_size())
+        else:
+            self.falling_letters = FallingLetterGroup()
         self.letter_font = pygame.font.Font(None, 48)  # Police pour les lettres tombantes
         
-        # Crée 25 lettres tombantes pour un effet dense
-        for _ in range(25):
-            self.falling_letters.append(FallingLetter())
+        # Crée les lettres tombantes selon le niveau de qualité choisi
+        self.quality = None
+        self.set_quality(quality)
+        
+        # === SPRITES ET SCÈNE DE RENDU ===
+        # Les sprites sont fabriqués une seule fois puis réutilisés par le moteur de rendu
+        self.sprites = SpriteCache()
+        self.sprites.register('glyph', lambda letter, color: self.letter_font.render(letter, True, color))
+        self.sprites.register('dot', make_dot_sprite)
+        # Sprites des lots de lettres tombantes : rotation et transparence pré-calculées
+        self.sprites.register('turned_glyph', lambda letter, color, angle, alpha: make_turned_glyph_sprite(
+            self.sprites.get(('glyph', letter, color)), angle, alpha))
+        self.sprites.register('faded_dot', make_faded_dot_sprite)
+        self.sprites.register('gradient', make_gradient_sprite)
+        self.sprites.register('panel', make_panel_sprite)
+        self.scene = Scene()          # Description de la frame, réutilisée
+        self.gear_coords = (0, 0, 0)  # Coordonnées de la roue dentée (mises à jour au dessin)
         
         # === INITIALISATION DES SYSTÈMES ===
-        self.init_audio()    # Configure le système audio
-        self.reset_game()    # Démarre une nouvelle partie
+        build_stickman_layers()  # Pré-rend les calques du pendu (0 à 10 erreurs)
+        self.init_audio(audio_buffer)  # Configure le système audio
+        if not (resume and self.resume_game()):
+            self.reset_game()    # Démarre une nouvelle partie
     
-    def init_word_database(self):
+    def init_word_database(self, dictionary=None):
         """
         Initialise une base de données étendue de mots français
         Organisée par catégories pour plus de variété
+        
+        Args:
+            dictionary: dictionnaire compilé ou base compacte qui remplace les catégories
+                intégrées (optionnel)
         """
         print("Chargement de la base de mots française étendue...")
         
-        # === MOTS PAR CATÉGORIES ===
-        # Dictionnaire avec des catégories thématiques
-        self.word_categories = {
-            "ANIMAUX": [
-                "ELEPHANT", "GIRAFE", "KANGOUROU", "CROCODILE", "PAPILLON", "RHINOCEROS",
-                "LEOPARD", "HIPPOPOTAME", "CHIMPANZE", "GORILLE", "ANTILOPE", "GAZELLE",
-                "CHAMEAU", "DROMADAIRE", "ZEBRE", "AUTRUCHE", "FLAMANT", "PELICAN",
-                "MANCHOT", "PINGOUIN", "PHOQUE", "BALEINE", "DAUPHIN", "REQUIN",
-                "PIEUVRE", "MEDUSE", "HOMARD", "CRABE", "TORTUE", "SERPENT",
-                "LEZARD", "GRENOUILLE", "SALAMANDRE", "LIBELLULE", "COCCINELLE",
-                "ESCARGOT", "ARAIGNEE", "FOURMI", "ABEILLE", "GUEPE", "MOUCHE",
-                "MOUSTIQUE", "CHENILLE", "SCARABEE", "SAUTERELLE"
-            ],
-            "PAYS": [
-                "FRANCE", "ESPAGNE", "ITALIE", "ALLEMAGNE", "PORTUGAL", "GRECE",
-                "NORVEGE", "SUEDE", "DANEMARK", "FINLANDE", "ISLANDE", "IRLANDE",
-                "ECOSSE", "ANGLETERRE", "BELGIQUE", "SUISSE", "AUTRICHE",
-                "POLOGNE", "HONGRIE", "ROUMANIE", "BULGARIE", "CROATIE",
-                "JAPON", "CHINE", "COREE", "THAILANDE", "VIETNAM", "CAMBODGE",
-                "INDE", "PAKISTAN", "BANGLADESH", "NEPAL", "BHOUTAN",
-                "AUSTRALIE", "FIDJI", "VANUATU", "SAMOA", "TONGA",
-                "CANADA", "MEXIQUE", "GUATEMALA", "COSTA-RICA", "PANAMA",
-                "BRESIL", "ARGENTINE", "CHILI", "PEROU", "COLOMBIE", "VENEZUELA",
-                "EGYPTE", "MAROC", "ALGERIE", "TUNISIE", "LIBYE", "SOUDAN",
-                "KENYA", "TANZANIE", "OUGANDA", "RWANDA", "ETHIOPIE", "GHANA",
-                "RUSSIE", "UKRAINE", "BELARUS", "LITUANIE", "LETTONIE", "ESTONIE"
-            ],
-            "NOURRITURE": [
-                "BAGUETTE", "CROISSANT", "BRIOCHE", "PAIN", "FROMAGE", "CAMEMBERT",
-                "ROQUEFORT", "GRUYERE", "EMMENTAL", "BRIE", "CHEVRE", "YAOURT",
-                "CREPE", "GAUFFRE", "MACARON", "ECLAIR", "PROFITEROLE", "MADELEINE",
-                "RATATOUILLE", "BOUILLABAISSE", "CASSOULET", "COUSCOUS", "PAELLA",
-                "PIZZA", "LASAGNE", "SPAGHETTI", "RAVIOLI", "GNOCCHI", "RISOTTO",
-                "SUSHI", "SASHIMI", "TEMPURA", "RAMEN", "YAKITORI", "MISO",
-                "HAMBURGER", "SANDWICH", "SALADE", "SOUPE", "POTAGE", "VELOUTE",
-                "POMME", "POIRE", "BANANE", "ORANGE", "CITRON", "PAMPLEMOUSSE",
-                "FRAISE", "FRAMBOISE", "MYRTILLE", "CASSIS", "GROSEILLE", "CERISE",
-                "PECHE", "ABRICOT", "PRUNE", "RAISIN", "MELON", "PASTEQUE",
-                "ANANAS", "MANGUE", "KIWI", "PASSION", "LITCHI", "PAPAYE",
-                "CHOCOLAT", "BONBON", "CARAMEL", "NOUGAT", "PRALINE", "TRUFFE"
-            ],
-            "METIERS": [
-                "MEDECIN", "INFIRMIERE", "CHIRURGIEN", "DENTISTE", "PHARMACIEN",
-                "VETERINAIRE", "PROFESSEUR", "INSTITUTEUR", "DIRECTEUR", "SECRETAIRE",
-                "AVOCAT", "JUGE", "NOTAIRE", "HUISSIER", "COMMISSAIRE", "POLICIER",
-                "POMPIER", "AMBULANCIER", "PILOTE", "STEWARD", "CAPITAINE", "MARIN",
-                "CUISINIER", "SERVEUR", "BARMAN", "PATISSIER", "BOULANGER", "BOUCHER",
-                "POISSONNIER", "EPICIER", "CAISSIER", "VENDEUR", "COMMERCIAL", "BANQUIER",
-                "COMPTABLE", "ECONOMISTE", "INGENIEUR", "ARCHITECTE", "DESIGNER", "ARTISTE",
-                "PEINTRE", "SCULPTEUR", "MUSICIEN", "CHANTEUR", "DANSEUR", "ACTEUR",
-                "JOURNALISTE", "PHOTOGRAPHE", "CAMERAMAN", "MONTEUR", "REALISATEUR",
-                "ELECTRICIEN", "PLOMBIER", "MENUISIER", "MAÇON", "COUVREUR", "JARDINIER"
-            ],
-            "OBJETS": [
-                "ORDINATEUR", "TELEPHONE", "TABLETTE", "CLAVIER", "SOURIS", "ECRAN",
-                "IMPRIMANTE", "SCANNER", "APPAREIL-PHOTO", "CAMERA", "TELEVISION",
-                "REFRIGERATEUR", "LAVE-LINGE", "LAVE-VAISSELLE", "ASPIRATEUR", "MICRO-ONDE",
-                "VOITURE", "BICYCLETTE", "MOTOCYCLETTE", "AUTOBUS", "TRAMWAY", "METRO",
-                "AVION", "HELICOPTERE", "BATEAU", "YACHT", "SOUS-MARIN", "FUSEE",
-                "MONTRE", "COLLIER", "BRACELET", "BAGUE", "BOUCLES-OREILLES", "LUNETTES",
-                "PARAPLUIE", "SAC", "VALISE", "PORTEFEUILLE", "CLES", "TELEPHONE",
-                "LIVRE", "MAGAZINE", "JOURNAL", "CAHIER", "STYLO", "CRAYON",
-                "GOMME", "REGLE", "CALCULATRICE", "DICTIONNAIRE", "ATLAS", "CARTE",
-                "CHAISE", "TABLE", "ARMOIRE", "COMMODE", "ETAGERE", "BIBLIOTHEQUE",
-                "LAMPE", "MIROIR", "RIDEAU", "TAPIS", "COUSSIN", "COUVERTURE"
-            ],
-            "SPORTS": [
-                "FOOTBALL", "BASKETBALL", "VOLLEYBALL", "HANDBALL", "RUGBY", "TENNIS",
-                "BADMINTON", "PING-PONG", "SQUASH", "GOLF", "BASEBALL", "CRICKET",
-                "NATATION", "PLONGEE", "SURF", "VOILE", "AVIRON", "CANOE",
-                "CYCLISME", "COURSE", "MARATHON", "TRIATHLON", "ATHLETISME", "SAUT",
-                "LANCER", "MUSCULATION", "BOXE", "KARATE", "JUDO", "TAEKWONDO",
-                "ESCRIME", "ARCHERIE", "TIR", "EQUITATION", "POLO", "DRESSAGE",
-                "SKI", "SNOWBOARD", "PATINAGE", "HOCKEY", "LUGE", "BOBSLEIGH",
-                "ESCALADE", "ALPINISME", "RANDONNEE", "CAMPING", "PECHE", "CHASSE",
-                "PARAPENTE", "DELTAPLANE", "PARACHUTISME", "BUNGEE", "RAFTING"
-            ],
-            "SCIENCE": [
-                "PHYSIQUE", "CHIMIE", "BIOLOGIE", "MATHEMATIQUES", "ASTRONOMIE",
-                "GEOLOGIE", "METEOROLOGIE", "OCEANOGRAPHIE", "BOTANIQUE", "ZOOLOGIE",
-                "ANATOMIE", "PHYSIOLOGIE", "GENETIQUE", "EVOLUTION", "ECOLOGIE",
-                "MOLECULE", "ATOME", "ELECTRON", "PROTON", "NEUTRON", "PHOTON",
-                "TELESCOPE", "MICROSCOPE", "LABORATOIRE", "EXPERIENCE", "HYPOTHESE",
-                "PLANETE", "ETOILE", "GALAXIE", "COMETE", "ASTEROIDE", "METEORITE",
-                "VOLCAN", "SEISME", "TSUNAMI", "OURAGAN", "TORNADE", "CYCLONE"
-            ],
-            "MUSIQUE": [
-                "PIANO", "GUITARE", "VIOLON", "VIOLONCELLE", "CONTREBASSE", "HARPE",
-                "FLUTE", "CLARINETTE", "SAXOPHONE", "TROMPETTE", "TROMBONE", "TUBA",
-                "BATTERIE", "TAMBOUR", "CYMBALE", "TRIANGLE", "XYLOPHONE", "ACCORDEON",
-                "HARMONICA", "BANJO", "MANDOLINE", "UKULELE", "SYNTHESISEUR", "ORGUE",
-                "CONCERT", "ORCHESTRA", "SYMPHONIE", "OPERA", "CHORALE", "MELODIE",
-                "RYTHME", "HARMONIE", "PARTITION", "PORTEE", "CLEF", "NOTE"
-            ]
-        }
-        
-        # === MOTS PAR NIVEAU DE DIFFICULTÉ ===
-        # Séparation par difficulté croissante pour adapter le défi
-        self.difficulty_words = {
-            "FACILE": [
-                "CHAT", "CHIEN", "MAISON", "VOITURE", "PAIN", "EAU", "FEU", "SOLEIL",
-                "LUNE", "ETOILE", "FLEUR", "ARBRE", "OISEAU", "POISSON", "LIVRE",
-                "TABLE", "CHAISE", "LIT", "PORTE", "FENETRE", "ROUGE", "BLEU",
-                "VERT", "JAUNE", "NOIR", "BLANC", "GRAND", "PETIT", "JOUR", "NUIT",
-                "MAIN", "PIED", "TETE", "COEUR", "YEUX", "NEZ", "BOUCHE", "OREILLE",
-                "BRAS", "JAMBE", "DOS", "VENTRE", "CHEVEUX", "DENT", "ONGLE"
-            ],
-            "MOYEN": [
-                "ORDINATEUR", "TELEPHONE", "REFRIGERATEUR", "TELEVISION", "PHARMACIE",
-                "RESTAURANT", "UNIVERSITE", "BIBLIOTHEQUE", "HOPITAL", "AEROPORT",
-                "PARAPLUIE", "CHOCOLAT", "SANDWICH", "PROGRAMME", "ALPHABET",
-                "DICTIONNAIRE", "PROBLEME", "SOLUTION", "QUESTION", "REPONSE",
-                "MONTAGNE", "RIVIERE", "OCEAN", "DESERT", "FORET", "PRAIRIE",
-                "VILLAGE", "QUARTIER", "AVENUE", "BOULEVARD", "CARREFOUR", "PARKING"
-            ],
-            "DIFFICILE": [
-                "EXTRATERRESTRE", "HIPPOPOTAME", "CHRYSANTHEME", "PSYCHOLOGIE",
-                "PHILOSOPHIE", "ARCHITECTURE", "PHOTOGRAPHIE", "GEOGRAPHIE",
-                "ORTHOGRAPHE", "SYNONYME", "ACRONYME", "PALINDROME", "ANAGRAMME",
-                "ONOMATOPEE", "METAPHORE", "ALLEGORIE", "OXYMORON", "EUPHEMISME",
-                "CACOPHONIE", "POLYPHONIE", "XENOPHOBIE", "CLAUSTROPHOBIE",
-                "AGORAPHOBIE", "PHILANTHROPE", "MISANTHROPE", "HYPERBOLE"
-            ]
+        # === MOTS PAR CATÉGORIES ET PAR NIVEAU DE DIFFICULTÉ ===
+        # Les listes sont définies une seule fois dans dictionary.py (module sans pygame)
+        self.word_categories = WORD_CATEGORIES
+        self.difficulty_words = DIFFICULTY_WORDS
+        if dictionary is not None and is_word_store(dictionary):
+            # Base compacte (wordstore.py) : catégories et niveaux mesurés déjà étiquetés
+            store = WordStore.load(dictionary)
+            self.word_categories = store.category_views()
+            self.difficulty_bands = store.level_views()
+        elif dictionary is not None:
+            # Catégories importées avec importer.py ; les scores de difficulté d'un grand
+            # dictionnaire prennent plusieurs secondes : niveaux fixés à la main en attendant
+            self.word_categories = load_compiled_dictionary(dictionary)
+            self.difficulty_bands = None
+            self.start_difficulty_process()
+        else:
+            # === BANDES DE DIFFICULTÉ MESURÉE ===
+            # Mots classés selon les erreurs d'un joueur automatique (cache du dictionnaire)
+            self.difficulty_bands = load_difficulty_bands()
+        
+        # === TIRAGE DES MOTS ===
+        # Listes pondérées par leur taille, aucun mot ne revient avant que sa liste soit épuisée
+        # (l'état des sacs est enregistré pour survivre à un redémarrage)
+        self.word_samplers = {
+            "categories": WordSampler(self.word_categories),
+            "difficulty": WordSampler(self.difficulty_bands or self.difficulty_words),
         }
+        self.sampler_journal = SamplerJournal(self.sampler_state_path)  # Un tirage = une ligne, état complet réécrit de temps en temps
+        try:
+            self.sampler_journal.load(self.word_samplers)
+        except OSError as e:
+            print(f"Impossible d'enregistrer l'état du tirage: {e}")
+        self.init_snapshot_codec()
         
         # === STATISTIQUES DE LA BASE ===
         # Calcule et affiche le nombre total de mots disponibles
@@ -615,30 +1157,110 @@ class HangmanDeluxe:
         total_difficulty = sum(len(words) for words in self.difficulty_words.values())
         print(f"Base chargée: {total_words + total_difficulty} mots français !")
     
+    def start_difficulty_process(self):
+        """
+        Lance le calcul des bandes de difficulté des catégories actuelles hors du jeu
+        (python difficulty.py --words ... prépare le cache à l'avance)
+        """
+        if self.difficulty_process is not None:
+            self.difficulty_process.close()
+        words = [word for category in self.word_categories.values() for word in category]
+        self.difficulty_process = DifficultyProcess(words)
+        print("Difficulté des mots mesurée en arrière-plan (niveaux fixes en attendant)")
+    
+    def apply_difficulty_bands(self):
+        """
+        Installe les bandes de difficulté calculées en arrière-plan si elles sont prêtes
+        (entre deux parties uniquement)
+        """
+        if self.difficulty_process is None:
+            return
+        bands = self.difficulty_process.poll()
+        if self.difficulty_process.receiver is None:
+            self.difficulty_process = None  # Calcul terminé (ou échoué)
+        if not bands:
+            return
+        self.difficulty_bands = bands
+        self.word_samplers["difficulty"] = rebuild_sampler(self.word_samplers["difficulty"], bands)
+        self.init_snapshot_codec()
+        print(f"Difficulté mesurée prête: {sum(len(words) for words in bands.values())} mots")
+    
+    def init_snapshot_codec(self):
+        """
+        Prépare l'encodage des parties avec les identifiants des listes de mots
+        (les libellés sont ceux que get_word_to_guess affiche)
+        """
+        pools = dict(self.word_categories)
+        for name, words in (self.difficulty_bands or self.difficulty_words).items():
+            pools[f"NIVEAU {name}"] = words
+        self.snapshot_codec = SnapshotCodec(pools)
+    
     def get_word_to_guess(self):
         """
         Sélectionne un mot à deviner selon une logique de probabilité
-        70% par catégorie thématique, 30% par niveau de difficulté
+        70% par catégorie thématique, 30% par niveau de difficulté mesurée
         
         Returns:
             tuple: (mot_choisi, catégorie_ou_niveau)
         """
         if random.random() < 0.7:  # 70% de chance
             # Sélection par catégorie thématique
-            category = random.choice(list(self.word_categories.keys()))
-            word = random.choice(self.word_categories[category])
-            return word, category
+            word, label = self.word_samplers["categories"].draw()
         else:  # 30% de chance
-            # Sélection par niveau de difficulté
-            difficulty = random.choice(list(self.difficulty_words.keys()))
-            word = random.choice(self.difficulty_words[difficulty])
-            return word, f"NIVEAU {difficulty}"
+            # Sélection par bande de difficulté mesurée (niveaux fixés à la main à défaut)
+            word, difficulty = self.word_samplers["difficulty"].draw()
+            label = f"NIVEAU {difficulty}"
+        
+        # L'écriture sur le disque attend que la nouvelle partie soit affichée
+        self.defer("sampler_state", self.save_sampler_state)
+        return word, label
+    
+    def save_sampler_state(self):
+        """
+        Enregistre les tirages faits depuis le dernier enregistrement (journal des sacs)
+        """
+        try:
+            self.sampler_journal.flush(self.word_samplers)
+        except OSError as e:
+            print(f"Impossible d'enregistrer l'état du tirage: {e}")
+    
+    def defer(self, name, task):
+        """
+        Reporte un travail après l'affichage de la frame en cours (une seule fois par nom)
+        Une touche ne fait ainsi attendre sa frame que pour le changement d'état lui-même
+        
+        Args:
+            name: nom du travail (un travail déjà en attente n'est pas dupliqué)
+            task: fonction sans argument
+        """
+        self.deferred_tasks[name] = task
     
-    def init_audio(self):
+    def run_deferred(self):
+        """
+        Exécute les travaux reportés (appelé après renderer.present() et à la sortie)
+        """
+        while self.deferred_tasks:
+            name = next(iter(self.deferred_tasks))
+            self.deferred_tasks.pop(name)()
+    
+    def init_audio(self, buffer=DEFAULT_BUFFER):
         """
         Initialise le système audio complet du jeu
         Charge la musique de fond et crée les effets sonores
+        
+        Args:
+            buffer: taille du tampon du mixeur en échantillons
         """
+        # === DÉMARRAGE DU MIXEUR (À LA DEMANDE) ===
+        self.audio = None  # Moteur des effets (absent si le mixeur ne démarre pas)
+        try:
+            init_mixer(buffer)  # Petit tampon : le son suit la touche de près
+        except pygame.error as e:
+            print(f"Audio indisponible: {e}")
+            self.stats["audio_errors"] += 1
+            self.sounds = {}  # Le jeu continue sans son
+            return
+        
         try:
             # === CHARGEMENT DE LA MUSIQUE DE FOND ===
             # Chemin où chercher les fichiers audio
@@ -660,9 +1282,13 @@ class HangmanDeluxe:
             
         except Exception as e:
             print(f"Erreur audio: {e}")
+            self.stats["audio_errors"] += 1
             # En cas d'erreur, utilise les solutions de secours
             self.create_fallback_music()
             self.create_sound_effects()
+        
+        # Canaux réservés par catégorie d'effet, vol de voix et anti-rebond
+        self.audio = AudioEngine(self.sounds, buffer)
     
     def create_fallback_music(self):
         """
@@ -827,36 +1453,25 @@ class HangmanDeluxe:
             traceback.print_exc()  # Affiche la trace complète de l'erreur
             self.sounds = {}
     
-    def play_sound(self, sound_name):
+    def play_sound(self, sound_name, triggered_at=None):
         """
-        Joue un effet sonore spécifique
+        Joue un effet sonore spécifique sur les canaux réservés à sa catégorie
+        Rien n'est affiché quand tout va bien : la console ralentirait chaque frappe
         
         Args:
             sound_name: nom du son à jouer ('victory', 'error', 'correct', 'defeat')
+            triggered_at: instant de l'appui de touche (time.perf_counter()) pour
+                mesurer la latence (optionnel)
         """
         # === VÉRIFICATIONS PRÉALABLES ===
-        if not self.sound_enabled:
-            print(f"Son désactivé - {sound_name} non joué")
-            return
-            
-        if not hasattr(self, 'sounds'):
-            print("Aucun système de sons disponible")
-            return
-            
-        if sound_name not in self.sounds:
-            print(f"Son {sound_name} non trouvé dans {list(self.sounds.keys())}")
-            return
-            
-        if self.sounds[sound_name] is None:
-            print(f"Son {sound_name} est None")
+        if not self.sound_enabled or self.audio is None:
             return
             
         # === LECTURE DU SON ===
         try:
-            print(f"Tentative de lecture du son: {sound_name}")
-            self.sounds[sound_name].play()
-            print(f"Son {sound_name} joué avec succès")
+            self.audio.play(sound_name, triggered_at)
         except Exception as e:
+            self.stats["audio_errors"] += 1
             print(f"Erreur lors de la lecture du son {sound_name}: {e}")
             import traceback
             traceback.print_exc()
@@ -876,73 +1491,177 @@ class HangmanDeluxe:
         is_correct_letter = letter_typed in self.word_to_guess
         explosion_color = GREEN if is_correct_letter else RED
         
-        print(f"Recherche de lettres '{letter_typed}' qui tombent...")
-        
         # === RECHERCHE ET EXPLOSION DES LETTRES IDENTIQUES ===
-        explosion_count = 0
-        for falling_letter in self.falling_letters:
-            if falling_letter.letter == letter_typed:
-                explosion_count += 1
-                print(f"Explosion de la lettre {letter_typed} à la position ({falling_letter.x}, {falling_letter.y})")
-                
-                # === CRÉATION DE L'EXPLOSION DE PARTICULES ===
-                for _ in range(15):  # 15 particules par explosion
-                    # Vitesses aléatoires dans toutes les directions
-                    velocity_x = random.uniform(-5, 5)
-                    velocity_y = random.uniform(-8, -2)  # Principalement vers le haut
-                    
-                    # Ajoute la particule avec position légèrement aléatoire
-                    self.particles.append(Particle(
-                        falling_letter.x + random.randint(-10, 10),
-                        falling_letter.y + random.randint(-10, 10),
-                        explosion_color,
-                        (velocity_x, velocity_y)
-                    ))
-                
-                # === RÉINITIALISATION DE LA LETTRE EXPLOSÉE ===
-                # Remet la lettre en haut avec de nouvelles propriétés
-                falling_letter.y = random.randint(-200, -50)
-                falling_letter.x = random.randint(0, WINDOW_WIDTH)
-                falling_letter.letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-                falling_letter.color = random.choice([LIGHT_BLUE, PURPLE, PINK, GREEN, YELLOW, WHITE])
-                falling_letter.speed = random.uniform(1, 4)
-                falling_letter.size = random.randint(32, 64)
-                falling_letter.alpha = random.randint(200, 255)
-                # Nettoie les effets visuels
-                falling_letter.trail_positions.clear()
-                falling_letter.particles.clear()
-        
-        # === RAPPORT DE L'EXPLOSION ===
-        if explosion_count > 0:
-            couleur_nom = 'VERTE' if is_correct_letter else 'ROUGE'
-            print(f"💥 {explosion_count} lettre(s) {letter_typed} ont explosé avec couleur {couleur_nom}!")
-        else:
-            print(f"Aucune lettre {letter_typed} ne tombait à l'écran")
-        
+        # Les lettres concernées sont remises en haut avec de nouvelles propriétés
+        positions = self.falling_letters.explode(letter_typed)
+        explosion_count = len(positions)
+        for x, y in positions:
+            # === MISE EN ATTENTE DE L'EXPLOSION DE PARTICULES ===
+            # Les particules sont créées progressivement par update() pour garder la frappe fluide
+            self.queue_burst(x, y, explosion_color, self.quality_settings["explosion_particles"])
+        
+        # Pas de rapport dans la console : une écriture par touche ralentit la frappe
         return explosion_count
     
+    def queue_burst(self, x, y, color, count):
+        """
+        Met en attente une explosion de particules à créer lors des prochaines frames
+        
+        Args:
+            x, y: centre de l'explosion
+            color: couleur des particules
+            count: nombre de particules de l'explosion
+        """
+        # Limite la file d'attente pour qu'une rafale de frappes ne s'accumule pas indéfiniment
+        if self.pending_burst_particles + count > MAX_PENDING_BURST_PARTICLES:
+            return
+        self.pending_bursts.append([x, y, color, count])
+        self.pending_burst_particles += count
+    
+    def spawn_pending_bursts(self):
+        """
+        Crée les particules d'explosion en attente, dans la limite du budget par frame
+        Une grosse explosion est ainsi étalée sur plusieurs frames
+        """
+        budget = MAX_BURST_PARTICLES_PER_FRAME
+        while self.pending_bursts and budget > 0:
+            burst = self.pending_bursts[0]
+            x, y, color, remaining = burst
+            spawned = min(remaining, budget)
+            
+            for _ in range(spawned):
+                # Vitesses aléatoires dans toutes les directions
+                velocity_x = random.uniform(-5, 5)
+                velocity_y = random.uniform(-8, -2)  # Principalement vers le haut
+                
+                # Ajoute la particule avec position légèrement aléatoire
+                self.particles.append(Particle(
+                    x + random.randint(-10, 10),
+                    y + random.randint(-10, 10),
+                    color,
+                    (velocity_x, velocity_y)
+                ))
+            
+            budget -= spawned
+            self.pending_burst_particles -= spawned
+            if spawned == remaining:
+                self.pending_bursts.popleft()  # Explosion terminée
+            else:
+                burst[3] = remaining - spawned  # Reste à créer à la frame suivante
+    
+    def poll_dictionary(self):
+        """
+        Vérifie si le fichier du dictionnaire a changé (appelé à chaque tour de boucle,
+        la lecture se fait hors du fil du jeu)
+        """
+        if self.dictionary_reloader is not None:
+            self.dictionary_reloader.poll()
+    
+    def apply_dictionary_update(self):
+        """
+        Installe le dictionnaire rechargé s'il est prêt (entre deux parties uniquement :
+        le mot en cours reste le même)
+        """
+        if self.dictionary_reloader is None:
+            return
+        update = self.dictionary_reloader.take()
+        if update is None:
+            return
+        self.word_categories = update.categories
+        self.difficulty_bands = update.difficulty_bands
+        if update.difficulty_bands is None:
+            self.start_difficulty_process()  # Dictionnaire importé : bandes calculées à part
+        self.word_samplers = {
+            "categories": rebuild_sampler(self.word_samplers["categories"], self.word_categories),
+            "difficulty": rebuild_sampler(self.word_samplers["difficulty"],
+                                          self.difficulty_bands or self.difficulty_words),
+        }
+        self.init_snapshot_codec()
+        print(f"Dictionnaire rechargé: +{len(update.added)} / -{len(update.removed)} mots, "
+              f"{len(update.changed)} catégorie(s) modifiée(s)")
+    
     def reset_game(self):
         """
         Remet le jeu à zéro pour commencer une nouvelle partie
         Sélectionne un nouveau mot et réinitialise tous les états
         """
+        self.apply_dictionary_update()  # Dictionnaire rechargé pendant la partie précédente
+        self.apply_difficulty_bands()    # Scores calculés en arrière-plan
+        
         # === SÉLECTION DU NOUVEAU MOT ===
-        word_and_category = self.get_word_to_guess()
-        self.word_to_guess = word_and_category[0]  # Le mot à deviner
-        self.category = word_and_category[1]       # Sa catégorie
+        self.start_game(*self.get_word_to_guess())
+    
+    def start_game(self, word, category):
+        """
+        Commence une partie avec un mot donné (utilisé par reset_game et par les outils
+        qui rejouent une suite de mots fixée, comme capture.py)
+        
+        Args:
+            word: mot à deviner
+            category: catégorie ou niveau affiché
+        """
+        self.word_to_guess = word      # Le mot à deviner
+        self.category = category       # Sa catégorie
+        # Glyphes pré-rendus du mot pour l'affichage
+        self.word_display = WordDisplay(self.word_to_guess, self.medium_font)
         
         # === RÉINITIALISATION DES VARIABLES DE JEU ===
         self.guessed_letters = set()     # Lettres déjà proposées
         self.wrong_letters = set()       # Lettres incorrectes uniquement
         self.penalties = 0               # Nombre d'erreurs
-        self.max_penalties = 10          # Maximum autorisé
+        self.max_penalties = MAX_PENALTIES  # Maximum autorisé
         self.game_over = False           # État de fin de jeu
         self.won = False                 # Victoire ou défaite
         self.show_category_hint = False  # Affichage de l'indice de catégorie
         self.hints_used = 0              # Nombre d'indices utilisés
+        self.game_over_screen = None     # Écran de fin composé à la fin de la partie
+        self.stats["games_started"] += 1
         
         print(f"Nouveau mot: {self.word_to_guess} (Catégorie: {self.category})")
     
+    def snapshot(self):
+        """
+        Fige la partie en cours
+        
+        Returns:
+            GameSnapshot ou None: None si la partie est terminée (rien à reprendre)
+        """
+        if self.game_over:
+            return None
+        return GameSnapshot(self.word_to_guess, self.category, frozenset(self.guessed_letters),
+                            self.penalties, self.hints_used, self.game_over, self.won,
+                            self.show_category_hint)
+    
+    def save_game(self):
+        """
+        Enregistre la partie en cours pour la reprendre au prochain lancement
+        """
+        try:
+            save_snapshot(self.snapshot_codec, self.snapshot())
+        except (OSError, ValueError) as e:
+            print(f"Impossible d'enregistrer la partie: {e}")
+    
+    def resume_game(self):
+        """
+        Reprend la partie enregistrée par save_game
+        
+        Returns:
+            bool: True si une partie a été reprise
+        """
+        snapshot = load_snapshot(self.snapshot_codec)
+        if snapshot is None or snapshot.game_over:
+            return False
+        self.start_game(snapshot.word, snapshot.category)
+        self.guessed_letters = set(snapshot.guessed_letters)
+        self.wrong_letters = self.guessed_letters - set(snapshot.word)
+        self.penalties = snapshot.penalties
+        self.hints_used = snapshot.hints_used
+        self.show_category_hint = snapshot.category_hint
+        for letter in self.guessed_letters:
+            self.word_display.reveal(letter)
+        print(f"Partie reprise: {masked_pattern(self.word_to_guess, self.guessed_letters)}")
+        return True
+    
     def give_hint(self):
         """
         Système d'indices qui révèle des lettres contre une pénalité
@@ -952,32 +1671,24 @@ class HangmanDeluxe:
         if self.game_over:  # Pas d'indice si le jeu est terminé
             return
         
-        # === DÉTERMINATION DU NOMBRE DE LETTRES À RÉVÉLER ===
-        letters_to_reveal = 1 if len(self.word_to_guess) < 6 else 2
-        
-        # === RECHERCHE DES LETTRES NON DEVINÉES ===
-        unrevealed_letters = []
-        for letter in set(self.word_to_guess):  # set() évite les doublons
-            if letter not in self.guessed_letters:
-                unrevealed_letters.append(letter)
+        # === RÉVÉLATION ALÉATOIRE DES LETTRES ===
+        # Choisit aléatoirement 1 ou 2 lettres non révélées (règle partagée, voir rules.py)
+        letters_revealed = hint_letters(self.word_to_guess, self.guessed_letters)
         
         # Vérification de sécurité
-        if not unrevealed_letters:
+        if not letters_revealed:
             print("Toutes les lettres sont déjà révélées !")
             return
         
-        # === RÉVÉLATION ALÉATOIRE DES LETTRES ===
-        # Choisit aléatoirement parmi les lettres non révélées
-        letters_revealed = random.sample(unrevealed_letters, 
-                                       min(letters_to_reveal, len(unrevealed_letters)))
-        
         # Ajoute les lettres révélées aux lettres devinées
         for letter in letters_revealed:
             self.guessed_letters.add(letter)
+            self.word_display.reveal(letter)
         
         # === APPLICATION DU MALUS ===
-        self.penalties += 5  # Pénalité pour avoir utilisé un indice
+        self.penalties += HINT_PENALTY  # Pénalité pour avoir utilisé un indice
         self.hints_used += 1  # Compteur d'indices
+        self.stats["hints_used"] += 1
         
         # === AFFICHAGE DE L'INDICE ===
         if len(letters_revealed) == 1:
@@ -986,21 +1697,20 @@ class HangmanDeluxe:
             print(f"INDICE: Lettres révélées: {', '.join(letters_revealed)} (+5 pénalités)")
         
         # === VÉRIFICATION DE VICTOIRE AVEC INDICE ===
-        if all(letter in self.guessed_letters for letter in self.word_to_guess):
+        if is_solved(self.word_to_guess, self.guessed_letters):
             self.won = True
             self.game_over = True
+            self.stats["games_won"] += 1
             print("VICTOIRE AVEC INDICE - Lancement du son de victoire")
             self.play_sound('victory')
             
             # Explosion de particules colorées pour célébrer
-            for _ in range(50):
-                colors = [YELLOW, LIGHT_BLUE, PURPLE, PINK, GREEN]
-                self.add_particles(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, 
-                                 random.choice(colors))
+            self.celebrate_victory()
         
         # === VÉRIFICATION DE DÉFAITE PAR MALUS ===
         elif self.penalties >= self.max_penalties:
             self.game_over = True
+            self.stats["games_lost"] += 1
             print("DEFAITE PAR INDICE - Lancement du son de défaite")
             self.play_sound('defeat')
     
@@ -1024,6 +1734,8 @@ class HangmanDeluxe:
                 self.background_music.stop()
             else:
                 pygame.mixer.music.pause()
+            if self.audio is not None:
+                self.audio.stop()  # Coupe aussi les effets en cours
     
     def adjust_volume(self, delta):
         """
@@ -1208,6 +1920,63 @@ class HangmanDeluxe:
         
         return False  # Aucun élément d'option cliqué
     
+    def set_quality(self, level):
+        """
+        Applique un niveau de qualité : ajuste le nombre de lettres tombantes,
+        la longueur des traînées et la densité des explosions
+        
+        Args:
+            level: nom du niveau ('low', 'medium', 'high' ou 'ultra')
+        """
+        if level not in QUALITY_PRESETS:
+            raise ValueError(f"Niveau de qualité inconnu: {level}")
+        
+        self.quality = level
+        self.quality_settings = QUALITY_PRESETS[level]
+        
+        # === AJUSTEMENT DES LETTRES TOMBANTES ===
+        self.falling_letters.set_trail_length(self.quality_settings["trail_length"])
+        self.falling_letters.set_sparkles(self.quality_settings["letter_sparkles"])
+        self.falling_letters.resize(self.quality_settings["falling_letters"])
+    
+    def celebrate_victory(self):
+        """
+        Lance les gerbes de particules colorées de l'écran de victoire
+        """
+        colors = [YELLOW, LIGHT_BLUE, PURPLE, PINK, GREEN]
+        for _ in range(self.quality_settings["victory_bursts"]):
+            self.queue_effect(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2,
+                              random.choice(colors),
+                              self.quality_settings["victory_particles"])
+    
+    def queue_effect(self, x, y, color, count=10):
+        """
+        Met en attente des particules d'effet, créées par update() dans la limite
+        de MAX_EFFECT_PARTICLES_PER_FRAME (une rafale de touches reste légère)
+        
+        Args:
+            x, y: position où créer les particules
+            color: couleur des particules
+            count: nombre de particules
+        """
+        self.pending_effects.append([x, y, color, count])
+    
+    def spawn_pending_effects(self):
+        """
+        Crée les particules d'effet en attente, dans la limite du budget par frame
+        """
+        budget = MAX_EFFECT_PARTICLES_PER_FRAME
+        while self.pending_effects and budget > 0:
+            effect = self.pending_effects[0]
+            x, y, color, remaining = effect
+            spawned = min(remaining, budget)
+            self.add_particles(x, y, color, spawned)
+            budget -= spawned
+            if spawned == remaining:
+                self.pending_effects.popleft()
+            else:
+                effect[3] = remaining - spawned
+    
     def add_particles(self, x, y, color, count=10):
         """
         Ajoute des particules d'effet à une position donnée
@@ -1222,13 +1991,15 @@ class HangmanDeluxe:
             velocity = (random.uniform(-3, 3), random.uniform(-5, -1))
             self.particles.append(Particle(x, y, color, velocity))
     
-    def guess_letter(self, letter):
+    def guess_letter(self, letter, pressed_at=None):
         """
         Traite la proposition d'une lettre par le joueur
         Gère les explosions de lettres tombantes et les effets sonores
         
         Args:
             letter: lettre proposée (en majuscule)
+            pressed_at: instant de l'appui de touche (time.perf_counter()), transmis
+                au moteur audio pour la mesure de latence (optionnel)
             
         Returns:
             bool: True si la lettre était valide à proposer
@@ -1239,43 +2010,42 @@ class HangmanDeluxe:
         
         # === EXPLOSION DES LETTRES TOMBANTES ===
         # Fait exploser toutes les lettres identiques qui tombent
-        explosions = self.explode_falling_letters(letter)
-        if explosions > 0:
-            print(f"💥 {explosions} lettre(s) {letter} ont explosé !")
+        self.explode_falling_letters(letter)
         
         # === TRAITEMENT DE LA LETTRE ===
         self.guessed_letters.add(letter)  # Ajoute à la liste des lettres proposées
+        self.word_display.reveal(letter)  # Découvre la lettre dans l'affichage du mot
+        self.stats["guesses"] += 1
         
         if letter not in self.word_to_guess:  # === LETTRE INCORRECTE ===
             self.wrong_letters.add(letter)  # Ajoute aux lettres fausses
             self.penalties += 1             # Incrémente les erreurs
             # Effets visuels et sonores pour l'erreur
-            self.add_particles(WINDOW_WIDTH // 2, 300, RED)
-            self.play_sound('error')
+            self.queue_effect(WINDOW_WIDTH // 2, 300, RED)
+            self.play_sound('error', pressed_at)
         else:  # === LETTRE CORRECTE ===
             # Effets visuels et sonores pour le succès
-            self.add_particles(WINDOW_WIDTH // 2, 500, GREEN)
-            self.play_sound('correct')
+            self.queue_effect(WINDOW_WIDTH // 2, 500, GREEN)
+            self.play_sound('correct', pressed_at)
         
         # === VÉRIFICATION DE VICTOIRE ===
         # Vérifie si toutes les lettres du mot ont été devinées
-        if all(letter in self.guessed_letters for letter in self.word_to_guess):
+        if is_solved(self.word_to_guess, self.guessed_letters):
             self.won = True
             self.game_over = True
+            self.stats["games_won"] += 1
             print("VICTOIRE DETECTEE - Lancement du son de victoire")
-            self.play_sound('victory')
+            self.play_sound('victory', pressed_at)
             
             # Explosion de particules colorées pour célébrer
-            for _ in range(50):
-                colors = [YELLOW, LIGHT_BLUE, PURPLE, PINK, GREEN]
-                self.add_particles(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, 
-                                 random.choice(colors))
+            self.celebrate_victory()
         
         # === VÉRIFICATION DE DÉFAITE ===
         if self.penalties >= self.max_penalties:
             self.game_over = True
+            self.stats["games_lost"] += 1
             print("DEFAITE DETECTEE - Lancement du son de défaite")
-            self.play_sound('defeat')
+            self.play_sound('defeat', pressed_at)
         
         return True  # La lettre était valide
     
@@ -1292,26 +2062,78 @@ class HangmanDeluxe:
         for particle in self.particles:
             particle.update()
         
+        # Crée les particules d'effet et d'explosion en attente (budget limité par frame)
+        self.spawn_pending_effects()
+        self.spawn_pending_bursts()
+        
         # === MISE À JOUR DES LETTRES TOMBANTES ===
-        for letter in self.falling_letters:
-            letter.update()
+        self.falling_letters.update()
     
-    def draw(self, screen):
+    def build_scene(self):
         """
-        Dessine tout l'interface du jeu sur l'écran
+        Décrit la frame courante sous forme de scène, indépendamment du moteur de rendu
         Gère l'ordre de rendu pour les effets de profondeur
         
         Returns:
-            tuple: coordonnées de la roue dentée pour la détection de clic
+            Scene: scène de la frame (réutilisée d'une frame à l'autre)
         """
+        scene = self.scene
+        scene.clear()
+        
         # === ARRIÈRE-PLAN DÉGRADÉ ===
-        draw_gradient_background(screen)
+        scene.sprite(('gradient',), 0, 0)
         
         # === LETTRES TOMBANTES (ARRIÈRE-PLAN) ===
         # Dessine en premier pour qu'elles soient derrière tout le reste
-        for letter in self.falling_letters:
-            letter.draw(screen, self.letter_font)
+        self.falling_letters.add_to_scene(scene)
+        
+        # === FOND DU PANNEAU D'INFORMATIONS ===
+        # Panneau semi-transparent fixe : un seul sprite, son contenu est dans l'interface
+        scene.sprite(('panel', 300, 250, 150), INFO_PANEL_X, INFO_PANEL_Y)
+        
+        # === INTERFACE (TITRE, PENDU, MOT, INFORMATIONS, OPTIONS) ===
+        scene.layer(self.draw_interface)
+        
+        # === PARTICULES D'EFFETS ===
+        # Dessine toutes les particules actives par-dessus tout le reste
+        for particle in self.particles:
+            particle.add_to_scene(scene)
+        
+        # === MESSAGES DE FIN DE JEU ===
+        if self.game_over:
+            scene.layer(self.draw_game_over)
+        
+        return scene
+    
+    def render(self, renderer):
+        """
+        Dessine la frame avec le moteur de rendu choisi au démarrage
+        
+        Args:
+            renderer: SoftwareRenderer ou TextureRenderer (voir renderer.py)
+            
+        Returns:
+            tuple: coordonnées de la roue dentée pour la détection de clic
+        """
+        renderer.render(self.build_scene(), self.sprites)
+        return self.gear_coords
+    
+    def draw(self, screen):
+        """
+        Dessine tout l'interface du jeu sur une surface avec le rendu logiciel
+        
+        Returns:
+            tuple: coordonnées de la roue dentée pour la détection de clic
+        """
+        return self.render(SoftwareRenderer(screen))
+    
+    def draw_interface(self, screen):
+        """
+        Dessine l'interface : titre, pendu, mot à deviner, informations et options
         
+        Args:
+            screen: surface où dessiner
+        """
         # === TITRE PRINCIPAL AVEC EFFET BRILLANT ===
         # Couleur qui change dans le temps (cycle de 3 couleurs)
         title_color = [LIGHT_BLUE, PURPLE, PINK][int(self.animation_time * 0.02) % 3]
@@ -1319,12 +2141,14 @@ class HangmanDeluxe:
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 60))
         
         # === EFFET DE HALO BRILLANT ===
-        glow = pygame.Surface(title.get_size(), pygame.SRCALPHA)
-        glow.blit(title, (0, 0))
-        # Dessine plusieurs copies décalées pour l'effet de halo
-        for i in range(5):
-            glow_pos = (title_rect.x - i, title_rect.y - i)
-            screen.blit(glow, glow_pos)
+        glow_copies = self.quality_settings["title_glow"]
+        if glow_copies:  # Désactivé en qualité basse
+            glow = pygame.Surface(title.get_size(), pygame.SRCALPHA)
+            glow.blit(title, (0, 0))
+            # Dessine plusieurs copies décalées pour l'effet de halo
+            for i in range(glow_copies):
+                glow_pos = (title_rect.x - i, title_rect.y - i)
+                screen.blit(glow, glow_pos)
         screen.blit(title, title_rect)  # Titre principal par-dessus
         
         # === INDICE DE CATÉGORIE (si activé) ===
@@ -1336,26 +2160,23 @@ class HangmanDeluxe:
         draw_animated_stickman(screen, self.penalties, self.animation_time)
         
         # === MOT À DEVINER AVEC ANIMATIONS ===
-        draw_word_display(screen, self.word_to_guess, self.guessed_letters, 
-                         self.medium_font, self.animation_time)
+        self.word_display.draw(screen, self.animation_time)
         
-        # === PANNEAU D'INFORMATIONS ===
-        # Crée un panneau semi-transparent pour les informations de jeu
-        info_panel = pygame.Surface((300, 250), pygame.SRCALPHA)
-        pygame.draw.rect(info_panel, (*DARK_BLUE, 150), (0, 0, 300, 250), border_radius=15)
-        pygame.draw.rect(info_panel, WHITE, (0, 0, 300, 250), 2, border_radius=15)
+        # === CONTENU DU PANNEAU D'INFORMATIONS ===
+        # Le fond du panneau est un sprite de la scène, dessiné juste avant ce calque
+        panel_x, panel_y = INFO_PANEL_X, INFO_PANEL_Y
         
         # === COMPTEUR D'ERREURS AVEC BARRE DE PROGRESSION ===
         penalty_text = self.small_font.render("Erreurs:", True, WHITE)
-        info_panel.blit(penalty_text, (10, 10))
+        screen.blit(penalty_text, (panel_x + 10, panel_y + 10))
         
         # Barre de progression visuelle des erreurs
         bar_width = 200
         bar_height = 20
-        bar_x, bar_y = 10, 40
+        bar_x, bar_y = panel_x + 10, panel_y + 40
         
         # Fond gris de la barre
-        pygame.draw.rect(info_panel, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height), border_radius=10)
+        pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height), border_radius=10)
         
         if self.penalties > 0:  # Si il y a des erreurs
             # Calcule la largeur de progression
@@ -1369,96 +2190,186 @@ class HangmanDeluxe:
             else:
                 color = GREEN     # Ça va (vert)
                 
-            pygame.draw.rect(info_panel, color, (bar_x, bar_y, progress_width, bar_height), border_radius=10)
+            pygame.draw.rect(screen, color, (bar_x, bar_y, progress_width, bar_height), border_radius=10)
         
         # Texte avec le décompte précis
         penalty_count = self.small_font.render(f"{self.penalties}/{self.max_penalties}", True, WHITE)
-        info_panel.blit(penalty_count, (bar_x + bar_width + 10, bar_y - 5))
+        screen.blit(penalty_count, (bar_x + bar_width + 10, bar_y - 5))
         
         # === LETTRES INCORRECTES ===
         if self.wrong_letters:
             wrong_text = self.small_font.render("Lettres fausses:", True, RED)
-            info_panel.blit(wrong_text, (10, 80))
+            screen.blit(wrong_text, (panel_x + 10, panel_y + 80))
             
             # Affiche toutes les lettres fausses triées par ordre alphabétique
             wrong_display = " ".join(sorted(self.wrong_letters))
             wrong_letters_surf = self.small_font.render(wrong_display, True, WHITE)
-            info_panel.blit(wrong_letters_surf, (10, 110))
+            screen.blit(wrong_letters_surf, (panel_x + 10, panel_y + 110))
         
         # === COMPTEUR D'INDICES UTILISÉS ===
         hint_text = self.small_font.render(f"Indices: {self.hints_used}", True, YELLOW)
-        info_panel.blit(hint_text, (10, 140))
+        screen.blit(hint_text, (panel_x + 10, panel_y + 140))
         
         # === AIDE POUR LES INDICES ===
         if not self.game_over:
             hint_info = self.small_font.render("F4 = Indice (+5 pénalités)", True, GRAY)
-            info_panel.blit(hint_info, (10, 160))
-        
-        # Colle le panneau d'infos sur l'écran
-        screen.blit(info_panel, (650, 150))
+            screen.blit(hint_info, (panel_x + 10, panel_y + 160))
         
         # === PANNEAU D'OPTIONS ===
-        gear_x, gear_y, gear_radius = self.draw_options_panel(screen)
-        
-        # === PARTICULES D'EFFETS ===
-        # Dessine toutes les particules actives par-dessus tout le reste
-        for particle in self.particles:
-            particle.draw(screen)
+        self.gear_coords = self.draw_options_panel(screen)
+    
+    def draw_game_over(self, screen):
+        """
+        Dessine l'écran de fin de partie (victoire ou défaite) par-dessus la scène
+        L'écran est composé une seule fois à la fin de la partie puis réutilisé
+        jusqu'à reset_game()
         
-        # === MESSAGES DE FIN DE JEU ===
-        if self.game_over:
-            # === OVERLAY SEMI-TRANSPARENT ===
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(overlay, (0, 0, 0, 100), (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
-            screen.blit(overlay, (0, 0))
-            
-            if self.won:  # === ÉCRAN DE VICTOIRE ===
-                # Animation de pulsation pour "VICTOIRE!"
-                scale = 1 + math.sin(self.animation_time * 0.1) * 0.1  # ±10% de variation
-                
-                # Redimensionne dynamiquement le texte
-                original_size = self.big_font.size("VICTOIRE!")
-                scaled_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-                
-                win_text = pygame.transform.scale(
-                    self.big_font.render("VICTOIRE!", True, YELLOW),
-                    scaled_size
-                )
-                win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
-                screen.blit(win_text, win_rect)
-                
-                # Message de félicitations
-                congrats = self.medium_font.render("Félicitations!", True, GREEN)
-                screen.blit(congrats, (WINDOW_WIDTH // 2 - congrats.get_width() // 2, win_rect.bottom + 20))
-                
-            else:  # === ÉCRAN DE DÉFAITE ===
-                defeat_text = self.big_font.render("DÉFAITE!", True, RED)
-                defeat_rect = defeat_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
-                screen.blit(defeat_text, defeat_rect)
-                
-                # Révèle le mot correct
-                word_text = self.medium_font.render(f"Le mot était: {self.word_to_guess}", True, WHITE)
-                screen.blit(word_text, (WINDOW_WIDTH // 2 - word_text.get_width() // 2, defeat_rect.bottom + 20))
-            
-            # === INSTRUCTIONS POUR REJOUER ===
-            controls_text = self.small_font.render("F5 = Rejouer | F4 = Indice | F6 = Options | ESC = Quitter", True, LIGHT_BLUE)
-            screen.blit(controls_text, (WINDOW_WIDTH // 2 - controls_text.get_width() // 2, WINDOW_HEIGHT - 100))
+        Args:
+            screen: surface où dessiner
+        """
+        if self.game_over_screen is None:
+            self.game_over_screen = GameOverScreen(self.won, self.word_to_guess, self.big_font,
+                                                   self.medium_font, self.small_font)
+        self.game_over_screen.draw(screen, self.animation_time)
+
+def bootstrap():
+    """
+    Démarre uniquement les sous-systèmes pygame nécessaires à l'affichage
+    (vidéo, événements et polices). Importer ce module n'initialise rien :
+    les outils et les simulations peuvent l'importer sans ouvrir de périphérique.
+    Le mixeur audio est démarré plus tard, à la demande, par HangmanDeluxe.init_audio().
+    """
+    pygame.display.init()  # Vidéo et file d'événements
+    pygame.font.init()     # Rendu du texte
+
+def parse_args(argv=None):
+    """
+    Analyse les options de la ligne de commande
+    
+    Args:
+        argv: liste d'arguments (par défaut ceux du processus)
         
-        return gear_x, gear_y, gear_radius  # Coordonnées pour la détection de clic
+    Returns:
+        argparse.Namespace: options du jeu
+    """
+    parser = argparse.ArgumentParser(description="Pendu Deluxe")
+    parser.add_argument("--quality", choices=QUALITY_LEVELS, default=DEFAULT_QUALITY,
+                        help="niveau de qualité des effets (maximum en mode adaptatif)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="désactive l'ajustement automatique de la qualité")
+    parser.add_argument("--renderer", choices=RENDERER_BACKENDS, default="software",
+                        help="moteur de rendu (gpu = textures SDL2, repli logiciel si indisponible)")
+    parser.add_argument("--render-scale", type=float, choices=RENDER_SCALES, default=1.0,
+                        help="échelle de rendu du décor (texte et interface restent en pleine résolution)")
+    parser.add_argument("--scale-overlays", action="store_true",
+                        help="dessine aussi les particules en résolution réduite (sous l'interface)")
+    parser.add_argument("--smooth-upscale", action="store_true",
+                        help="agrandissement lissé du décor réduit (plus coûteux)")
+    parser.add_argument("--audio-buffer", type=int, default=DEFAULT_BUFFER, metavar="ECHANTILLONS",
+                        help="taille du tampon du mixeur (petit = son plus réactif, "
+                             "trop petit = craquements)")
+    parser.add_argument("--audio-latency", action="store_true",
+                        help="affiche la latence touche -> son à la sortie")
+    parser.add_argument("--input-latency", action="store_true",
+                        help="mesure la latence touche -> frame affichée (histogrammes à la sortie)")
+    parser.add_argument("--gc-tune", action="store_true",
+                        help="gèle les objets du démarrage (gc.freeze) et espace les collectes")
+    parser.add_argument("--gc-stats", action="store_true",
+                        help="compte les passages du ramasse-miettes par frame et signale les pauses trop longues")
+    parser.add_argument("--gc-budget", type=float, default=DEFAULT_GC_BUDGET_MS, metavar="MS",
+                        help="pause du ramasse-miettes tolérée par frame pour --gc-stats")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="mesure la mémoire allouée par frame avec tracemalloc (ralentit le jeu)")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="sert les mesures du jeu au format Prometheus sur http://HÔTE:PORT/metrics")
+    parser.add_argument("--metrics-host", default=DEFAULT_METRICS_HOST, metavar="HÔTE",
+                        help="adresse d'écoute de --metrics-port (locale par défaut)")
+    parser.add_argument("--capture", metavar="CHEMIN",
+                        help="enregistre les frames (flux RGB brut, ou dossier d'images PNG)")
+    parser.add_argument("--capture-format", choices=["raw", "png"], default="raw",
+                        help="format de l'enregistrement (voir capture.py)")
+    parser.add_argument("--idle-fps", type=int, default=DEFAULT_IDLE_FPS,
+                        help="cadence après une période sans action (0 = jamais ralentir)")
+    parser.add_argument("--idle-after", type=float, default=DEFAULT_IDLE_SECONDS, metavar="SECONDES",
+                        help="inactivité avant de passer à --idle-fps")
+    parser.add_argument("--power-stats", action="store_true",
+                        help="affiche à la sortie le temps et la charge processeur par mode de cadence")
+    parser.add_argument("--dictionary", metavar="FICHIER",
+                        help="dictionnaire compilé (importer.py) ou base compacte (wordstore.py) "
+                             "à la place de la base intégrée")
+    parser.add_argument("--new-game", action="store_true",
+                        help="ignore la partie enregistrée et commence une nouvelle partie")
+    parser.add_argument("--watch-dictionary", action="store_true",
+                        help="recharge --dictionary quand le fichier change (appliqué à la partie suivante)")
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
     """
     Fonction principale qui lance et gère la boucle de jeu complète
     Initialise pygame, crée le jeu et gère tous les événements
     """
+    options = parse_args(argv)
+    
     # === INITIALISATION DE PYGAME ===
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-    pygame.display.set_caption("Pendu Deluxe - Version Graphique Avancée")
+    bootstrap()  # Démarre seulement les sous-systèmes utilisés
+    # Crée la fenêtre avec le moteur de rendu choisi (logiciel ou textures SDL2)
+    renderer = create_renderer(options.renderer, (WINDOW_WIDTH, WINDOW_HEIGHT),
+                               "Pendu Deluxe - Version Graphique Avancée",
+                               options.render_scale, not options.scale_overlays,
+                               options.smooth_upscale)
+    restrict_events()  # La file ne reçoit que les événements lus par la boucle
     clock = pygame.time.Clock()  # Contrôle de la vitesse du jeu
+    # Cadence réduite en inactivité, aucune frame quand la fenêtre est cachée
+    scheduler = FrameScheduler(FPS, options.idle_fps, options.idle_after, clock)
     
     # === CRÉATION DU JEU ===
-    game = HangmanDeluxe()  # Instance de la classe principale
+    game = HangmanDeluxe(options.quality, options.dictionary, options.audio_buffer,
+                         options.watch_dictionary, not options.new_game)  # Instance de la classe principale
+    # Contrôleur de qualité adaptative (désactivable)
+    quality_controller = None if options.fixed_quality else AdaptiveQuality(options.quality)
     running = True          # Variable pour contrôler la boucle
+    latency = LatencyTracker() if options.input_latency else None  # Mesure optionnelle
+    
+    # === RAMASSE-MIETTES ===
+    # Démarrage terminé : la base de mots, les sprites et les sons ne bougeront plus
+    if options.gc_tune:
+        print(f"Ramasse-miettes réglé: {tune_gc()} objets gelés")
+    gc_monitor = None
+    if options.gc_stats:
+        gc_monitor = GCMonitor(options.gc_budget)
+        gc_monitor.start()
+    allocations = None
+    if options.trace_allocations:
+        allocations = AllocationTracker()
+        allocations.start()
+    
+    # === POINT DE MESURE HTTP (OPTIONNEL) ===
+    # Collecte dans un fil à part : la boucle n'ajoute que trois mesures par frame
+    metrics = metrics_server = None
+    if options.metrics_port is not None:
+        metrics = GameMetrics(game, clock.get_fps)
+        try:
+            metrics_server = MetricsServer(metrics.registry, options.metrics_host,
+                                           options.metrics_port).start()
+            host, port = metrics_server.address
+            print(f"Mesures sur http://{host}:{port}/metrics")
+        except OSError as e:
+            print(f"Point de mesure impossible: {e}")
+            metrics = None
+    
+    # === ENREGISTREMENT DES FRAMES (OPTIONNEL) ===
+    # Les frames sont abandonnées plutôt que de ralentir le jeu si le disque ne suit pas
+    capture = None
+    if options.capture:
+        screen = getattr(renderer, "screen", None)
+        try:
+            from capture import FrameCapture
+            if screen is None:
+                raise ValueError("le rendu accéléré n'expose pas de surface à lire")
+            capture = FrameCapture(screen, options.capture, options.capture_format)
+            print(f"Enregistrement des frames dans {options.capture}")
+        except (ImportError, OSError, ValueError) as e:
+            print(f"Enregistrement impossible: {e}")
     gear_coords = (0, 0, 0) # Coordonnées de la roue dentée pour les clics
     
     # === AFFICHAGE DES INSTRUCTIONS ===
@@ -1473,7 +2384,13 @@ def main():
     # === BOUCLE PRINCIPALE DU JEU ===
     while running:
         # === GESTION DES ÉVÉNEMENTS ===
-        for event in pygame.event.get():
+        # Au ralenti ou fenêtre cachée, la boucle dort ici jusqu'à un événement
+        events = scheduler.events()
+        received = time.perf_counter()  # Instant de lecture, commun aux événements du lot
+        if latency is not None:
+            latency.events_read(received)
+        for event in events:
+            changed = False  # L'événement a modifié ce qu'affiche la frame
             
             if event.type == pygame.QUIT:  # Fermeture de fenêtre
                 running = False
@@ -1481,7 +2398,7 @@ def main():
             elif event.type == pygame.MOUSEBUTTONDOWN:  # Clic de souris
                 if event.button == 1:  # Clic gauche uniquement
                     # Tente de gérer le clic sur les options
-                    game.handle_options_click(event.pos, *gear_coords)
+                    changed = game.handle_options_click(event.pos, *gear_coords)
             
             elif event.type == pygame.KEYDOWN:  # Pression de touche
                 
@@ -1490,26 +2407,107 @@ def main():
                     
                 elif event.key == pygame.K_F5:  # F5 = nouvelle partie
                     game.reset_game()
+                    changed = True
                     
                 elif event.key == pygame.K_F4:  # F4 = indice
                     game.give_hint()
+                    changed = True
                     
                 elif event.key == pygame.K_F6:  # F6 = toggle options
                     game.show_options = not game.show_options
+                    changed = True
                     
                 # === GESTION DES LETTRES ===
                 elif not game.game_over and pygame.K_a <= event.key <= pygame.K_z:
                     # Seulement si le jeu n'est pas terminé et que c'est une lettre
                     letter = chr(event.key).upper()  # Convertit en majuscule
-                    game.guess_letter(letter)        # Traite la proposition
+                    changed = game.guess_letter(letter, received)  # Traite la proposition
+            
+            if changed and latency is not None:
+                latency.input_handled(time.perf_counter())
+        
+        game.poll_dictionary()  # Un os.stat par seconde au plus
+        
+        if not running or not scheduler.frame_due():
+            continue  # Fenêtre cachée, ou réveil avant la prochaine frame au ralenti
         
         # === MISE À JOUR ET AFFICHAGE ===
-        game.update()                           # Met à jour toutes les animations
-        gear_coords = game.draw(screen)         # Dessine tout et récupère les coordonnées de la roue
-        pygame.display.flip()                  # Actualise l'affichage
-        clock.tick(FPS)                        # Maintient 60 FPS
+        frame_started = time.perf_counter()
+        for _ in range(scheduler.update_steps):
+            game.update()                       # Met à jour toutes les animations
+        updated = time.perf_counter()
+        gear_coords = game.render(renderer)     # Dessine tout et récupère les coordonnées de la roue
+        if capture is not None:
+            capture.capture()                   # Copie la frame sans attendre l'écriture
+        renderer.present()                     # Actualise l'affichage
+        presented = time.perf_counter()
+        if latency is not None:
+            latency.frame_presented(presented)
+        if metrics is not None:
+            metrics.frame_presented(frame_started, updated, presented)
+        game.run_deferred()                    # Travaux reportés par les touches (écritures...)
+        if gc_monitor is not None:
+            gc_monitor.end_frame()
+        if allocations is not None:
+            allocations.end_frame()
+        scheduler.tick()                       # Maintient 60 FPS (ou la cadence réduite)
+        
+        # === QUALITÉ ADAPTATIVE ===
+        # get_rawtime() donne le temps de calcul de la frame, sans l'attente de tick()
+        # (seules les frames à cadence normale sont jugées)
+        if quality_controller is not None and scheduler.mode == ACTIVE:
+            new_quality = quality_controller.record(clock.get_rawtime())
+            if new_quality is not None:
+                print(f"Qualité ajustée: {game.quality} -> {new_quality} "
+                      f"(p95 {quality_controller.last_p95:.1f} ms)")
+                game.set_quality(new_quality)
     
     # === NETTOYAGE À LA SORTIE ===
+    if metrics_server is not None:
+        metrics_server.close()
+    game.run_deferred()
+    game.save_game()  # Partie en cours reprise au prochain lancement
+    if capture is not None:
+        try:
+            stats = capture.close()
+            print(f"{stats['written']} frames enregistrées, {stats['dropped']} abandonnées")
+        except (OSError, pygame.error) as e:
+            print(f"Erreur d'enregistrement: {e}")
+    if options.audio_latency and game.audio is not None:
+        summary = game.audio.latency_summary()
+        print(f"Latence touche -> play(): médiane {summary['p50_ms']:.2f} ms, "
+              f"p95 {summary['p95_ms']:.2f} ms sur {summary['samples']} sons "
+              f"(+ {summary['output_ms']:.1f} ms de tampon mixeur)")
+        print(f"Effets: {game.audio.stats['played']} joués, {game.audio.stats['stolen']} voix volées, "
+              f"{game.audio.stats['debounced']} ignorés (anti-rebond)")
+    if latency is not None:
+        for stage, summary in latency.summary().items():
+            print(f"Latence {stage}: {summary['samples']} entrées, médiane {summary['p50_ms']:.2f} ms, "
+                  f"p95 {summary['p95_ms']:.2f} ms, max {summary['max_ms']:.2f} ms")
+        print("Touche -> frame affichée:")
+        for line in latency.histogram_lines("total"):
+            print(line)
+    if gc_monitor is not None:
+        gc_monitor.stop()
+        summary = gc_monitor.summary()
+        print(f"Ramasse-miettes: {summary['frames']} frames, collectes par génération "
+              f"{'/'.join(map(str, summary['collections']))}, pauses "
+              f"{'/'.join(f'{pause:.1f}' for pause in summary['pause_ms'])} ms, "
+              f"pire pause {summary['max_pause_ms']:.2f} ms")
+        print(f"{summary['flagged']} frame(s) au-delà de {summary['budget_ms']:.1f} ms de pause")
+        for pause_ms, frame, generations in summary["worst"][:5]:
+            print(f"  frame {frame}: {pause_ms:.2f} ms (génération {max(generations)})")
+    if allocations is not None:
+        summary = allocations.summary()
+        print(f"Allocations par frame: pic médian {summary['peak_p50'] / 1024:.1f} Kio, "
+              f"p95 {summary['peak_p95'] / 1024:.1f} Kio, solde moyen {summary['net_mean']:.0f} octets")
+        for line in allocations.top_lines(5):
+            print(f"  {line}")
+        allocations.stop()
+    if options.power_stats:
+        for mode, summary in scheduler.summary().items():
+            print(f"Cadence {mode}: {summary['seconds']:.1f} s, {summary['frames']} frames, "
+                  f"processeur {summary['cpu_percent']:.1f} %")
     pygame.quit()  # Ferme pygame proprement
     sys.exit()     # Termine le processus Python
 
@@ -0,0 +1,237 @@
+"""
+Rechargement à chaud des dictionnaires de Pendu Deluxe
+Un dictionnaire compilé (importer.py) ou une base compacte (wordstore.py) peut être
+remplacé pendant que le jeu ou le serveur tourne :
+- la date et la taille du fichier sont relevées à intervalle régulier (un seul os.stat,
+  sans fil supplémentaire) ; un fichier encore en cours d'écriture est attendu
+- le nouveau fichier est lu dans un fil d'arrière-plan, comparé à la liste actuelle
+  (mots ajoutés et retirés par catégorie) et les index sont préparés : catégories,
+  bandes de difficulté (seules les longueurs de mots modifiées sont recalculées) ;
+  pour une base compacte, seules les catégories dont l'empreinte a changé sont
+  comparées, sur les numéros de mots lus en un parcours du trie
+- la mise à jour est appliquée d'un bloc entre deux parties : la partie en cours garde
+  son mot, et aucune frame n'attend la lecture du fichier
+Au-delà de FULL_REBUILD_FRACTION de mots modifiés, les index sont reconstruits en entier.
+"""
+import os       # Module pour relever la date des fichiers
+import time     # Module pour espacer les vérifications
+import threading  # Lecture du nouveau dictionnaire en arrière-plan
+from collections import namedtuple
+
+from dictionary import load_compiled_dictionary
+from difficulty import load_difficulty_bands
+from sampler import WordSampler
+from wordstore import WordStore, is_word_store, pools_store
+
+RELOAD_INTERVAL = 1.0         # Secondes entre deux vérifications du fichier
+FULL_REBUILD_FRACTION = 0.25  # Part de mots modifiés au-delà de laquelle tout est reconstruit
+
+# Mise à jour prête à appliquer
+DictionaryUpdate = namedtuple("DictionaryUpdate", [
+    "categories",        # catégorie -> mots (listes inchangées réutilisées telles quelles)
+    "difficulty_bands",  # bande de difficulté mesurée -> mots (None si non demandées)
+    "added",             # mots apparus (set)
+    "removed",           # mots disparus (set)
+    "changed",           # catégories ajoutées, retirées ou modifiées (set)
+    "full",              # True si la modification est assez grande pour tout reconstruire
+])
+
+def file_stamp(path):
+    """
+    Relevé qui change quand un fichier est modifié ou remplacé (None s'il n'existe pas)
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+def load_word_lists(path, with_bands=True):
+    """
+    Charge un dictionnaire compilé ou une base compacte
+    
+    Args:
+        path: fichier du dictionnaire
+        with_bands: calcule aussi les bandes de difficulté (sinon None)
+    
+    Returns:
+        tuple: (catégorie -> mots, bande de difficulté -> mots)
+    
+    Raises:
+        OSError, ValueError: si le fichier est illisible
+    """
+    if is_word_store(path):
+        store = WordStore.load(path)
+        return store.category_views(), store.level_views() if with_bands else None
+    categories = load_compiled_dictionary(path)
+    if not with_bands:
+        return categories, None
+    words = [word for category in categories.values() for word in category]
+    return categories, load_difficulty_bands(words)
+
+def diff_categories(old, new):
+    """
+    Compare deux dictionnaires catégorie -> mots
+    
+    Returns:
+        tuple: (mots ajoutés, mots retirés, catégories modifiées)
+    """
+    changed = set()
+    old_words, new_words = set(), set()
+    for name in old.keys() | new.keys():
+        before, after = old.get(name, ()), new.get(name, ())
+        if len(before) != len(after) or list(before) != list(after):
+            changed.add(name)
+        old_words.update(before)
+        new_words.update(after)
+    return new_words - old_words, old_words - new_words, changed
+
+def diff_stores(old, new):
+    """
+    Compare les catégories de deux bases compactes
+    Les catégories de même empreinte sont écartées sans lire leurs mots ; pour les
+    autres, les mots sont relus d'un bloc dans chaque trie (words_by_id) puis
+    comparés par numéros
+    
+    Args:
+        old, new: catégorie -> TagView de l'ancienne et de la nouvelle base
+    
+    Returns:
+        tuple: (mots ajoutés, mots retirés, catégories modifiées)
+    """
+    old_store, new_store = pools_store(old), pools_store(new)
+    changed = set()
+    for name in old.keys() | new.keys():
+        if name not in old or name not in new:
+            changed.add(name)
+        elif old_store.fingerprint == new_store.fingerprint:
+            # Mêmes mots, mêmes numéros : les tableaux de bits suffisent
+            if old[name].members.bits != new[name].members.bits:
+                changed.add(name)
+        elif old[name].fingerprint != new[name].fingerprint:
+            changed.add(name)  # Toujours vrai pour un ancien fichier sans empreinte par catégorie
+    if not changed:
+        return set(), set(), changed
+    
+    # === MOTS DES CATÉGORIES MODIFIÉES ===
+    old_words, new_words = old_store.words_by_id(), new_store.words_by_id()
+    before, after = set(), set()
+    for name in changed:
+        if name in old:
+            before.update(old_words[word_id] for word_id in old_store.tag_word_ids(name))
+        if name in new:
+            after.update(new_words[word_id] for word_id in new_store.tag_word_ids(name))
+    # Un mot quitte le dictionnaire s'il n'est plus dans la base (pas seulement dans sa catégorie)
+    added = after - before
+    removed = before - after
+    if added:
+        added -= set(old_words)
+    if removed:
+        removed -= set(new_words)
+    return ({word.decode("utf-8") for word in added}, {word.decode("utf-8") for word in removed},
+            changed)
+
+def rebuild_sampler(sampler, pools):
+    """
+    Crée le tirage des nouvelles listes en reprenant l'état de l'ancien : les sacs des
+    listes inchangées continuent leur tour, ceux des listes modifiées repartent de zéro
+    
+    Args:
+        sampler: WordSampler actuel
+        pools: nom de liste -> mots après la mise à jour
+    
+    Returns:
+        WordSampler: nouveau tirage
+    """
+    rebuilt = WordSampler(pools, rng=sampler.rng)
+    rebuilt.set_state(sampler.get_state())
+    return rebuilt
+
+class DictionaryReloader:
+    """
+    Surveille un fichier de dictionnaire et prépare les mises à jour en arrière-plan
+    """
+    
+    def __init__(self, path, categories, interval=RELOAD_INTERVAL, stamp=None, with_bands=True):
+        """
+        Args:
+            path: dictionnaire compilé ou base compacte surveillé
+            categories: catégorie -> mots actuellement utilisés
+            interval: secondes entre deux vérifications
+            stamp: relevé du fichier quand categories a été chargé (par défaut maintenant)
+            with_bands: prépare aussi les bandes de difficulté
+        """
+        self.path = path
+        self.categories = categories
+        self.interval = interval
+        self.with_bands = with_bands
+        self.stamp = stamp or file_stamp(path)  # Version du fichier déjà chargée
+        self.seen = self.stamp         # Dernier relevé (changement confirmé au relevé suivant)
+        self.next_check = time.monotonic() + interval
+        self.loader = None             # Fil de lecture en cours
+        self.pending = None            # DictionaryUpdate prête, pas encore appliquée
+        self.error = None              # Erreur de la dernière lecture
+    
+    def poll(self):
+        """
+        Vérifie le fichier si l'intervalle est écoulé (à appeler à chaque frame ou tick)
+        Lance la lecture quand le fichier a changé et n'a plus bougé depuis le relevé précédent
+        
+        Returns:
+            bool: True si une lecture vient d'être lancée
+        """
+        now = time.monotonic()
+        if now < self.next_check or self.loader is not None:
+            return False
+        self.next_check = now + self.interval
+        if self.error is not None:
+            print(f"Rechargement du dictionnaire impossible: {self.error}")
+            self.error = None
+        
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp == self.stamp:
+            self.seen = stamp
+            return False
+        if stamp != self.seen:
+            self.seen = stamp  # Fichier peut-être en cours d'écriture : on attend un relevé
+            return False
+        
+        self.stamp = stamp
+        self.loader = threading.Thread(target=self.load, name="dictionary-reload", daemon=True)
+        self.loader.start()
+        return True
+    
+    def load(self):
+        """
+        Lit le nouveau fichier et prépare la mise à jour (exécuté dans le fil de lecture)
+        """
+        try:
+            categories, bands = load_word_lists(self.path, self.with_bands)
+            if pools_store(categories) is not None and pools_store(self.categories) is not None:
+                # Vues de la nouvelle base (une catégorie inchangée garde son empreinte)
+                added, removed, changed = diff_stores(self.categories, categories)
+            else:
+                added, removed, changed = diff_categories(self.categories, categories)
+                # Les listes inchangées restent les mêmes objets (sacs de tirage conservés)
+                categories = {name: words if name in changed else self.categories[name]
+                              for name, words in categories.items()}
+            total = max(1, sum(len(words) for words in categories.values()))
+            full = len(added) + len(removed) > FULL_REBUILD_FRACTION * total
+            # Fichier revenu à la version installée : une mise à jour pas encore prise est périmée
+            self.pending = DictionaryUpdate(categories, bands, added, removed, changed, full) if changed else None
+        except (OSError, ValueError) as e:
+            self.error = e
+        finally:
+            self.loader = None
+    
+    def take(self):
+        """
+        Retourne la mise à jour prête (None s'il n'y en a pas) ; à appeler entre deux parties
+        
+        Returns:
+            DictionaryUpdate ou None
+        """
+        update, self.pending = self.pending, None
+        if update is not None:
+            self.categories = update.categories
+        return update
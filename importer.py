@@ -0,0 +1,204 @@
+"""
+Import de listes de mots dans un dictionnaire compilé de Pendu Deluxe
+Le fichier source est lu ligne à ligne par une chaîne de générateurs :
+lecture -> normalisation (É->E, Œ->OE) -> filtrage (A-Z, longueur) -> dédoublonnage
+-> écriture. Rien n'est chargé en entier : seule l'empreinte de 8 octets des mots
+déjà écrits est gardée en mémoire pour le dédoublonnage.
+
+Usage:
+    python importer.py mots.txt -o mots.pdd --category DIVERS
+    python importer.py animaux.txt.gz -o mots.pdd --category ANIMAUX --append
+    cat dump.txt | python importer.py - -o mots.pdd --category DIVERS
+"""
+import sys      # Module système pour l'entrée standard et la sortie
+import io       # Module pour décoder l'entrée standard en UTF-8
+import gzip     # Module pour lire les fichiers compressés
+import time     # Module pour mesurer la durée de l'import
+import hashlib  # Module pour les empreintes de dédoublonnage
+import argparse # Module pour lire les options de la ligne de commande
+import unicodedata  # Module pour la décomposition des accents
+
+from dictionary import CompiledDictionaryWriter, iter_compiled_dictionary
+from rules import is_playable
+
+# Ligatures et lettres que la décomposition NFD ne sépare pas
+LIGATURES = str.maketrans({"Œ": "OE", "œ": "oe", "Æ": "AE", "æ": "ae", "ß": "ss"})
+
+DEFAULT_MIN_LENGTH = 3
+DEFAULT_MAX_LENGTH = 16
+
+def read_lines(path):
+    """
+    Lit un fichier texte ligne à ligne ('-' pour l'entrée standard, .gz accepté)
+    
+    Yields:
+        str: lignes sans le retour à la ligne
+    """
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+        for line in stream:
+            yield line.rstrip("\r\n")
+        return
+    
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+def normalize_word(text):
+    """
+    Ramène un mot aux lettres du clavier : majuscules sans accents ni ligatures
+    
+    Args:
+        text: mot tel qu'il apparaît dans la source (ex: "Cœur", "élève")
+    
+    Returns:
+        str: mot normalisé (ex: "COEUR", "ELEVE")
+    """
+    text = text.strip()
+    if text.isascii():  # Cas le plus courant : rien à décomposer
+        return text.upper()
+    decomposed = unicodedata.normalize("NFD", text.translate(LIGATURES))
+    # Les accents deviennent des caractères combinants séparés, qu'on retire
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).upper()
+
+def normalize(lines, join_hyphens=False):
+    """
+    Normalise chaque ligne de la source
+    
+    Args:
+        lines: lignes de la source (un mot par ligne)
+        join_hyphens: colle les mots composés (ARC-EN-CIEL -> ARCENCIEL)
+    
+    Yields:
+        str: mots normalisés
+    """
+    for line in lines:
+        word = normalize_word(line)
+        if join_hyphens:
+            word = word.replace("-", "")
+        yield word
+
+def filter_words(words, stats, min_length=DEFAULT_MIN_LENGTH, max_length=DEFAULT_MAX_LENGTH):
+    """
+    Garde les mots jouables au clavier et de longueur acceptable
+    
+    Args:
+        words: mots normalisés
+        stats: compteurs de l'import (modifiés sur place)
+        min_length, max_length: longueurs acceptées
+    
+    Yields:
+        str: mots conservés
+    """
+    for word in words:
+        if not word:
+            stats["empty"] += 1
+        elif not is_playable(word):
+            stats["charset"] += 1  # Tirets, espaces, chiffres, lettres étrangères...
+        elif not min_length <= len(word) <= max_length:
+            stats["length"] += 1
+        else:
+            yield word
+
+def word_hash(word):
+    """
+    Empreinte de 8 octets d'un mot (un entier est bien plus petit qu'une chaîne en mémoire)
+    """
+    return int.from_bytes(hashlib.blake2b(word.encode("ascii"), digest_size=8).digest(), "little")
+
+def dedupe(words, stats, seen):
+    """
+    Retire les mots déjà rencontrés
+    
+    Args:
+        words: mots filtrés
+        stats: compteurs de l'import (modifiés sur place)
+        seen: empreintes des mots déjà écrits (modifié sur place)
+    
+    Yields:
+        str: mots jamais vus
+    """
+    for word in words:
+        digest = word_hash(word)
+        if digest in seen:
+            stats["duplicates"] += 1
+        else:
+            seen.add(digest)
+            yield word
+
+def import_words(sources, output, category, append=False, join_hyphens=False,
+                 min_length=DEFAULT_MIN_LENGTH, max_length=DEFAULT_MAX_LENGTH):
+    """
+    Importe des fichiers de mots dans une catégorie d'un dictionnaire compilé
+    
+    Args:
+        sources: chemins des fichiers sources ('-' pour l'entrée standard)
+        output: chemin du dictionnaire compilé
+        category: nom de la catégorie des mots importés
+        append: ajoute au dictionnaire existant (ses mots ne sont pas réimportés)
+        join_hyphens: colle les mots composés au lieu de les rejeter
+        min_length, max_length: longueurs acceptées
+    
+    Returns:
+        dict: compteurs de l'import (lignes lues, mots écrits, rejets par motif)
+    """
+    stats = {"lines": 0, "written": 0, "empty": 0, "charset": 0, "length": 0, "duplicates": 0}
+    
+    # Les mots déjà présents dans le dictionnaire ne sont pas écrits une seconde fois
+    seen = set()
+    if append:
+        try:
+            seen.update(word_hash(word) for _, word in iter_compiled_dictionary(output))
+        except FileNotFoundError:
+            pass
+    
+    def counted(lines):
+        for line in lines:
+            stats["lines"] += 1
+            yield line
+    
+    with CompiledDictionaryWriter(output, append) as writer:
+        writer.begin_category(normalize_word(category))
+        for source in sources:
+            # === CHAÎNE DE GÉNÉRATEURS ===
+            lines = counted(read_lines(source))
+            words = normalize(lines, join_hyphens)
+            words = filter_words(words, stats, min_length, max_length)
+            for word in dedupe(words, stats, seen):
+                writer.add(word)
+                stats["written"] += 1
+    return stats
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande de l'importeur
+    """
+    parser = argparse.ArgumentParser(description="Import de mots dans un dictionnaire compilé")
+    parser.add_argument("sources", nargs="+", help="fichiers de mots, un par ligne ('-' = entrée standard)")
+    parser.add_argument("-o", "--output", required=True, help="dictionnaire compilé à écrire")
+    parser.add_argument("--category", required=True, help="catégorie des mots importés")
+    parser.add_argument("--append", action="store_true", help="ajoute au dictionnaire existant")
+    parser.add_argument("--join-hyphens", action="store_true",
+                        help="colle les mots composés (ARC-EN-CIEL -> ARCENCIEL)")
+    parser.add_argument("--min-length", type=int, default=DEFAULT_MIN_LENGTH)
+    parser.add_argument("--max-length", type=int, default=DEFAULT_MAX_LENGTH)
+    options = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    try:
+        stats = import_words(options.sources, options.output, options.category, options.append,
+                             options.join_hyphens, options.min_length, options.max_length)
+    except (OSError, ValueError) as e:
+        print(f"Import impossible: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    
+    print(f"{stats['lines']} lignes lues en {elapsed:.2f} s, {stats['written']} mots écrits "
+          f"dans {options.output} (catégorie {normalize_word(options.category)})")
+    print(f"Rejets: {stats['duplicates']} doublons, {stats['charset']} caractères non jouables, "
+          f"{stats['length']} longueurs hors limites, {stats['empty']} lignes vides")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Latence des entrées de Pendu Deluxe
+Pour chaque touche qui change l'état du jeu, mesure :
+- queue : borne de l'attente dans la file d'événements (SDL ne transmet pas à pygame
+  l'instant de l'appui : l'événement a pu arriver n'importe quand depuis la lecture
+  précédente de la file)
+- handle : lecture de l'événement -> état du jeu modifié
+- display : état modifié -> première frame affichée qui le montre
+- total : lecture de l'événement -> frame affichée
+Les mesures sont rangées dans des histogrammes à seaux fixes (quelques additions par
+touche, rien par frame sans touche).
+
+La file d'événements est aussi restreinte aux types utilisés par le jeu : les autres
+(texte saisi, relâchement des touches, manettes, périphériques audio...) ne sont plus
+créés par SDL ni parcourus à chaque frame.
+"""
+import bisect   # Module pour trouver le seau d'une mesure
+from collections import deque  # Dernières mesures (centiles)
+
+import pygame   # Bibliothèque principale pour créer des jeux 2D
+
+from audio import percentile
+
+STAGES = ["queue", "handle", "display", "total"]
+HISTOGRAM_EDGES_MS = [1, 2, 4, 8, 16, 33, 50, 100]  # Bornes supérieures des seaux
+LATENCY_SAMPLES = 1024  # Mesures conservées par étape pour les centiles
+
+# Événements lus par la boucle de jeu et par la cadence (scheduler.py)
+GAME_EVENTS = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL,  # Sortie du mode ralenti
+    pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED, pygame.WINDOWMINIMIZED,
+    pygame.WINDOWHIDDEN, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED,
+]
+
+def restrict_events(allowed=GAME_EVENTS):
+    """
+    Ne garde dans la file que les types d'événements donnés (après pygame.display.init)
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(allowed)
+
+class LatencyTracker:
+    """
+    Mesure le délai entre une touche et la frame qui montre son effet
+    """
+    
+    def __init__(self, samples=LATENCY_SAMPLES):
+        """
+        Args:
+            samples: mesures conservées par étape pour les centiles
+        """
+        self.previous_poll = None  # Dernière lecture de la file avant la lecture en cours
+        self.last_poll = None      # Lecture en cours
+        self.pending = []          # (lecture, état modifié, attente bornée) en attente d'affichage
+        self.samples = {stage: deque(maxlen=samples) for stage in STAGES}
+        self.histograms = {stage: [0] * (len(HISTOGRAM_EDGES_MS) + 1) for stage in STAGES}
+    
+    def events_read(self, now):
+        """
+        Note l'instant où la boucle vient de lire la file d'événements
+        """
+        self.previous_poll, self.last_poll = self.last_poll, now
+    
+    def input_handled(self, changed_at):
+        """
+        Note une entrée qui a modifié l'état du jeu (lue lors du dernier events_read)
+        
+        Args:
+            changed_at: instant où l'état a été modifié (time.perf_counter())
+        """
+        if self.last_poll is None:
+            return
+        queued = self.last_poll - self.previous_poll if self.previous_poll is not None else 0.0
+        self.pending.append((self.last_poll, changed_at, queued))
+    
+    def frame_presented(self, now):
+        """
+        Termine la mesure des entrées en attente : cette frame montre leur effet
+        """
+        for received, changed, queued in self.pending:
+            self.record("queue", queued)
+            self.record("handle", changed - received)
+            self.record("display", now - changed)
+            self.record("total", now - received)
+        self.pending.clear()
+    
+    def record(self, stage, seconds):
+        """
+        Ajoute une mesure à l'histogramme et aux dernières mesures d'une étape
+        """
+        milliseconds = seconds * 1000
+        self.samples[stage].append(milliseconds)
+        self.histograms[stage][bisect.bisect_left(HISTOGRAM_EDGES_MS, milliseconds)] += 1
+    
+    def summary(self):
+        """
+        Résume les mesures
+        
+        Returns:
+            dict: étape -> nombre de mesures, médiane, 95e centile et maximum (ms)
+        """
+        return {stage: {"samples": sum(self.histograms[stage]),
+                        "p50_ms": percentile(self.samples[stage], 0.5),
+                        "p95_ms": percentile(self.samples[stage], 0.95),
+                        "max_ms": max(self.samples[stage], default=0.0)}
+                for stage in STAGES}
+    
+    def histogram_lines(self, stage, width=40):
+        """
+        Dessine l'histogramme d'une étape en texte
+        
+        Returns:
+            list: une ligne par seau ("<= 16 ms  ####  12")
+        """
+        counts = self.histograms[stage]
+        scale = width / max(1, max(counts))
+        labels = [f"<= {edge} ms" for edge in HISTOGRAM_EDGES_MS] + [f"> {HISTOGRAM_EDGES_MS[-1]} ms"]
+        return [f"{label:>10} {'#' * round(count * scale):<{width}} {count}"
+                for label, count in zip(labels, counts)]
@@ -0,0 +1,305 @@
+"""
+Champ de lettres tombantes de Pendu Deluxe, calculé avec NumPy
+Toutes les lettres d'arrière-plan sont stockées dans des tableaux (position, vitesse,
+rotation, transparence, lettre, couleur) et avancent en une seule opération vectorisée ;
+les réapparitions sont traitées par masques. Le dessin passe par une seule commande
+« lot » de la scène, exécutée en un appel à Surface.blits par le rendu logiciel.
+
+Pour dessiner en lot, chaque sprite est pré-calculé : rotation arrondie à un cran de
+ANGLE_STEP degrés et transparence arrondie à un des ALPHA_LEVELS niveaux (les sprites
+sont fabriqués à la demande par la SpriteCache du jeu, clés 'turned_glyph' et 'faded_dot').
+Le module n'importe pas pygame : la taille des sprites est demandée au jeu.
+"""
+import random   # Module pour dériver la graine du générateur NumPy
+import numpy as np  # Calcul vectorisé sur toutes les lettres
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ANGLE_STEPS = 24                 # Crans de rotation pré-calculés (15°)
+ANGLE_STEP = 360 / ANGLE_STEPS
+ALPHA_LEVELS = 8                 # Niveaux de transparence pré-calculés
+ALPHA_VALUES = [round(255 * (level + 1) / ALPHA_LEVELS) for level in range(ALPHA_LEVELS)]
+SPARKLES_PER_LETTER = 8          # Place réservée aux particules d'accompagnement
+SPARKLE_RADIUS = 2               # Rayon des particules d'accompagnement
+MIN_TRAIL_ALPHA = 10             # Transparence en dessous de laquelle la traînée n'est pas dessinée
+
+def alpha_level(alpha):
+    """
+    Niveau de transparence pré-calculé le plus proche (tableau NumPy)
+    """
+    return np.clip(np.rint(alpha * (ALPHA_LEVELS / 255)).astype(np.intp) - 1, 0, ALPHA_LEVELS - 1)
+
+class FallingLetterField:
+    """
+    Lettres tombantes d'arrière-plan stockées colonne par colonne dans des tableaux NumPy
+    Même comportement que les objets FallingLetter du jeu : chute, rotation, traînée,
+    particules d'accompagnement et réapparition au-dessus de l'écran
+    """
+    
+    def __init__(self, width, height, colors, sprite_size, count=0, trail_length=5,
+                 sparkles=True, rng=None):
+        """
+        Args:
+            width, height: dimensions de la fenêtre
+            colors: couleurs RGB possibles des lettres
+            sprite_size: fonction qui retourne (largeur, hauteur) d'un sprite à partir de sa clé
+            count: nombre de lettres
+            trail_length: positions mémorisées pour la traînée (1 = pas de traînée)
+            sparkles: crée les particules d'accompagnement
+            rng: générateur NumPy (par défaut, graine tirée du module random : random.seed()
+                rend aussi le champ reproductible)
+        """
+        self.width = width
+        self.height = height
+        self.colors = [tuple(color) for color in colors]
+        self.sprite_size = sprite_size
+        self.sparkles = sparkles
+        self.rng = rng or np.random.default_rng(random.getrandbits(64))
+        
+        # === TABLE DES CLÉS DE SPRITES ===
+        # Identifiant entier -> clé de la SpriteCache : glyphes tournés puis particules
+        glyph_keys = [("turned_glyph", letter, color, step * ANGLE_STEP, alpha)
+                      for letter in LETTERS for color in self.colors
+                      for step in range(ANGLE_STEPS) for alpha in ALPHA_VALUES]
+        dot_keys = [("faded_dot", color, SPARKLE_RADIUS, alpha)
+                    for color in self.colors for alpha in ALPHA_VALUES]
+        self.dot_offset = len(glyph_keys)
+        self.keys = np.empty(len(glyph_keys) + len(dot_keys), dtype=object)
+        self.keys[:] = glyph_keys + dot_keys
+        # Demi-tailles des sprites, connues au premier dessin de chacun (NaN = inconnue)
+        self.half_width = np.full(len(self.keys), np.nan)
+        self.half_height = np.full(len(self.keys), np.nan)
+        
+        self.count = 0
+        self.allocate(0)
+        self.set_trail_length(trail_length)
+        self.resize(count)
+    
+    def __len__(self):
+        return self.count
+    
+    def allocate(self, count):
+        """
+        Crée des tableaux vides pour count lettres
+        """
+        self.x = np.zeros(count, dtype=np.float32)
+        self.y = np.zeros(count, dtype=np.float32)
+        self.speed = np.zeros(count, dtype=np.float32)
+        self.rotation = self.rng.uniform(0, 360, count).astype(np.float32)
+        self.rotation_speed = self.rng.uniform(-2, 2, count).astype(np.float32)
+        self.alpha = np.zeros(count, dtype=np.float32)
+        self.letter = np.zeros(count, dtype=np.intp)
+        self.color = np.zeros(count, dtype=np.intp)
+        self.sparkle_timer = np.zeros(count, dtype=np.int32)
+    
+    def resize(self, count):
+        """
+        Ajoute ou retire des lettres ; les lettres conservées gardent leur état
+        
+        Args:
+            count: nouveau nombre de lettres
+        """
+        old = self.count
+        if count == old:
+            return
+        columns = ("x", "y", "speed", "rotation", "rotation_speed", "alpha",
+                   "letter", "color", "sparkle_timer")
+        kept = {name: getattr(self, name)[:count] for name in columns}
+        self.allocate(count)
+        for name, values in kept.items():
+            getattr(self, name)[:len(values)] = values
+        self.count = count
+        
+        # Traînées et particules repartent de zéro (tableaux dimensionnés sur le nombre de lettres)
+        self.set_trail_length(self.trail_length)
+        self.allocate_sparkles()
+        if count > old:
+            self.respawn(np.arange(old, count))
+    
+    def set_trail_length(self, trail_length):
+        """
+        Change la longueur des traînées (les traînées en cours sont effacées)
+        """
+        self.trail_length = trail_length
+        self.trail_x = np.zeros((trail_length, self.count), dtype=np.float32)
+        self.trail_y = np.zeros((trail_length, self.count), dtype=np.float32)
+        self.trail_alpha = np.zeros((trail_length, self.count), dtype=np.float32)
+        self.trail_count = np.zeros(self.count, dtype=np.intp)  # Positions valides par lettre
+        self.trail_head = 0  # Case de la prochaine position (tampon circulaire commun)
+    
+    def allocate_sparkles(self):
+        """
+        Crée la réserve vide des particules d'accompagnement
+        """
+        capacity = self.count * SPARKLES_PER_LETTER
+        self.sparkle_x = np.zeros(capacity, dtype=np.float32)
+        self.sparkle_y = np.zeros(capacity, dtype=np.float32)
+        self.sparkle_speed = np.zeros(capacity, dtype=np.float32)
+        self.sparkle_alpha = np.zeros(capacity, dtype=np.float32)
+        self.sparkle_life = np.zeros(capacity, dtype=np.float32)
+        self.sparkle_color = np.zeros(capacity, dtype=np.intp)
+        self.sparkle_owner = np.zeros(capacity, dtype=np.intp)
+        self.sparkle_active = np.zeros(capacity, dtype=bool)
+    
+    def set_sparkles(self, sparkles):
+        """
+        Active ou désactive les particules d'accompagnement (les particules en vol finissent leur vie)
+        """
+        self.sparkles = sparkles
+    
+    def respawn(self, indices):
+        """
+        Replace des lettres au-dessus de l'écran avec de nouvelles propriétés aléatoires
+        
+        Args:
+            indices: tableau des indices des lettres à replacer
+        """
+        count = len(indices)
+        if count == 0:
+            return
+        rng = self.rng
+        self.x[indices] = rng.integers(0, self.width + 1, count)
+        self.y[indices] = rng.integers(-200, -49, count)
+        self.letter[indices] = rng.integers(0, len(LETTERS), count)
+        self.color[indices] = rng.integers(0, len(self.colors), count)
+        self.speed[indices] = rng.uniform(1, 4, count)
+        self.alpha[indices] = rng.integers(200, 256, count)
+        
+        # Remet à zéro la traînée et les particules des lettres replacées
+        self.trail_count[indices] = 0
+        if self.sparkle_active.any():
+            self.sparkle_active &= ~np.isin(self.sparkle_owner, indices)
+    
+    def explode(self, letter):
+        """
+        Replace toutes les lettres qui affichent la lettre donnée
+        
+        Args:
+            letter: lettre tapée (A-Z)
+        
+        Returns:
+            list: positions (x, y) des lettres replacées, pour les explosions
+        """
+        code = LETTERS.find(letter)
+        if code < 0:
+            return []
+        indices = np.flatnonzero(self.letter == code)
+        positions = list(zip(self.x[indices].tolist(), self.y[indices].tolist()))
+        self.respawn(indices)
+        return positions
+    
+    def update(self):
+        """
+        Avance toutes les lettres d'une frame
+        """
+        # === TRAÎNÉE : POSITION AVANT LE DÉPLACEMENT ===
+        if self.trail_length > 1:
+            head = self.trail_head
+            self.trail_x[head] = self.x
+            self.trail_y[head] = self.y
+            self.trail_alpha[head] = self.alpha
+            self.trail_head = (head + 1) % self.trail_length
+            np.minimum(self.trail_count + 1, self.trail_length, out=self.trail_count)
+        
+        # === MOUVEMENT ===
+        self.y += self.speed
+        self.rotation += self.rotation_speed
+        
+        # === PARTICULES D'ACCOMPAGNEMENT ===
+        if self.sparkles:
+            self.spawn_sparkles()
+        active = self.sparkle_active
+        if active.any():
+            self.sparkle_y += self.sparkle_speed
+            self.sparkle_alpha -= 2
+            self.sparkle_life -= 1
+            active &= (self.sparkle_life > 0) & (self.sparkle_alpha > 0)
+        
+        # === RÉAPPARITION EN HAUT ===
+        self.respawn(np.flatnonzero(self.y > self.height + 100))
+    
+    def spawn_sparkles(self):
+        """
+        Crée 2 particules autour des lettres dont le compteur dépasse un seuil aléatoire
+        """
+        count = self.count
+        rng = self.rng
+        self.sparkle_timer += 1
+        fired = np.flatnonzero(self.sparkle_timer > rng.integers(10, 31, count))
+        if len(fired) == 0:
+            return
+        self.sparkle_timer[fired] = 0
+        
+        # Places libres de la réserve : les particules en trop sont abandonnées
+        free = np.flatnonzero(~self.sparkle_active)[:2 * len(fired)]
+        owners = np.repeat(fired, 2)[:len(free)]
+        spawned = len(free)
+        self.sparkle_x[free] = self.x[owners] + rng.integers(-10, 11, spawned)
+        self.sparkle_y[free] = self.y[owners] + rng.integers(-5, 6, spawned)
+        self.sparkle_speed[free] = rng.uniform(0.5, 1.5, spawned)
+        self.sparkle_alpha[free] = rng.integers(50, 121, spawned)
+        self.sparkle_life[free] = rng.integers(30, 61, spawned)
+        self.sparkle_color[free] = self.color[owners]
+        self.sparkle_owner[free] = owners
+        self.sparkle_active[free] = True
+    
+    def glyph_ids(self, letters, colors, rotation, alpha):
+        """
+        Identifiants des sprites de glyphes (lettre, couleur, cran de rotation, niveau de transparence)
+        """
+        steps = np.rint(rotation / ANGLE_STEP).astype(np.intp) % ANGLE_STEPS
+        return ((letters * len(self.colors) + colors) * ANGLE_STEPS + steps) * ALPHA_LEVELS \
+            + alpha_level(alpha)
+    
+    def add_to_scene(self, scene):
+        """
+        Ajoute toutes les lettres, leurs traînées et leurs particules à la scène en un seul lot
+        (traînées au fond, puis particules, puis lettres)
+        
+        Args:
+            scene: Scene où ajouter le lot (voir renderer.py)
+        """
+        ids, centers_x, centers_y = [], [], []
+        
+        # === TRAÎNÉES ===
+        # Âge 0 = position la plus récente ; la plus récente n'est pas dessinée (comme
+        # FallingLetter) et la transparence décroît vers les plus anciennes
+        length = self.trail_count
+        for age in range(1, self.trail_length):
+            slot = (self.trail_head - 1 - age) % self.trail_length
+            fade = self.trail_alpha[slot] * ((length - 1 - age) / np.maximum(length, 1)) * 0.3
+            visible = np.flatnonzero((age < length) & (fade > MIN_TRAIL_ALPHA))
+            if len(visible):
+                ids.append(self.glyph_ids(self.letter[visible], self.color[visible],
+                                          self.rotation[visible], fade[visible]))
+                centers_x.append(self.trail_x[slot, visible])
+                centers_y.append(self.trail_y[slot, visible])
+        
+        # === PARTICULES D'ACCOMPAGNEMENT ===
+        visible = np.flatnonzero(self.sparkle_active)
+        if len(visible):
+            ids.append(self.dot_offset + self.sparkle_color[visible] * ALPHA_LEVELS
+                       + alpha_level(self.sparkle_alpha[visible]))
+            centers_x.append(self.sparkle_x[visible])
+            centers_y.append(self.sparkle_y[visible])
+        
+        # === LETTRES ===
+        ids.append(self.glyph_ids(self.letter, self.color, self.rotation, self.alpha))
+        centers_x.append(self.x)
+        centers_y.append(self.y)
+        
+        ids = np.concatenate(ids)
+        if len(ids) == 0:
+            return
+        
+        # === TAILLE DES SPRITES JAMAIS DESSINÉS ===
+        unknown = np.isnan(self.half_width[ids])
+        if unknown.any():
+            for sprite_id in np.unique(ids[unknown]).tolist():
+                width, height = self.sprite_size(self.keys[sprite_id])
+                self.half_width[sprite_id] = width / 2
+                self.half_height[sprite_id] = height / 2
+        
+        # Coin haut-gauche de chaque sprite, centré sur sa position
+        left = (np.concatenate(centers_x) - self.half_width[ids]).astype(np.intp)
+        top = (np.concatenate(centers_y) - self.half_height[ids]).astype(np.intp)
+        scene.batch(self.keys[ids].tolist(), np.column_stack((left, top)).tolist())
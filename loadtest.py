@@ -0,0 +1,141 @@
+"""
+Test de charge du serveur de Pendu Deluxe (server.py)
+Pour chaque nombre de processus de service, lance le serveur sur un port libre puis
+des clients (plusieurs processus, chacun avec de nombreuses connexions asyncio) qui
+enchaînent les parties en proposant les lettres par ordre de fréquence. Le résultat
+est le nombre de coups (GUESS) servis par seconde.
+
+Usage:
+    python loadtest.py                                   # 1, 2, 4 et 8 processus
+    python loadtest.py --workers 1 4 --seconds 10 --clients 4 --connections 64
+"""
+import os       # Module pour compter les cœurs du processeur
+import sys      # Module système pour lancer le serveur et la sortie
+import time     # Module pour mesurer la durée des mesures
+import signal   # Module pour arrêter le serveur
+import socket   # Module pour trouver un port libre et attendre le serveur
+import asyncio  # Connexions simultanées de chaque client
+import argparse # Module pour lire les options de la ligne de commande
+import subprocess  # Module pour lancer le serveur
+from concurrent.futures import ProcessPoolExecutor  # Clients sur plusieurs cœurs
+
+from strategies import letter_frequencies, playable_words
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+READY_TIMEOUT = 10.0  # Secondes d'attente du démarrage du serveur
+
+def free_port():
+    """
+    Demande au système un port TCP libre
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_ready(port, timeout=READY_TIMEOUT):
+    """
+    Attend que le serveur accepte les connexions
+    
+    Raises:
+        TimeoutError: si le serveur ne répond pas à temps
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"le serveur ne répond pas sur le port {port}")
+            time.sleep(0.05)
+
+async def play_games(port, order, deadline, counts):
+    """
+    Une connexion : enchaîne les parties jusqu'à l'échéance
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(b"NEW\n")
+            await reader.readline()
+            for letter in order:
+                writer.write(f"GUESS {letter}\n".encode("ascii"))
+                reply = await reader.readline()
+                counts[0] += 1
+                if not reply.startswith(b"PLAY") or time.perf_counter() >= deadline:
+                    break
+    finally:
+        writer.write(b"QUIT\n")
+        writer.close()
+
+def run_client(task):
+    """
+    Processus client : lance ses connexions et compte les réponses (exécuté dans le pool)
+    
+    Args:
+        task: (port, nombre de connexions, ordre des lettres, instant de départ, durée)
+    
+    Returns:
+        int: coups servis pendant la mesure
+    """
+    port, connections, order, start, seconds = task
+    time.sleep(max(0.0, start - time.time()))  # Départ commun à tous les clients
+    counts = [0]
+    
+    async def run():
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(play_games(port, order, deadline, counts) for _ in range(connections)))
+    
+    asyncio.run(run())
+    return counts[0]
+
+def measure(workers, clients, connections, seconds, order):
+    """
+    Lance un serveur à workers processus et mesure les coups servis par seconde
+    """
+    port = free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(SCRIPT_DIR, "server.py"),
+                               "--port", str(port), "--workers", str(workers)],
+                              stdout=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        start = time.time() + 0.5
+        with ProcessPoolExecutor(clients) as pool:
+            tasks = [(port, connections, order, start, seconds)] * clients
+            guesses = sum(pool.map(run_client, tasks))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+    return guesses / seconds
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du test de charge
+    """
+    parser = argparse.ArgumentParser(description="Test de charge du serveur de Pendu Deluxe")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="nombres de processus de service à comparer")
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 1,
+                        help="processus clients")
+    parser.add_argument("--connections", type=int, default=32, help="connexions par client")
+    parser.add_argument("--seconds", type=float, default=5.0, help="durée de chaque mesure")
+    options = parser.parse_args(argv)
+    
+    counts = letter_frequencies(playable_words())
+    order = sorted(counts, key=lambda letter: (-counts[letter], letter))
+    print(f"{options.clients} clients x {options.connections} connexions, "
+          f"{options.seconds:.0f} s par mesure, {os.cpu_count()} cœur(s)")
+    print(f"{'processus':>10} {'coups/s':>12} {'accélération':>13}")
+    baseline = None
+    for workers in options.workers:
+        try:
+            rate = measure(workers, options.clients, options.connections, options.seconds, order)
+        except (OSError, TimeoutError) as e:
+            print(f"Mesure impossible avec {workers} processus: {e}")
+            return 1
+        baseline = baseline or rate
+        print(f"{workers:>10} {rate:>12,.0f} {rate / baseline:>12.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Point de mesure HTTP de Pendu Deluxe (format texte de Prometheus)
+Un fil d'arrière-plan sert GET /metrics sur un port local (bibliothèque standard
+seulement). La boucle de jeu ne prend aucun verrou :
+- les compteurs de partie (parties, coups, indices, erreurs audio) sont les entiers
+  que le jeu tient déjà à jour ; ils ne sont lus qu'au moment de la collecte
+- les jauges (particules, lettres tombantes, images par seconde) sont lues à la collecte
+- les histogrammes (durée des frames, des phases update et draw) sont le seul travail
+  ajouté à chaque frame : une recherche du seau et deux additions par mesure
+Un seul fil écrit (la boucle de jeu) : une collecte peut voir une frame à moitié
+enregistrée (un seau compté, la somme pas encore), écart sans effet sur les taux.
+
+Usage:
+    python hangman.py --metrics-port 9464
+    curl http://127.0.0.1:9464/metrics
+"""
+import bisect   # Module pour trouver le seau d'une mesure
+import math     # Module pour les bornes infinies
+import threading  # Fil du serveur HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_METRICS_HOST = "127.0.0.1"  # Local seulement : le point de mesure n'est pas authentifié
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+FRAME_BUCKETS = [0.008, 0.0167, 0.02, 0.025, 0.0333, 0.05, 0.1, 0.25, 1.0]  # Secondes
+PHASE_BUCKETS = [0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.0333, 0.1]    # Secondes
+
+def format_value(value):
+    """
+    Écrit une valeur comme l'attend le format texte de Prometheus
+    """
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+def escape_help(text):
+    """
+    Échappe le texte d'aide d'une mesure (barres obliques inverses et fins de ligne)
+    """
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+class Counter:
+    """
+    Compteur croissant ; la valeur vient de inc() ou d'une fonction lue à la collecte
+    """
+    kind = "counter"
+    
+    def __init__(self, name, help_text, read=None):
+        """
+        Args:
+            name: nom de la mesure (suffixe _total)
+            help_text: description affichée par Prometheus
+            read: fonction sans argument qui donne la valeur (optionnel)
+        """
+        self.name = name
+        self.help_text = help_text
+        self.read = read
+        self.value = 0
+    
+    def inc(self, amount=1):
+        self.value += amount
+    
+    def samples(self):
+        """
+        Returns:
+            list: (nom, valeur) des lignes de la mesure
+        """
+        return [(self.name, self.read() if self.read is not None else self.value)]
+
+class Gauge(Counter):
+    """
+    Valeur qui monte et descend ; donnée par set() ou lue à la collecte
+    """
+    kind = "gauge"
+    
+    def set(self, value):
+        self.value = value
+
+class Histogram:
+    """
+    Histogramme à seaux fixes (bornes supérieures, en secondes)
+    """
+    kind = "histogram"
+    
+    def __init__(self, name, help_text, buckets):
+        """
+        Args:
+            name: nom de la mesure (suffixe _seconds)
+            help_text: description affichée par Prometheus
+            buckets: bornes supérieures croissantes des seaux
+        """
+        self.name = name
+        self.help_text = help_text
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Dernier seau : au-delà de la dernière borne
+        self.sum = 0.0
+    
+    def observe(self, value):
+        """
+        Ajoute une mesure (appelé depuis la boucle de jeu seulement)
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+    
+    def samples(self):
+        """
+        Returns:
+            list: (nom, valeur) des seaux cumulés, de la somme et du nombre de mesures
+        """
+        counts = list(self.counts)  # Copie : le total reste cohérent avec les seaux
+        lines, total = [], 0
+        for edge, count in zip(self.buckets + [math.inf], counts):
+            total += count
+            lines.append((f'{self.name}_bucket{{le="{format_value(edge)}"}}', total))
+        lines.append((f"{self.name}_sum", self.sum))
+        lines.append((f"{self.name}_count", total))
+        return lines
+
+class MetricsRegistry:
+    """
+    Ensemble des mesures exposées par un processus
+    """
+    
+    def __init__(self):
+        self.metrics = []
+    
+    def add(self, metric):
+        """
+        Enregistre une mesure et la retourne
+        
+        Raises:
+            ValueError: si une mesure porte déjà ce nom
+        """
+        if any(existing.name == metric.name for existing in self.metrics):
+            raise ValueError(f"mesure déjà enregistrée: {metric.name}")
+        self.metrics.append(metric)
+        return metric
+    
+    def counter(self, name, help_text, read=None):
+        return self.add(Counter(name, help_text, read))
+    
+    def gauge(self, name, help_text, read=None):
+        return self.add(Gauge(name, help_text, read))
+    
+    def histogram(self, name, help_text, buckets):
+        return self.add(Histogram(name, help_text, buckets))
+    
+    def render(self):
+        """
+        Écrit toutes les mesures au format texte de Prometheus
+        
+        Returns:
+            str: une ligne HELP et TYPE par mesure, puis ses valeurs
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {escape_help(metric.help_text)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, value in metric.samples():
+                lines.append(f"{name} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Répond à GET /metrics avec les mesures du registre du serveur
+    """
+    
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Une ligne par collecte ralentirait la console du jeu
+
+class MetricsServer:
+    """
+    Serveur HTTP des mesures dans un fil d'arrière-plan
+    """
+    
+    def __init__(self, registry, host=DEFAULT_METRICS_HOST, port=0):
+        """
+        Args:
+            registry: MetricsRegistry exposé
+            host, port: adresse d'écoute (port 0 : choisi par le système)
+        
+        Raises:
+            OSError: si le port ne peut pas être ouvert
+        """
+        self.httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.registry = registry
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics", daemon=True)
+    
+    @property
+    def address(self):
+        return self.httpd.server_address[:2]
+    
+    def start(self):
+        self.thread.start()
+        return self
+    
+    def close(self):
+        """
+        Arrête le serveur et libère le port
+        """
+        if self.thread.is_alive():
+            self.httpd.shutdown()
+        self.httpd.server_close()
+
+class GameMetrics:
+    """
+    Mesures d'une instance du jeu (voir HangmanDeluxe.stats)
+    """
+    
+    def __init__(self, game, fps=None, registry=None):
+        """
+        Args:
+            game: HangmanDeluxe (lu à la collecte : stats, particles, falling_letters, audio)
+            fps: fonction qui donne les images par seconde récentes (optionnel)
+            registry: MetricsRegistry à compléter (par défaut un nouveau)
+        """
+        self.registry = registry or MetricsRegistry()
+        add = self.registry
+        self.frame = add.histogram("hangman_frame_seconds", "Intervalle entre deux frames affichées",
+                                   FRAME_BUCKETS)
+        self.update = add.histogram("hangman_update_seconds", "Durée de la phase update d'une frame",
+                                    PHASE_BUCKETS)
+        self.draw = add.histogram("hangman_draw_seconds",
+                                  "Durée de la phase draw d'une frame (rendu et affichage)",
+                                  PHASE_BUCKETS)
+        if fps is not None:
+            add.gauge("hangman_fps", "Images par seconde récentes", fps)
+        add.gauge("hangman_particles", "Particules d'effets vivantes", lambda: len(game.particles))
+        add.gauge("hangman_falling_letters", "Lettres tombantes", lambda: len(game.falling_letters))
+        for key, help_text in [("games_started", "Parties commencées"),
+                               ("games_won", "Parties gagnées"),
+                               ("games_lost", "Parties perdues"),
+                               ("guesses", "Lettres proposées"),
+                               ("hints_used", "Indices utilisés"),
+                               ("audio_errors", "Erreurs du système audio")]:
+            add.counter(f"hangman_{key}_total", help_text, lambda key=key: game.stats[key])
+        add.counter("hangman_sounds_played_total", "Effets sonores lancés",
+                    lambda: game.audio.stats["played"] if game.audio is not None else 0)
+        self.last_presented = None
+    
+    def frame_presented(self, started, updated, presented):
+        """
+        Enregistre une frame (instants time.perf_counter())
+        
+        Args:
+            started: début de la phase update
+            updated: fin de la phase update, début de la phase draw
+            presented: frame affichée
+        """
+        self.update.observe(updated - started)
+        self.draw.observe(presented - updated)
+        if self.last_presented is not None:
+            self.frame.observe(presented - self.last_presented)
+        self.last_presented = presented
@@ -0,0 +1,408 @@
+"""
+Moteurs de rendu de Pendu Deluxe
+Le jeu décrit chaque frame sous forme de scène (liste ordonnée de commandes) et un
+moteur de rendu l'exécute :
+- SoftwareRenderer : blits pygame.Surface classiques sur la fenêtre
+- ScaledRenderer : comme SoftwareRenderer, mais les sprites du décor sont dessinés dans
+  une image réduite puis agrandie (les calques d'interface restent nets)
+- TextureRenderer : textures SDL2 (pygame._sdl2.video) avec rotation et
+  transparence calculées par la carte graphique
+"""
+import pygame   # Bibliothèque principale pour créer des jeux 2D
+
+# === TYPES DE COMMANDES DE SCÈNE ===
+SPRITE = 0  # Sprite mis en cache, éventuellement tourné et transparent
+LAYER = 1   # Calque dessiné avec les fonctions de dessin de pygame
+BATCH = 2   # Lot de sprites sans rotation ni transparence réglée au dessin (Surface.blits)
+
+RENDERER_BACKENDS = ["software", "gpu"]
+RENDER_SCALES = [1.0, 0.75, 0.5]  # Échelles de rendu proposées (1.0 = pleine résolution)
+
+class Scene:
+    """
+    Description d'une frame indépendante du moteur de rendu
+    Les commandes sont exécutées dans l'ordre d'ajout (de l'arrière-plan vers l'avant)
+    """
+    
+    def __init__(self):
+        """
+        Constructeur d'une scène vide
+        """
+        self.commands = []  # Liste des commandes de la frame
+    
+    def clear(self):
+        """
+        Vide la scène pour décrire la frame suivante (réutilise la liste)
+        """
+        self.commands.clear()
+    
+    def sprite(self, key, x, y, angle=0, alpha=255, centered=False):
+        """
+        Ajoute un sprite de la SpriteCache à dessiner
+        
+        Args:
+            key: clé du sprite dans la SpriteCache (tuple dont le premier élément est le type)
+            x, y: position du coin haut-gauche (ou du centre si centered)
+            angle: rotation en degrés (sens anti-horaire, comme pygame.transform.rotate)
+            alpha: transparence globale du sprite (0 à 255)
+            centered: True si (x, y) désigne le centre du sprite
+        """
+        self.commands.append((SPRITE, key, x, y, angle, alpha, centered))
+    
+    def layer(self, draw_function):
+        """
+        Ajoute un calque dessiné par une fonction de dessin classique
+        
+        Args:
+            draw_function: fonction appelée avec la surface où dessiner
+        """
+        self.commands.append((LAYER, draw_function))
+    
+    def batch(self, keys, positions):
+        """
+        Ajoute un lot de sprites dessinés tels quels, dans l'ordre (une seule commande
+        pour des milliers de sprites : le rendu logiciel les passe à Surface.blits)
+        
+        Args:
+            keys: clés des sprites dans la SpriteCache, une par sprite
+            positions: coins haut-gauche [x, y] entiers, un par sprite
+        """
+        self.commands.append((BATCH, keys, positions))
+
+class SpriteCache:
+    """
+    Cache des sprites de la scène (glyphes, particules, panneaux...)
+    Chaque type de sprite a une fonction de fabrication appelée une seule fois par clé
+    """
+    
+    def __init__(self):
+        """
+        Constructeur d'un cache vide
+        """
+        self.factories = {}  # Type de sprite -> fonction de fabrication
+        self.surfaces = {}   # Clé complète -> surface déjà fabriquée
+    
+    def register(self, kind, factory):
+        """
+        Enregistre la fonction qui fabrique les sprites d'un type donné
+        
+        Args:
+            kind: type de sprite (premier élément des clés)
+            factory: fonction appelée avec les autres éléments de la clé
+        """
+        self.factories[kind] = factory
+    
+    def get(self, key):
+        """
+        Retourne la surface d'un sprite, fabriquée au premier appel
+        
+        Args:
+            key: tuple (type, paramètres...)
+        
+        Returns:
+            pygame.Surface: surface du sprite
+        """
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self.factories[key[0]](*key[1:])
+        return surface
+
+def blit_sprite(target, surface, x, y, angle, alpha, centered):
+    """
+    Dessine un sprite de la scène sur une surface (rotation et transparence logicielles)
+    
+    Args:
+        target: surface où dessiner
+        surface: surface du sprite (en cache)
+        x, y, angle, alpha, centered: paramètres de la commande (voir Scene.sprite)
+    """
+    if angle:
+        # La rotation crée une nouvelle surface : on peut modifier sa transparence
+        surface = pygame.transform.rotate(surface, angle)
+        if alpha < 255:
+            surface.set_alpha(alpha)
+    elif alpha < 255 or surface.get_alpha() not in (None, 255):
+        # Sprite en cache : la transparence est réglée avant chaque utilisation
+        surface.set_alpha(alpha)
+    
+    if centered:
+        target.blit(surface, surface.get_rect(center=(x, y)))
+    else:
+        target.blit(surface, (x, y))
+
+class SoftwareRenderer:
+    """
+    Moteur de rendu logiciel : exécute la scène avec des blits sur une surface pygame
+    """
+    
+    def __init__(self, screen):
+        """
+        Args:
+            screen: surface où dessiner (la fenêtre en général)
+        """
+        self.screen = screen
+    
+    def render(self, scene, sprites):
+        """
+        Dessine toutes les commandes de la scène
+        
+        Args:
+            scene: Scene à dessiner
+            sprites: SpriteCache qui fournit les surfaces des sprites
+        """
+        screen = self.screen
+        for command in scene.commands:
+            if command[0] == SPRITE:
+                _, key, x, y, angle, alpha, centered = command
+                blit_sprite(screen, sprites.get(key), x, y, angle, alpha, centered)
+            elif command[0] == BATCH:
+                screen.blits(zip(map(sprites.get, command[1]), command[2]), doreturn=False)
+            else:
+                command[1](screen)
+    
+    def present(self):
+        """
+        Affiche la frame dessinée
+        """
+        pygame.display.flip()
+
+class ScaledRenderer:
+    """
+    Moteur de rendu logiciel à résolution interne réduite
+    Les sprites placés avant le premier calque (fond, lettres tombantes, panneaux) sont
+    dessinés dans une image réduite, agrandie ensuite à la taille de la fenêtre : le
+    travail de transparence par pixel diminue avec le carré de l'échelle.
+    Les calques (texte, pendu, écran de fin) sont toujours dessinés en pleine résolution
+    par-dessus, car leurs fonctions de dessin utilisent les coordonnées de la fenêtre.
+    """
+    
+    def __init__(self, screen, scale, native_overlays=True, smooth=False):
+        """
+        Args:
+            screen: surface de la fenêtre
+            scale: échelle de rendu du décor (ex: 0.5 pour une image 4 fois plus petite)
+            native_overlays: les sprites dessinés après un calque (particules) restent en
+                pleine résolution et au-dessus de l'interface ; sinon ils passent aussi
+                dans l'image réduite, donc sous l'interface
+            smooth: agrandissement lissé (smoothscale) plutôt qu'au plus proche voisin ;
+                plus joli mais environ 1,8 ms par frame en 1000x700, ce qui annule le gain
+        """
+        self.screen = screen
+        self.scale = scale
+        self.native_overlays = native_overlays
+        self.smooth = smooth
+        width, height = screen.get_size()
+        self.buffer = pygame.Surface((max(1, round(width * scale)), max(1, round(height * scale))))
+        if pygame.display.get_surface() is not None:
+            self.buffer = self.buffer.convert(screen)
+        self.scaled_sprites = {}  # Clé de sprite -> surface réduite
+    
+    def scaled_sprite(self, key, sprites):
+        """
+        Retourne un sprite réduit à l'échelle de rendu (réduit une seule fois par clé)
+        """
+        surface = self.scaled_sprites.get(key)
+        if surface is None:
+            original = sprites.get(key)
+            width, height = original.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            if original.get_bitsize() >= 24:
+                surface = pygame.transform.smoothscale(original, size)
+            else:  # smoothscale n'accepte que les surfaces 24 ou 32 bits
+                surface = pygame.transform.scale(original, size)
+            self.scaled_sprites[key] = surface
+        return surface
+    
+    def render(self, scene, sprites):
+        """
+        Dessine la scène : décor réduit puis agrandi, interface en pleine résolution
+        
+        Args:
+            scene: Scene à dessiner
+            sprites: SpriteCache qui fournit les surfaces des sprites
+        """
+        buffer, screen, scale = self.buffer, self.screen, self.scale
+        
+        # === DÉCOR EN RÉSOLUTION RÉDUITE ===
+        first_layer = len(scene.commands)
+        for index, command in enumerate(scene.commands):
+            if command[0] == LAYER:
+                if self.native_overlays:
+                    first_layer = index
+                    break
+                first_layer = min(first_layer, index)
+                continue
+            if command[0] == BATCH:
+                _, keys, positions = command
+                buffer.blits(zip([self.scaled_sprite(key, sprites) for key in keys],
+                                 [(x * scale, y * scale) for x, y in positions]), doreturn=False)
+                continue
+            _, key, x, y, angle, alpha, centered = command
+            blit_sprite(buffer, self.scaled_sprite(key, sprites), x * scale, y * scale,
+                        angle, alpha, centered)
+        
+        # === AGRANDISSEMENT À LA TAILLE DE LA FENÊTRE ===
+        if self.smooth:
+            pygame.transform.smoothscale(buffer, screen.get_size(), screen)
+        else:
+            pygame.transform.scale(buffer, screen.get_size(), screen)
+        
+        # === INTERFACE EN PLEINE RÉSOLUTION ===
+        for command in scene.commands[first_layer:]:
+            if command[0] == LAYER:
+                command[1](screen)
+            elif not self.native_overlays:
+                continue
+            elif command[0] == BATCH:
+                screen.blits(zip(map(sprites.get, command[1]), command[2]), doreturn=False)
+            else:
+                _, key, x, y, angle, alpha, centered = command
+                blit_sprite(screen, sprites.get(key), x, y, angle, alpha, centered)
+    
+    def present(self):
+        """
+        Affiche la frame dessinée
+        """
+        pygame.display.flip()
+
+class TextureRenderer:
+    """
+    Moteur de rendu accéléré basé sur pygame._sdl2.video
+    Les sprites sont envoyés une seule fois à la carte graphique sous forme de textures ;
+    la rotation et la transparence sont appliquées au moment du dessin.
+    Les calques sont dessinés sur des surfaces transparentes puis envoyés à chaque frame.
+    """
+    
+    def __init__(self, size, title, accelerated=True):
+        """
+        Crée la fenêtre et le moteur de rendu SDL2
+        
+        Args:
+            size: dimensions de la fenêtre
+            title: titre de la fenêtre
+            accelerated: exige un pilote de rendu accéléré par la carte graphique
+        
+        Raises:
+            ImportError: si pygame._sdl2 n'est pas disponible
+            pygame.error: si aucun pilote de rendu ne convient
+        """
+        from pygame._sdl2 import video  # Module expérimental de pygame 2
+        
+        self.video = video
+        self.size = size
+        self.window = video.Window(title, size)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1 if accelerated else 0)
+        except video.error as e:
+            self.window.destroy()  # Pas de fenêtre orpheline avant le repli logiciel
+            raise pygame.error(str(e))
+        
+        self.textures = {}        # Clé de sprite -> texture
+        self.layer_surfaces = []  # Surfaces transparentes des calques (une par calque)
+        self.layer_textures = []  # Textures correspondantes, mises à jour à chaque frame
+    
+    def texture(self, key, sprites):
+        """
+        Retourne la texture d'un sprite, envoyée à la carte graphique au premier appel
+        """
+        texture = self.textures.get(key)
+        if texture is None:
+            texture = self.textures[key] = self.video.Texture.from_surface(
+                self.renderer, sprites.get(key))
+            texture.blend_mode = 1  # SDL_BLENDMODE_BLEND : transparence activée
+        return texture
+    
+    def layer(self, index):
+        """
+        Retourne la surface et la texture du calque numéro index (créées au premier appel)
+        """
+        while len(self.layer_surfaces) <= index:
+            self.layer_surfaces.append(pygame.Surface(self.size, pygame.SRCALPHA))
+            texture = self.video.Texture(self.renderer, self.size, streaming=True)
+            texture.blend_mode = 1
+            self.layer_textures.append(texture)
+        return self.layer_surfaces[index], self.layer_textures[index]
+    
+    def render(self, scene, sprites):
+        """
+        Dessine toutes les commandes de la scène
+        
+        Args:
+            scene: Scene à dessiner
+            sprites: SpriteCache qui fournit les surfaces des sprites
+        """
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        
+        layer_index = 0
+        for command in scene.commands:
+            if command[0] == SPRITE:
+                _, key, x, y, angle, alpha, centered = command
+                texture = self.texture(key, sprites)
+                texture.alpha = alpha
+                width, height = texture.width, texture.height
+                if centered:
+                    x, y = x - width / 2, y - height / 2
+                # SDL tourne dans le sens horaire, pygame dans le sens anti-horaire
+                texture.draw(dstrect=(int(x), int(y), width, height), angle=-angle)
+            elif command[0] == BATCH:
+                # Rotation et transparence sont déjà dans les sprites du lot
+                for key, (x, y) in zip(command[1], command[2]):
+                    texture = self.texture(key, sprites)
+                    texture.alpha = 255
+                    texture.draw(dstrect=(x, y, texture.width, texture.height))
+            else:
+                surface, texture = self.layer(layer_index)
+                layer_index += 1
+                surface.fill((0, 0, 0, 0))
+                command[1](surface)
+                texture.update(surface)
+                texture.draw()
+    
+    def present(self):
+        """
+        Affiche la frame dessinée
+        """
+        self.renderer.present()
+    
+    def close(self):
+        """
+        Libère les textures, puis le moteur de rendu, puis la fenêtre (dans cet ordre :
+        détruire la fenêtre sous un Renderer encore vivant fait planter SDL)
+        """
+        self.textures.clear()
+        self.layer_textures.clear()
+        self.layer_surfaces.clear()
+        del self.renderer
+        del self.window
+
+def create_renderer(backend, size, title, render_scale=1.0, native_overlays=True, smooth=False):
+    """
+    Crée le moteur de rendu demandé, avec repli sur le rendu logiciel
+    
+    Args:
+        backend: 'software' ou 'gpu'
+        size: dimensions de la fenêtre
+        title: titre de la fenêtre
+        render_scale: échelle de rendu du décor en logiciel (1.0 = pleine résolution)
+        native_overlays, smooth: voir ScaledRenderer
+    
+    Returns:
+        SoftwareRenderer, ScaledRenderer ou TextureRenderer
+    """
+    if backend == "gpu":
+        try:
+            renderer = TextureRenderer(size, title)
+            print("Rendu accéléré (textures SDL2) activé")
+            if render_scale < 1.0:
+                print("L'échelle de rendu ne s'applique qu'au rendu logiciel")
+            return renderer
+        except (ImportError, pygame.error) as e:
+            print(f"Rendu accéléré indisponible ({e}), utilisation du rendu logiciel")
+    
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(title)
+    if render_scale < 1.0:
+        print(f"Rendu du décor à l'échelle {render_scale:g}")
+        return ScaledRenderer(screen, render_scale, native_overlays, smooth)
+    return SoftwareRenderer(screen)
@@ -0,0 +1,157 @@
+"""
+Règles du pendu indépendantes de l'affichage
+Partagées par le jeu (hangman.py), le solveur et les outils de simulation
+"""
+import random   # Module pour choisir les lettres révélées par un indice
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # Lettres que le joueur peut proposer
+MAX_PENALTIES = 10  # Nombre d'erreurs autorisées avant la défaite
+HINT_PENALTY = 5    # Pénalités ajoutées par un indice
+
+def is_playable(word):
+    """
+    Indique si un mot peut être trouvé uniquement avec les touches A-Z
+    
+    Args:
+        word: mot en majuscules
+    
+    Returns:
+        bool: False si le mot contient des accents, tirets, espaces...
+    """
+    return bool(word) and all(letter in ALPHABET for letter in word)
+
+def letter_mask(word, letter):
+    """
+    Calcule les positions d'une lettre dans un mot sous forme de masque de bits
+    
+    Args:
+        word: mot à deviner
+        letter: lettre proposée
+    
+    Returns:
+        int: bit i à 1 si word[i] == letter (0 si la lettre est absente)
+    """
+    mask = 0
+    for i, word_letter in enumerate(word):
+        if word_letter == letter:
+            mask |= 1 << i
+    return mask
+
+def masked_pattern(word, guessed_letters):
+    """
+    Retourne le mot tel que le joueur le voit (lettres non trouvées remplacées par '_')
+    
+    Args:
+        word: mot à deviner
+        guessed_letters: lettres déjà proposées
+    """
+    return "".join(letter if letter in guessed_letters else "_" for letter in word)
+
+def is_solved(word, guessed_letters):
+    """
+    Indique si toutes les lettres du mot ont été trouvées
+    """
+    return all(letter in guessed_letters for letter in word)
+
+def hint_letter_count(word):
+    """
+    Nombre de lettres révélées par un indice : 1 si le mot fait moins de 6 caractères, 2 sinon
+    """
+    return 1 if len(word) < 6 else 2
+
+def hint_letters(word, guessed_letters, rng=random):
+    """
+    Choisit au hasard les lettres révélées par un indice parmi celles pas encore trouvées
+    
+    Args:
+        word: mot à deviner
+        guessed_letters: lettres déjà proposées
+        rng: générateur aléatoire
+    
+    Returns:
+        list: lettres à révéler (vide si tout le mot est déjà découvert)
+    """
+    unrevealed_letters = sorted(set(word) - set(guessed_letters))  # Trié : tirage reproductible
+    return rng.sample(unrevealed_letters, min(hint_letter_count(word), len(unrevealed_letters)))
+
+class Round:
+    """
+    Une partie de pendu sans affichage : mêmes règles que HangmanDeluxe.guess_letter
+    et HangmanDeluxe.give_hint, pour les simulations et les joueurs automatiques
+    """
+    
+    def __init__(self, word, max_penalties=MAX_PENALTIES, rng=random):
+        """
+        Args:
+            word: mot à deviner
+            max_penalties: nombre de pénalités entraînant la défaite
+            rng: générateur aléatoire des indices
+        """
+        self.word = word
+        self.max_penalties = max_penalties
+        self.rng = rng
+        self.guessed_letters = set()  # Lettres proposées ou révélées par un indice
+        self.wrong_letters = set()    # Lettres incorrectes uniquement
+        self.penalties = 0
+        self.hints_used = 0
+        self.game_over = False
+        self.won = False
+    
+    @property
+    def pattern(self):
+        """
+        Mot tel que le joueur le voit ('_' pour les lettres cachées)
+        """
+        return masked_pattern(self.word, self.guessed_letters)
+    
+    @property
+    def hint_available(self):
+        """
+        Un indice est possible tant que la partie continue et qu'il reste des lettres cachées
+        """
+        return not self.game_over and not is_solved(self.word, self.guessed_letters)
+    
+    def guess(self, letter):
+        """
+        Propose une lettre
+        
+        Returns:
+            bool: True si la lettre pouvait être proposée
+        """
+        if letter in self.guessed_letters or self.game_over:
+            return False  # Lettre déjà proposée ou jeu terminé
+        
+        self.guessed_letters.add(letter)
+        if letter not in self.word:
+            self.wrong_letters.add(letter)
+            self.penalties += 1
+        
+        if is_solved(self.word, self.guessed_letters):
+            self.won = True
+            self.game_over = True
+        if self.penalties >= self.max_penalties:
+            self.game_over = True
+        return True
+    
+    def hint(self):
+        """
+        Révèle des lettres contre HINT_PENALTY pénalités
+        
+        Returns:
+            list: lettres révélées (vide si aucun indice n'était possible)
+        """
+        if not self.hint_available:
+            return []
+        
+        revealed = hint_letters(self.word, self.guessed_letters, self.rng)
+        self.guessed_letters.update(revealed)
+        self.penalties += HINT_PENALTY
+        self.hints_used += 1
+        
+        # Un indice qui complète le mot gagne même s'il dépasse la limite de pénalités
+        if is_solved(self.word, self.guessed_letters):
+            self.won = True
+            self.game_over = True
+        elif self.penalties >= self.max_penalties:
+            self.game_over = True
+        return revealed
@@ -0,0 +1,407 @@
+"""
+Tirage des mots de Pendu Deluxe
+- AliasTable : tirage pondéré en temps constant (méthode des alias de Walker/Vose)
+- ShuffleBag : sac de tirage sans remise, aucun mot ne revient avant que le sac soit vide
+- WordSampler : choisit une liste (catégorie, niveau...) selon son poids puis un mot dans
+  le sac de cette liste, avec un sac par joueur
+
+L'état des sacs s'enregistre en JSON : une borne ou un serveur qui redémarre garde la
+garantie « pas de répétition » de chaque joueur. SamplerJournal n'écrit à chaque tirage
+qu'une ligne (la case retirée du sac) à la suite de l'état complet ; celui-ci n'est
+réécrit que lorsque le journal devient plus long que lui.
+"""
+import os       # Module pour les chemins de fichiers
+import json     # Module pour enregistrer l'état des sacs
+import random   # Module pour générer des valeurs aléatoires
+import hashlib  # Module pour l'empreinte des listes de mots
+
+SAMPLER_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sampler_state.json")
+STATE_VERSION = 1
+JOURNAL_SUFFIX = ".log"      # Journal des tirages, à côté de l'état complet
+JOURNAL_MIN_ENTRIES = 1000   # Lignes de journal tolérées avant de réécrire l'état complet
+DEFAULT_PLAYER = "local"  # Joueur unique du jeu en local
+
+class AliasTable:
+    """
+    Table des alias : tirage d'un indice selon des poids en O(1)
+    Construction en O(n), chaque tirage coûte un nombre aléatoire et une comparaison
+    """
+    
+    def __init__(self, weights):
+        """
+        Args:
+            weights: poids positifs (au moins un poids non nul)
+        
+        Raises:
+            ValueError: si aucun poids n'est strictement positif
+        """
+        count = len(weights)
+        total = float(sum(weights))
+        if count == 0 or total <= 0:
+            raise ValueError("la table des alias demande au moins un poids positif")
+        
+        # Probabilités mises à l'échelle : la moyenne vaut 1
+        scaled = [weight * count / total for weight in weights]
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+        
+        # === MÉTHODE DE VOSE ===
+        # Chaque case « petite » est complétée par une case « grande »
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Les cases restantes valent 1 aux erreurs d'arrondi près
+        for i in small + large:
+            self.probability[i] = 1.0
+    
+    def __len__(self):
+        return len(self.probability)
+    
+    def sample(self, rng=random):
+        """
+        Tire un indice selon les poids
+        
+        Args:
+            rng: générateur aléatoire (module random ou random.Random)
+        
+        Returns:
+            int: indice tiré
+        """
+        column = rng.randrange(len(self.probability))
+        return column if rng.random() < self.probability[column] else self.alias[column]
+
+class ShuffleBag:
+    """
+    Sac de tirage sans remise sur les indices 0..size-1
+    Mélange de Fisher-Yates paresseux : seules les cases déplacées sont mémorisées,
+    ce qui garde chaque tirage en O(1) et la mémoire proportionnelle aux tirages faits
+    """
+    
+    def __init__(self, size, state=None):
+        """
+        Args:
+            size: nombre d'éléments du sac
+            state: état enregistré par get_state (optionnel)
+        """
+        self.size = size
+        self.remaining = size  # Éléments pas encore tirés dans ce tour
+        self.swaps = {}        # Case -> indice qui y a été déplacé
+        self.last = None       # Dernier indice tiré (évite la répétition entre deux tours)
+        if state is not None:
+            self.set_state(state)
+    
+    def draw(self, rng=random):
+        """
+        Tire un indice qui n'est pas sorti depuis le dernier remplissage du sac
+        
+        Args:
+            rng: générateur aléatoire
+        
+        Returns:
+            int: indice tiré
+        """
+        return self.take(self.pick(rng))
+    
+    def pick(self, rng=random):
+        """
+        Choisit au hasard la case du prochain tirage (sans modifier le sac)
+        """
+        remaining = self.remaining or self.size  # Sac vide : nouveau tour
+        slot = rng.randrange(remaining)
+        if remaining == self.size and self.size > 1 and self.swaps.get(slot, slot) == self.last:
+            # Premier tirage d'un tour : pas le même mot que le dernier du tour précédent
+            other = rng.randrange(remaining - 1)
+            slot = other + 1 if other >= slot else other
+        return slot
+    
+    def take(self, slot):
+        """
+        Retire une case du sac (le tirage ne dépend que de la case : le journal le rejoue)
+        
+        Args:
+            slot: case choisie par pick
+        
+        Returns:
+            int: indice tiré
+        """
+        if self.remaining == 0:  # Sac vide : nouveau tour
+            self.remaining = self.size
+            self.swaps.clear()
+        
+        # === ÉCHANGE AVEC LA DERNIÈRE CASE DU SAC ===
+        value = self.swaps.get(slot, slot)
+        end = self.remaining - 1
+        self.swaps[slot] = self.swaps.pop(end, end)
+        if slot == end:
+            del self.swaps[slot]
+        self.remaining = end
+        self.last = value
+        return value
+    
+    def get_state(self):
+        """
+        Retourne l'état du sac sous une forme enregistrable en JSON
+        """
+        return {
+            "remaining": self.remaining,
+            "swaps": [[slot, value] for slot, value in self.swaps.items()],
+            "last": self.last,
+        }
+    
+    def set_state(self, state):
+        """
+        Restaure un état enregistré par get_state
+        """
+        self.remaining = state["remaining"]
+        self.swaps = {slot: value for slot, value in state["swaps"]}
+        self.last = state["last"]
+
+def pool_fingerprint(words):
+    """
+    Calcule l'empreinte d'une liste de mots (l'ordre compte : les sacs stockent des indices)
+    Les listes de wordstore.py fournissent leur propre empreinte
+    """
+    fingerprint = getattr(words, "fingerprint", None)
+    if fingerprint is not None:
+        return fingerprint
+    return hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()
+
+class WordSampler:
+    """
+    Tirage pondéré d'une liste de mots puis d'un mot sans répétition
+    Par défaut une liste est choisie proportionnellement à sa taille : sur un tour
+    complet, chaque mot a la même chance de sortir quelle que soit sa liste.
+    """
+    
+    def __init__(self, pools, weights=None, rng=None):
+        """
+        Args:
+            pools: nom de liste -> liste de mots (ou toute séquence indexable)
+            weights: nom de liste -> poids (par défaut la taille des listes)
+            rng: générateur aléatoire (par défaut un random.Random dédié)
+        """
+        self.names = [name for name, words in pools.items() if words]
+        self.pools = [pools[name] for name in self.names]
+        self.fingerprints = [pool_fingerprint(words) for words in self.pools]
+        weights = weights or {}
+        self.table = AliasTable([weights.get(name, len(words))
+                                 for name, words in zip(self.names, self.pools)])
+        self.rng = rng or random.Random()
+        self.bags = {}  # Joueur -> un sac par liste
+        self.journal = None  # Liste des tirages (joueur, liste, case) à écrire, voir SamplerJournal
+    
+    def player_bags(self, player):
+        """
+        Retourne les sacs d'un joueur (créés au premier tirage)
+        """
+        bags = self.bags.get(player)
+        if bags is None:
+            bags = self.bags[player] = [ShuffleBag(len(words)) for words in self.pools]
+        return bags
+    
+    def draw(self, player=DEFAULT_PLAYER):
+        """
+        Tire un mot pour un joueur
+        
+        Args:
+            player: identifiant du joueur (chaque joueur a ses propres sacs)
+        
+        Returns:
+            tuple: (mot, nom de la liste)
+        """
+        pool = self.table.sample(self.rng)
+        bag = self.player_bags(player)[pool]
+        slot = bag.pick(self.rng)
+        if self.journal is not None:
+            self.journal.append((player, self.names[pool], slot))
+        return self.pools[pool][bag.take(slot)], self.names[pool]
+    
+    def get_state(self):
+        """
+        Retourne l'état des sacs de tous les joueurs sous une forme enregistrable en JSON
+        """
+        return {
+            "pools": dict(zip(self.names, self.fingerprints)),
+            "players": {player: {name: bag.get_state() for name, bag in zip(self.names, bags)}
+                        for player, bags in self.bags.items()},
+        }
+    
+    def memory_entries(self):
+        """
+        Taille de l'état des sacs (cases déplacées de tous les joueurs)
+        """
+        return sum(len(bag.swaps) + 1 for bags in self.bags.values() for bag in bags)
+    
+    def set_state(self, state):
+        """
+        Restaure l'état des sacs ; les sacs des listes modifiées repartent de zéro
+        """
+        saved_pools = state.get("pools", {})
+        for player, saved_bags in state.get("players", {}).items():
+            bags = self.player_bags(player)
+            for i, name in enumerate(self.names):
+                if name in saved_bags and saved_pools.get(name) == self.fingerprints[i]:
+                    bags[i].set_state(saved_bags[name])
+
+def load_sampler_state(samplers, path=SAMPLER_STATE_PATH):
+    """
+    Restaure l'état enregistré de plusieurs tirages
+    
+    Args:
+        samplers: nom -> WordSampler
+        path: chemin du fichier JSON
+    
+    Returns:
+        bool: True si un état a été restauré
+    """
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return False
+    
+    for name, sampler in samplers.items():
+        if name in state.get("samplers", {}):
+            sampler.set_state(state["samplers"][name])
+    replay_journal(samplers, state, path + JOURNAL_SUFFIX)
+    return True
+
+def replay_journal(samplers, state, path):
+    """
+    Rejoue les tirages écrits dans le journal après l'état complet
+    Seuls les sacs restaurés (même empreinte de liste) sont concernés ; la lecture
+    s'arrête à la première ligne illisible (écriture interrompue)
+    
+    Args:
+        samplers: nom -> WordSampler déjà restauré depuis state
+        state: état complet lu dans le fichier JSON
+        path: chemin du journal
+    
+    Returns:
+        int: nombre de tirages rejoués
+    """
+    try:
+        with open(path) as f:
+            lines = f.readlines()
+    except OSError:
+        return 0
+    
+    # Sacs rejouables : (tirage, liste) -> position de la liste
+    positions = {}
+    for name, sampler in samplers.items():
+        saved_pools = state.get("samplers", {}).get(name, {}).get("pools", {})
+        for i, (pool, fingerprint) in enumerate(zip(sampler.names, sampler.fingerprints)):
+            if saved_pools.get(pool) == fingerprint:
+                positions[name, pool] = i
+    
+    replayed = 0
+    for line in lines:
+        try:
+            name, player, pool, slot = json.loads(line)
+        except ValueError:
+            break
+        i = positions.get((name, pool))
+        if i is None:
+            continue
+        bag = samplers[name].player_bags(player)[i]
+        if not 0 <= slot < (bag.remaining or bag.size):
+            continue
+        bag.take(slot)
+        replayed += 1
+    return replayed
+
+def save_sampler_state(samplers, path=SAMPLER_STATE_PATH):
+    """
+    Enregistre l'état de plusieurs tirages
+    Écrit dans un fichier temporaire puis le renomme : pas d'état à moitié écrit
+    
+    Args:
+        samplers: nom -> WordSampler
+        path: chemin du fichier JSON
+    """
+    state = {
+        "version": STATE_VERSION,
+        "samplers": {name: sampler.get_state() for name, sampler in samplers.items()},
+    }
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
+    # Journal effacé avant de remplacer l'état : une interruption entre les deux perd
+    # quelques tirages, mais ne les rejoue jamais deux fois
+    try:
+        os.remove(path + JOURNAL_SUFFIX)
+    except FileNotFoundError:
+        pass
+    os.replace(temporary_path, path)
+
+class SamplerJournal:
+    """
+    Enregistrement incrémental de l'état des sacs
+    Chaque tirage ajoute une ligne au journal ; l'état complet n'est réécrit (et le
+    journal vidé) que lorsque le journal dépasse la taille de l'état : le coût reste
+    constant en moyenne par tirage, quel que soit le nombre de tirages déjà faits
+    """
+    
+    def __init__(self, path=SAMPLER_STATE_PATH):
+        """
+        Args:
+            path: chemin de l'état complet (le journal est path + JOURNAL_SUFFIX)
+        """
+        self.path = path
+        self.entries = 0  # Lignes du journal depuis le dernier état complet
+    
+    def load(self, samplers):
+        """
+        Restaure l'état complet puis le journal, et commence à noter les tirages
+        
+        Returns:
+            bool: True si un état a été restauré
+        """
+        restored = load_sampler_state(samplers, self.path)
+        self.save(samplers)  # Journal rejoué intégré à l'état complet
+        return restored
+    
+    def save(self, samplers):
+        """
+        Réécrit l'état complet et vide le journal
+        
+        Raises:
+            OSError: si le fichier ne peut pas être écrit
+        """
+        for sampler in samplers.values():
+            sampler.journal = []
+        self.entries = 0
+        save_sampler_state(samplers, self.path)
+    
+    def flush(self, samplers):
+        """
+        Écrit les tirages faits depuis le dernier appel
+        L'état complet est réécrit si un tirage a été remplacé (dictionnaire rechargé)
+        ou si le journal est devenu plus long que l'état
+        
+        Raises:
+            OSError: si le fichier ne peut pas être écrit
+        """
+        if any(sampler.journal is None for sampler in samplers.values()):
+            self.save(samplers)
+            return
+        lines = []
+        for name, sampler in samplers.items():
+            lines.extend(json.dumps([name, player, pool, slot], separators=(",", ":")) + "\n"
+                         for player, pool, slot in sampler.journal)
+            sampler.journal.clear()
+        if not lines:
+            return
+        self.entries += len(lines)
+        if self.entries > max(JOURNAL_MIN_ENTRIES, sum(sampler.memory_entries() for sampler in samplers.values())):
+            self.save(samplers)
+            return
+        with open(self.path + JOURNAL_SUFFIX, "a") as f:
+            f.writelines(lines)
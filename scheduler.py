@@ -0,0 +1,170 @@
+"""
+Cadence des frames de Pendu Deluxe selon l'activité du joueur
+- active : cadence normale (60 FPS)
+- idle : après un moment sans touche ni souris, quelques frames par seconde seulement ;
+  entre deux frames le processus dort dans pygame.event.wait au lieu de boucler
+- suspended : fenêtre réduite, cachée ou sans le focus, plus aucune frame n'est
+  dessinée jusqu'à son retour
+La première touche ou le premier mouvement de souris repasse immédiatement en cadence
+normale. Le temps processeur est compté par mode pour vérifier les économies.
+"""
+import time     # Module pour l'inactivité et la mesure du temps processeur
+
+import pygame   # Bibliothèque principale pour créer des jeux 2D
+
+ACTIVE = "active"
+IDLE = "idle"
+SUSPENDED = "suspended"
+MODES = [ACTIVE, IDLE, SUSPENDED]
+
+DEFAULT_IDLE_FPS = 10         # Cadence après la période d'inactivité
+DEFAULT_IDLE_SECONDS = 15.0   # Secondes sans action avant de ralentir
+SUSPENDED_WAIT_MS = 1000      # Attente maximale d'un événement quand rien n'est affiché
+
+# Événements qui comptent comme une action du joueur
+INPUT_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+}
+
+class FrameScheduler:
+    """
+    Choisit la cadence de la boucle de jeu et attend les événements entre deux frames
+    """
+    
+    def __init__(self, fps, idle_fps=DEFAULT_IDLE_FPS, idle_seconds=DEFAULT_IDLE_SECONDS, clock=None):
+        """
+        Args:
+            fps: cadence normale
+            idle_fps: cadence en inactivité (0 pour ne jamais ralentir)
+            idle_seconds: secondes sans action avant de ralentir
+            clock: pygame.time.Clock de la boucle (créée si absente)
+        """
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_seconds = idle_seconds
+        self.clock = clock or pygame.time.Clock()
+        
+        self.focused = True       # La fenêtre a le focus clavier
+        self.minimized = False    # La fenêtre est réduite ou cachée
+        self.last_input = time.perf_counter()
+        self.next_frame = 0.0     # Instant de la prochaine frame en mode idle
+        
+        # === TEMPS PAR MODE ===
+        # Secondes réelles et secondes de processeur passées dans chaque mode
+        self.mode = ACTIVE
+        self.wall = dict.fromkeys(MODES, 0.0)
+        self.cpu = dict.fromkeys(MODES, 0.0)
+        self.frames = dict.fromkeys(MODES, 0)
+        self.mark_wall = time.perf_counter()
+        self.mark_cpu = time.process_time()
+    
+    @property
+    def update_steps(self):
+        """
+        Mises à jour à faire pour cette frame : au ralenti, les animations avancent de
+        plusieurs pas par frame et gardent leur vitesse à l'écran
+        """
+        if self.mode == IDLE:
+            return max(1, round(self.fps / self.idle_fps))
+        return 1
+    
+    def current_mode(self, now):
+        """
+        Mode correspondant à l'état de la fenêtre et à la dernière action
+        """
+        if self.minimized or not self.focused:
+            return SUSPENDED
+        if self.idle_fps and now - self.last_input >= self.idle_seconds:
+            return IDLE
+        return ACTIVE
+    
+    def switch(self, mode):
+        """
+        Change de mode en attribuant le temps écoulé au mode précédent
+        """
+        wall, cpu = time.perf_counter(), time.process_time()
+        self.wall[self.mode] += wall - self.mark_wall
+        self.cpu[self.mode] += cpu - self.mark_cpu
+        self.mark_wall, self.mark_cpu = wall, cpu
+        self.mode = mode
+    
+    def notice(self, event):
+        """
+        Met à jour l'état de la fenêtre et l'inactivité avec un événement
+        """
+        if event.type in INPUT_EVENTS:
+            self.last_input = time.perf_counter()
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+    
+    def events(self):
+        """
+        Retourne les événements de la frame, en dormant d'abord si le mode le permet
+        En cadence normale, ne bloque jamais (l'attente est faite par tick())
+        
+        Returns:
+            list: événements pygame reçus
+        """
+        if self.mode == ACTIVE:
+            events = pygame.event.get()
+        else:
+            # === ATTENTE BLOQUANTE ===
+            # Le processus dort jusqu'au prochain événement ou à la prochaine frame
+            if self.mode == SUSPENDED:
+                timeout = SUSPENDED_WAIT_MS
+            else:
+                # Au moins 1 ms : wait(0) attendrait sans limite
+                timeout = max(1, int((self.next_frame - time.perf_counter()) * 1000))
+            first = pygame.event.wait(timeout)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+        
+        for event in events:
+            self.notice(event)
+        mode = self.current_mode(time.perf_counter())
+        if mode != self.mode:
+            self.switch(mode)
+            if mode == IDLE:
+                self.next_frame = 0.0  # Première frame au ralenti sans attendre
+        return events
+    
+    def frame_due(self):
+        """
+        Indique si une frame doit être dessinée maintenant
+        (en mode idle, un événement peut réveiller la boucle avant l'heure)
+        """
+        if self.mode == SUSPENDED:
+            return False
+        return self.mode == ACTIVE or time.perf_counter() >= self.next_frame
+    
+    def tick(self):
+        """
+        Termine une frame dessinée : attend la suivante en cadence normale, ou programme
+        la suivante en mode idle (l'attente se fait alors dans events())
+        """
+        self.frames[self.mode] += 1
+        if self.mode == ACTIVE:
+            self.clock.tick(self.fps)
+        else:
+            self.next_frame = time.perf_counter() + 1 / self.idle_fps
+            self.clock.tick()  # Garde get_rawtime() et get_fps() à jour
+    
+    def summary(self):
+        """
+        Résume le temps passé dans chaque mode
+        
+        Returns:
+            dict: mode -> secondes, frames dessinées et charge processeur moyenne (%)
+        """
+        self.switch(self.mode)
+        return {mode: {"seconds": self.wall[mode], "frames": self.frames[mode],
+                       "cpu_percent": 100 * self.cpu[mode] / self.wall[mode] if self.wall[mode] else 0.0}
+                for mode in MODES}
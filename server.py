@@ -0,0 +1,421 @@
+"""
+Serveur de parties de Pendu Deluxe sur plusieurs processus
+Le superviseur charge le dictionnaire une seule fois puis lance N processus (fork) qui
+héritent de sa mémoire sans la copier (copie à l'écriture). Chaque processus ouvre sa
+propre socket d'écoute sur le même port avec SO_REUSEPORT : le noyau répartit les
+connexions entre eux, et une connexion reste toute sa vie dans le processus qui l'a
+acceptée (ses parties n'ont donc besoin d'aucun verrou). Un processus qui plante est
+relancé par le superviseur.
+
+Protocole texte, une commande par ligne :
+    NEW             -> GAME <catégorie> <motif> <pénalités restantes>
+    GUESS <lettre>  -> PLAY <motif> <lettres fausses ou -> <pénalités restantes>
+                       WIN <mot> <pénalités> | LOSE <mot> <pénalités>
+    HINT            -> même réponse que GUESS
+    BEST            -> BEST <lettre> (lettre la plus fréquente parmi les mots compatibles)
+    STATS           -> STATS worker=<n> pid=<pid> sessions=<n> guesses=<n> hit_rate=<taux>
+    SAVE            -> SNAPSHOT <instantané en base64> (partie en cours, voir snapshot.py)
+    LOAD <base64>   -> même réponse que GUESS : la partie reprend sur cette connexion
+    QUIT
+Une commande refusée répond ERR <raison>.
+
+Usage:
+    python server.py --port 5050 --workers 4
+    python server.py --port 5050 --workers 2 --dictionary mots.pdw
+    python server.py --dictionary mots.pdd --watch-dictionary   # Rechargement à chaud
+"""
+import os       # Module pour créer et surveiller les processus
+import base64   # Module pour transmettre les instantanés en texte
+import binascii # Erreurs de décodage base64
+import gc       # Module du ramasse-miettes (gel des objets partagés avant le fork)
+import sys      # Module système pour la sortie
+import time     # Module pour espacer les redémarrages
+import random   # Module pour le tirage des mots de chaque processus
+import signal   # Module pour arrêter proprement les processus
+import socket   # Module pour les sockets d'écoute
+import asyncio  # Boucle d'événements de chaque processus
+import argparse # Module pour lire les options de la ligne de commande
+
+from candidates import CandidateCache, SharedCountTable, DEFAULT_MAX_BYTES
+from dictionary import WORD_CATEGORIES, load_compiled_dictionary
+from hotreload import DictionaryReloader, file_stamp, rebuild_sampler
+from rules import ALPHABET, Round, is_playable
+from sampler import WordSampler
+from snapshot import SnapshotCodec, restore_round, snapshot_round
+from wordstore import WordStore, is_word_store, pools_store
+
+DEFAULT_PORT = 5050
+RESTART_DELAY = 0.5     # Secondes avant de relancer un processus planté
+MAX_RESTARTS = 10       # Redémarrages tolérés dans la fenêtre ci-dessous
+RESTART_WINDOW = 60.0   # Secondes
+MAX_LINE = 128          # Longueur maximale d'une commande (LOAD et son instantané)
+WRITE_BUFFER = 64 * 1024  # Octets en attente d'envoi avant d'attendre le client
+
+def load_pools(dictionary=None):
+    """
+    Charge les mots jouables au clavier, rangés par catégorie
+    
+    Args:
+        dictionary: dictionnaire compilé (importer.py) ou base compacte (wordstore.py)
+    
+    Returns:
+        dict: catégorie -> mots (listes, ou vues de la base compacte)
+    """
+    if dictionary is None:
+        return {name: [word for word in words if is_playable(word)]
+                for name, words in WORD_CATEGORIES.items()}
+    if is_word_store(dictionary):
+        # Tableaux d'octets du trie : partagés page par page entre les processus (le
+        # cache des candidats est lu dans le trie, voir build_candidate_cache)
+        return WordStore.load(dictionary).category_views()
+    return load_compiled_dictionary(dictionary)  # Mots déjà normalisés en A-Z par importer.py
+
+def build_candidate_cache(pools, max_bytes=DEFAULT_MAX_BYTES, shared=None):
+    """
+    Indexe les mots de pools pour le cache des candidats
+    Pour une base compacte, les textes par longueur sont lus dans le trie : aucune
+    chaîne n'est créée par mot, et ces quelques grands textes restent partagés avec
+    les processus de service après le fork
+    
+    Args:
+        pools: catégorie -> mots (listes, ou vues de la base compacte)
+        max_bytes: budget mémoire du cache de chaque processus
+        shared: SharedCountTable commune aux processus (optionnel)
+    
+    Returns:
+        CandidateCache: index des mots
+    """
+    store = pools_store(pools)
+    if store is not None:
+        return CandidateCache(max_bytes=max_bytes, shared=shared, store=store)
+    words = [word for category in pools.values() for word in category]
+    return CandidateCache(words, max_bytes, shared)
+
+def state_line(game_round):
+    """
+    Réponse décrivant l'état d'une partie après un coup
+    """
+    if game_round.game_over:
+        return f"{'WIN' if game_round.won else 'LOSE'} {game_round.word} {game_round.penalties}"
+    wrong = "".join(sorted(game_round.wrong_letters)) or "-"
+    return f"PLAY {game_round.pattern} {wrong} {game_round.max_penalties - game_round.penalties}"
+
+def open_listener(host, port, reuse_port):
+    """
+    Crée une socket TCP liée à (host, port)
+    
+    Args:
+        reuse_port: active SO_REUSEPORT (plusieurs sockets sur le même port)
+    
+    Returns:
+        socket.socket: socket liée, pas encore en écoute
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+class Worker:
+    """
+    Processus de service : parties des connexions qu'il a acceptées
+    """
+    
+    def __init__(self, index, pools, cache, codec, reloader=None):
+        """
+        Args:
+            index: numéro du processus (0 à N-1)
+            pools: catégorie -> mots, partagés avec les autres processus
+            cache: CandidateCache hérité du superviseur (la table partagée est commune)
+            codec: SnapshotCodec des mots de pools (commandes SAVE et LOAD)
+            reloader: DictionaryReloader du fichier du dictionnaire (optionnel)
+        """
+        self.index = index
+        self.cache = cache
+        self.codec = codec
+        self.reloader = reloader
+        # Générateur propre au processus : sans lui, tous les processus tireraient les mêmes mots
+        self.sampler = WordSampler(pools, rng=random.Random())
+        self.sessions = 0
+        self.guesses = 0
+    
+    def handle_command(self, session, line):
+        """
+        Exécute une commande d'une connexion
+        
+        Args:
+            session: dictionnaire de la connexion (partie en cours sous la clé 'round')
+            line: commande reçue, sans fin de ligne
+        
+        Returns:
+            str ou None: réponse (None pour fermer la connexion)
+        """
+        command, _, argument = line.strip().partition(" ")
+        command = command.upper()  # L'argument de LOAD (base64) garde sa casse
+        game_round = session.get("round")
+        
+        if command == "NEW":
+            word, category = self.sampler.draw()
+            game_round = session["round"] = Round(word)
+            session["category"] = category
+            return f"GAME {category} {game_round.pattern} {game_round.max_penalties}"
+        if command == "QUIT":
+            return None
+        if command == "LOAD":
+            # Partie reprise d'une autre connexion ou d'un autre serveur (même dictionnaire)
+            try:
+                snapshots = self.codec.load(base64.b64decode(argument.strip(), validate=True))
+            except (binascii.Error, ValueError) as e:
+                return f"ERR instantané refusé: {e}"
+            if len(snapshots) != 1:
+                return "ERR un instantané par commande"
+            game_round = session["round"] = restore_round(snapshots[0])
+            session["category"] = snapshots[0].category
+            return state_line(game_round)
+        if command == "STATS":
+            summary = self.cache.summary()
+            return (f"STATS worker={self.index} pid={os.getpid()} sessions={self.sessions} "
+                    f"guesses={self.guesses} hit_rate={summary['hit_rate']:.3f}")
+        if command not in ("GUESS", "HINT", "BEST", "SAVE"):
+            return "ERR commande inconnue"
+        if game_round is None or game_round.game_over:
+            return "ERR aucune partie en cours"
+        if command == "SAVE":
+            data = self.codec.dump([snapshot_round(game_round, session["category"])])
+            return f"SNAPSHOT {base64.b64encode(data).decode('ascii')}"
+        
+        if command == "GUESS":
+            letter = argument.strip().upper()
+            if len(letter) != 1 or letter not in ALPHABET:
+                return "ERR lettre invalide"
+            if not game_round.guess(letter):
+                return "ERR lettre déjà proposée"
+            self.guesses += 1
+        elif command == "HINT":
+            game_round.hint()
+        else:
+            letter = self.cache.best_letter(game_round.pattern, "".join(game_round.wrong_letters))
+            return f"BEST {letter or '-'}"
+        return state_line(game_round)
+    
+    async def serve_connection(self, reader, writer):
+        """
+        Lit les commandes d'une connexion jusqu'à QUIT ou la déconnexion
+        """
+        self.sessions += 1
+        session = {}
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.LimitOverrunError:
+                    writer.write(b"ERR commande trop longue\n")
+                    break
+                except asyncio.IncompleteReadError:
+                    break  # Client déconnecté
+                reply = self.handle_command(session, line.decode("ascii", "replace"))
+                if reply is None:
+                    break
+                writer.write(reply.encode("utf-8") + b"\n")
+                # Les réponses partent sans attendre, sauf si le client ne lit plus
+                if writer.transport.get_write_buffer_size() > WRITE_BUFFER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+    
+    def apply_dictionary_update(self, update):
+        """
+        Installe un dictionnaire rechargé : les parties en cours gardent leur mot, les
+        suivantes sont tirées dans les nouvelles listes
+        """
+        self.sampler = rebuild_sampler(self.sampler, update.categories)
+        self.codec = SnapshotCodec(update.categories)
+        if update.full:
+            self.cache = build_candidate_cache(update.categories, self.cache.max_bytes, self.cache.shared)
+        else:
+            self.cache.update_words(update.added, update.removed)
+        print(f"Processus {self.index}: dictionnaire rechargé (+{len(update.added)} / "
+              f"-{len(update.removed)} mots{', index reconstruit' if update.full else ''})", flush=True)
+    
+    async def watch_dictionary(self):
+        """
+        Vérifie périodiquement le fichier du dictionnaire (lecture dans un fil à part)
+        """
+        while True:
+            await asyncio.sleep(self.reloader.interval)
+            self.reloader.poll()
+            update = self.reloader.take()
+            if update is not None:
+                self.apply_dictionary_update(update)
+    
+    async def run(self, listener):
+        """
+        Sert les connexions de la socket d'écoute jusqu'à SIGTERM
+        """
+        loop = asyncio.get_running_loop()
+        stop = loop.create_future()
+        loop.add_signal_handler(signal.SIGTERM, stop.set_result, None)
+        if self.reloader is not None:
+            watcher = asyncio.create_task(self.watch_dictionary())
+        server = await asyncio.start_server(self.serve_connection, sock=listener, limit=MAX_LINE)
+        async with server:
+            await stop
+        if self.reloader is not None:
+            watcher.cancel()
+
+class Supervisor:
+    """
+    Lance les processus de service et relance ceux qui s'arrêtent
+    """
+    
+    def __init__(self, host, port, workers, pools, dictionary=None, watch=False):
+        """
+        Args:
+            host, port: adresse d'écoute (port 0 : choisi par le système)
+            workers: nombre de processus
+            pools: catégorie -> mots, chargés une fois avant les fork
+            dictionary: fichier d'où viennent les mots
+            watch: chaque processus recharge le dictionnaire quand le fichier change
+        """
+        self.workers = workers
+        self.pools = pools
+        # Relevé du fichier chargé : un processus relancé rattrape les modifications
+        self.dictionary = dictionary if watch else None
+        self.dictionary_stamp = file_stamp(dictionary) if self.dictionary else None
+        self.reuse_port = hasattr(socket, "SO_REUSEPORT")
+        
+        # === SOCKET DU SUPERVISEUR ===
+        # Réserve le port (et le choisit si port=0). Avec SO_REUSEPORT elle n'écoute pas :
+        # le noyau ne donne des connexions qu'aux sockets des processus. Sans SO_REUSEPORT,
+        # les processus acceptent tous sur cette socket héritée (une seule file d'attente).
+        self.listener = open_listener(host, port, self.reuse_port)
+        if not self.reuse_port:
+            self.listener.listen(socket.SOMAXCONN)
+        self.host, self.port = self.listener.getsockname()[:2]
+        
+        # === DONNÉES PARTAGÉES ===
+        self.table = SharedCountTable()
+        self.cache = build_candidate_cache(pools, shared=self.table)
+        self.codec = SnapshotCodec(pools)
+        self.children = {}   # pid -> numéro du processus
+        self.restarts = []   # Instants des derniers redémarrages
+        self.stopping = False
+    
+    def spawn(self, index):
+        """
+        Lance le processus de service numéro index
+        """
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            return
+        # === PROCESSUS DE SERVICE ===
+        code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C est géré par le superviseur
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            if self.reuse_port:
+                listener = open_listener(self.host, self.port, True)
+                listener.listen(socket.SOMAXCONN)
+                self.listener.close()
+            else:
+                listener = self.listener
+            listener.setblocking(False)
+            reloader = None
+            if self.dictionary is not None:
+                reloader = DictionaryReloader(self.dictionary, self.pools, stamp=self.dictionary_stamp,
+                                              with_bands=False)
+            asyncio.run(Worker(index, self.pools, self.cache, self.codec, reloader).run(listener))
+        except BaseException as e:
+            print(f"Processus {index} arrêté par une erreur: {e!r}", file=sys.stderr)
+            code = 1
+        finally:
+            os._exit(code)  # Ne remonte jamais dans le code du superviseur
+    
+    def stop(self, signum=None, frame=None):
+        """
+        Demande l'arrêt de tous les processus de service
+        """
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    def run(self):
+        """
+        Lance les processus puis les surveille jusqu'à l'arrêt (SIGINT ou SIGTERM)
+        
+        Returns:
+            int: 0 après un arrêt demandé, 1 si les processus plantent trop souvent
+        """
+        # Objets déjà chargés placés hors du ramasse-miettes : ses passages dans les
+        # processus ne réécrivent pas leurs en-têtes, les pages restent partagées
+        gc.collect()
+        gc.freeze()
+        for index in range(self.workers):
+            self.spawn(index)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        print(f"Serveur prêt sur {self.host}:{self.port} ({self.workers} processus, "
+              f"{'SO_REUSEPORT' if self.reuse_port else 'socket commune'})", flush=True)
+        
+        code = 0
+        while self.children:
+            pid, status = os.wait()
+            index = self.children.pop(pid, None)
+            if index is None or self.stopping:
+                continue
+            
+            # === REDÉMARRAGE D'UN PROCESSUS PLANTÉ ===
+            now = time.monotonic()
+            self.restarts = [moment for moment in self.restarts if now - moment < RESTART_WINDOW]
+            if len(self.restarts) >= MAX_RESTARTS:
+                print(f"Trop de redémarrages en {RESTART_WINDOW:.0f} s, arrêt du serveur", file=sys.stderr)
+                code = 1
+                self.stop()
+                continue
+            self.restarts.append(now)
+            print(f"Processus {index} (pid {pid}) arrêté ({os.waitstatus_to_exitcode(status)}), "
+                  f"relancé", file=sys.stderr)
+            time.sleep(RESTART_DELAY)
+            self.spawn(index)
+        
+        self.listener.close()
+        self.table.close()
+        return code
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du serveur
+    """
+    parser = argparse.ArgumentParser(description="Serveur de parties de Pendu Deluxe")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port d'écoute (0 : libre)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus de service")
+    parser.add_argument("--dictionary", help="dictionnaire compilé ou base compacte")
+    parser.add_argument("--watch-dictionary", action="store_true",
+                        help="recharge --dictionary quand le fichier change (sans redémarrer)")
+    options = parser.parse_args(argv)
+    if options.workers < 1:
+        parser.error("il faut au moins un processus")
+    if options.watch_dictionary and options.dictionary is None:
+        parser.error("--watch-dictionary demande --dictionary")
+    
+    try:
+        pools = load_pools(options.dictionary)
+        supervisor = Supervisor(options.host, options.port, options.workers, pools,
+                                options.dictionary, options.watch_dictionary)
+    except (OSError, ValueError) as e:
+        print(f"Démarrage impossible: {e}")
+        return 1
+    return supervisor.run()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+Instantanés binaires compacts des parties de Pendu Deluxe
+Une partie tient en 13 octets : identifiant du mot dans le dictionnaire, identifiant
+de la catégorie, masque de 32 bits des lettres proposées (26 lettres, puis les signes
+du mot hors A-Z révélés par un indice : Ç, tiret...), pénalités, indices et
+drapeaux (partie finie, gagnée, catégorie affichée). Les lettres fausses se déduisent
+du mot et du masque. Un mot absent du dictionnaire est écrit en toutes lettres à la
+suite de l'enregistrement.
+
+- SnapshotCodec.dump(snapshots) / load(data) : lot d'instantanés précédé d'un en-tête
+  (version et empreinte du dictionnaire : les identifiants n'ont de sens qu'avec lui) ;
+  avec une base compacte (wordstore.py), l'identifiant d'un mot est son numéro dans le
+  trie : aucune liste de mots n'est construite
+- save_snapshot / load_snapshot : partie en cours du jeu, reprise au lancement suivant
+- snapshot_round / restore_round : parties du serveur (commandes SAVE et LOAD)
+
+Usage:
+    python snapshot.py bench --sessions 1000000   # Taille et vitesse (comparées à pickle)
+"""
+import os       # Module pour les chemins de fichiers
+import gc       # Module du ramasse-miettes (suspendu pendant le décodage d'un lot)
+import sys      # Module système pour la sortie
+import time     # Module pour mesurer la vitesse
+import pickle   # Format de comparaison du banc d'essai
+import random   # Module pour tirer les parties du banc d'essai
+import struct   # Module pour le format binaire
+import hashlib  # Module pour l'empreinte du dictionnaire
+import argparse # Module pour lire les options de la ligne de commande
+from collections import namedtuple
+
+from dictionary import WORD_CATEGORIES
+from rules import ALPHABET, Round, is_playable
+from wordstore import NO_WORD, pools_store
+
+SAVED_GAME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saved_game.bin")
+MAGIC = b"PDS"
+FORMAT_VERSION = 1
+
+# En-tête : magie, version, empreinte du dictionnaire, nombre d'instantanés
+HEADER = struct.Struct("<3sBQI")
+# Enregistrement : drapeaux, catégorie, mot, lettres proposées, pénalités, indices
+RECORD = struct.Struct("<BHIIBB")
+
+# Drapeaux
+GAME_OVER = 1
+WON = 2
+CATEGORY_HINT = 4
+INLINE = 8   # Mot et catégorie écrits en toutes lettres après l'enregistrement
+
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+OTHER_SHIFT = len(ALPHABET)  # Premier bit des signes hors A-Z du mot
+MAX_OTHERS = 32 - OTHER_SHIFT  # Signes hors A-Z enregistrés par mot (les suivants restent cachés)
+# Lettres de chaque octet du masque : quatre lectures de table au lieu de 26 tests
+MASK_BYTES = [["".join(ALPHABET[8 * k + i] for i in range(8) if byte >> i & 1 and 8 * k + i < len(ALPHABET))
+               for byte in range(256)] for k in range(4)]
+
+# Partie figée (les lettres fausses sont celles de guessed_letters absentes du mot)
+GameSnapshot = namedtuple("GameSnapshot", [
+    "word", "category", "guessed_letters", "penalties", "hints_used",
+    "game_over", "won", "category_hint",
+])
+
+def other_characters(word):
+    """
+    Signes du mot que le joueur ne peut pas proposer (Ç, tiret...), dans l'ordre des bits
+    """
+    return sorted(set(word).difference(ALPHABET))[:MAX_OTHERS]
+
+def letters_to_mask(letters, word=""):
+    """
+    Convertit des lettres en masque de 32 bits : bit i pour ALPHABET[i], puis un bit par
+    signe de other_characters(word) (seul un indice peut les révéler)
+    """
+    mask = 0
+    others = None
+    for letter in letters:
+        bit = LETTER_BITS.get(letter)
+        if bit is None:
+            if others is None:
+                others = other_characters(word)
+            if letter not in others:
+                continue  # Signe absent du mot : sans effet sur la partie
+            bit = 1 << (OTHER_SHIFT + others.index(letter))
+        mask |= bit
+    return mask
+
+def mask_to_letters(mask, word=""):
+    """
+    Retourne les lettres d'un masque de 32 bits (inverse de letters_to_mask)
+    """
+    letters = (MASK_BYTES[0][mask & 0xFF] + MASK_BYTES[1][mask >> 8 & 0xFF]
+               + MASK_BYTES[2][mask >> 16 & 0xFF] + MASK_BYTES[3][mask >> 24])
+    if mask >> OTHER_SHIFT:
+        letters += "".join(sign for i, sign in enumerate(other_characters(word))
+                           if mask >> (OTHER_SHIFT + i) & 1)
+    return letters
+
+class SnapshotCodec:
+    """
+    Encodage des parties avec les identifiants d'un dictionnaire
+    """
+    
+    def __init__(self, pools):
+        """
+        Args:
+            pools: nom de liste -> mots (catégories, niveaux...) ; l'ordre fixe les identifiants
+                (vues d'une WordStore : numéros du trie, puis les mots des autres listes)
+        """
+        self.labels = list(pools)
+        self.label_ids = {label: label_id for label_id, label in enumerate(self.labels)}
+        self.store = pools_store(pools)
+        self.offset = len(self.store) if self.store is not None else 0  # Identifiant du premier mot de words
+        # Mots des listes ordinaires (hors de la base compacte)
+        lists = [words for words in pools.values()
+                 if self.store is None or getattr(words, "store", None) is not self.store]
+        self.words = list(dict.fromkeys(word for words in lists for word in words
+                                        if self.store is None or self.store.find(word) == NO_WORD))
+        self.word_ids = {word: self.offset + i for i, word in enumerate(self.words)}
+        
+        # Empreinte : un instantané ne se relit qu'avec les mêmes identifiants
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update("\n".join(self.labels).encode("utf-8"))
+        digest.update(b"\0")
+        if self.store is not None:
+            digest.update(self.store.fingerprint.encode("ascii") + b"\0")
+        digest.update("\n".join(self.words).encode("utf-8"))
+        self.fingerprint = int.from_bytes(digest.digest(), "little")
+    
+    def __len__(self):
+        return self.offset + len(self.words)
+    
+    def word(self, word_id):
+        """
+        Retourne le mot d'un identifiant
+        
+        Raises:
+            IndexError: si l'identifiant est hors du dictionnaire
+        """
+        if word_id < self.offset:
+            return self.store.word(word_id)
+        return self.words[word_id - self.offset]
+    
+    def word_id(self, word):
+        """
+        Retourne l'identifiant d'un mot (None s'il est hors du dictionnaire)
+        """
+        word_id = self.word_ids.get(word)
+        if word_id is None and self.store is not None:
+            word_id = self.store.find(word)
+            if word_id == NO_WORD:
+                return None
+        return word_id
+    
+    def encode(self, snapshot):
+        """
+        Encode une partie (sans en-tête)
+        
+        Args:
+            snapshot: GameSnapshot
+        
+        Returns:
+            bytes: enregistrement (13 octets si le mot et la catégorie sont connus)
+        """
+        flags = ((GAME_OVER if snapshot.game_over else 0) | (WON if snapshot.won else 0)
+                 | (CATEGORY_HINT if snapshot.category_hint else 0))
+        word_id = self.word_id(snapshot.word)
+        label_id = self.label_ids.get(snapshot.category)
+        mask = letters_to_mask(snapshot.guessed_letters, snapshot.word)
+        if word_id is not None and label_id is not None:
+            return RECORD.pack(flags, label_id, word_id, mask, snapshot.penalties, snapshot.hints_used)
+        
+        # === MOT OU CATÉGORIE HORS DU DICTIONNAIRE ===
+        word = snapshot.word.encode("utf-8")
+        category = snapshot.category.encode("utf-8")
+        return (RECORD.pack(flags | INLINE, 0, 0, mask, snapshot.penalties, snapshot.hints_used)
+                + bytes([len(word)]) + word + bytes([len(category)]) + category)
+    
+    def decode(self, data, offset=0):
+        """
+        Décode une partie écrite par encode
+        
+        Args:
+            data: octets contenant l'enregistrement
+            offset: position de l'enregistrement
+        
+        Returns:
+            tuple: (GameSnapshot, position de l'enregistrement suivant)
+        
+        Raises:
+            ValueError: si l'enregistrement est tronqué ou incohérent
+        """
+        try:
+            flags, label_id, word_id, mask, penalties, hints_used = RECORD.unpack_from(data, offset)
+        except struct.error as e:
+            raise ValueError(f"instantané tronqué: {e}") from None
+        offset += RECORD.size
+        
+        if flags & INLINE:
+            length = data[offset] if offset < len(data) else 0
+            try:
+                word = bytes(data[offset + 1:offset + 1 + length]).decode("utf-8")
+                offset += 1 + length
+                length = data[offset] if offset < len(data) else 0
+                category = bytes(data[offset + 1:offset + 1 + length]).decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError("instantané illisible") from None
+            offset += 1 + length
+            if offset > len(data) or not word:
+                raise ValueError("instantané tronqué")
+        else:
+            if word_id >= len(self) or label_id >= len(self.labels):
+                raise ValueError("identifiant hors du dictionnaire")
+            word, category = self.word(word_id), self.labels[label_id]
+        if mask >> OTHER_SHIFT and mask >> (OTHER_SHIFT + len(other_characters(word))):
+            raise ValueError("masque de lettres invalide")
+        
+        snapshot = GameSnapshot(word, category, frozenset(mask_to_letters(mask, word)), penalties, hints_used,
+                                bool(flags & GAME_OVER), bool(flags & WON), bool(flags & CATEGORY_HINT))
+        return snapshot, offset
+    
+    def dump(self, snapshots):
+        """
+        Encode un lot de parties avec l'en-tête (version, empreinte, nombre)
+        
+        Returns:
+            bytes: lot prêt à enregistrer ou à transmettre
+        """
+        records = [self.encode(snapshot) for snapshot in snapshots]
+        return HEADER.pack(MAGIC, FORMAT_VERSION, self.fingerprint, len(records)) + b"".join(records)
+    
+    def load(self, data):
+        """
+        Décode un lot écrit par dump
+        
+        Returns:
+            list: GameSnapshot dans l'ordre du lot
+        
+        Raises:
+            ValueError: si le lot est invalide ou vient d'un autre dictionnaire
+        """
+        try:
+            magic, version, fingerprint, count = HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("en-tête d'instantané tronqué") from None
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("format d'instantané inconnu")
+        if fingerprint != self.fingerprint:
+            raise ValueError("instantané d'un autre dictionnaire")
+        
+        # Un lot crée des millions de petits objets qui vivent tous : sans pause, le
+        # ramasse-miettes les parcourrait plusieurs fois pendant la lecture
+        snapshots = []
+        offset = HEADER.size
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(count):
+                snapshot, offset = self.decode(data, offset)
+                snapshots.append(snapshot)
+        finally:
+            if collecting:
+                gc.enable()
+        return snapshots
+
+def snapshot_round(game_round, category):
+    """
+    Fige une partie sans affichage (rules.Round)
+    """
+    return GameSnapshot(game_round.word, category, frozenset(game_round.guessed_letters),
+                        game_round.penalties, game_round.hints_used, game_round.game_over,
+                        game_round.won, False)
+
+def restore_round(snapshot):
+    """
+    Recrée une partie sans affichage depuis un instantané
+    
+    Returns:
+        rules.Round: partie dans l'état enregistré
+    """
+    game_round = Round(snapshot.word)
+    game_round.guessed_letters = set(snapshot.guessed_letters)
+    game_round.wrong_letters = game_round.guessed_letters - set(snapshot.word)
+    game_round.penalties = snapshot.penalties
+    game_round.hints_used = snapshot.hints_used
+    game_round.game_over = snapshot.game_over
+    game_round.won = snapshot.won
+    return game_round
+
+def save_snapshot(codec, snapshot, path=SAVED_GAME_PATH):
+    """
+    Enregistre la partie en cours (ou efface l'enregistrement si snapshot vaut None)
+    Écrit dans un fichier temporaire puis le renomme : pas d'instantané à moitié écrit
+    
+    Raises:
+        OSError: si le fichier ne peut pas être écrit (le fichier temporaire est effacé)
+        ValueError: si la partie ne peut pas être encodée (rien n'est écrit)
+    """
+    if snapshot is None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    data = codec.dump([snapshot])  # Encodé avant d'ouvrir le fichier
+    temporary_path = path + ".tmp"
+    try:
+        with open(temporary_path, "wb") as f:
+            f.write(data)
+        os.replace(temporary_path, path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
+
+def load_snapshot(codec, path=SAVED_GAME_PATH):
+    """
+    Relit la partie enregistrée par save_snapshot
+    
+    Returns:
+        GameSnapshot ou None: None si aucune partie n'est enregistrée ou si elle est illisible
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshots = codec.load(f.read())
+    except (OSError, ValueError):
+        return None
+    return snapshots[0] if len(snapshots) == 1 else None
+
+def random_snapshots(codec, count, rng):
+    """
+    Parties en cours tirées au hasard (banc d'essai)
+    """
+    snapshots = []
+    for _ in range(count):
+        word = codec.word(rng.randrange(len(codec)))
+        guessed = frozenset(rng.sample(ALPHABET, rng.randint(0, 12)))
+        wrong = len(guessed - set(word))
+        snapshots.append(GameSnapshot(word, rng.choice(codec.labels), guessed, wrong, 0, False, False, False))
+    return snapshots
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande : compare taille et vitesse à pickle
+    """
+    parser = argparse.ArgumentParser(description="Instantanés binaires des parties de Pendu Deluxe")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    bench = subparsers.add_parser("bench", help="taille et vitesse d'encodage")
+    bench.add_argument("--sessions", type=int, default=1000000)
+    bench.add_argument("--seed", type=int, default=1)
+    options = parser.parse_args(argv)
+    
+    codec = SnapshotCodec({name: [word for word in words if is_playable(word)]
+                           for name, words in WORD_CATEGORIES.items()})
+    snapshots = random_snapshots(codec, options.sessions, random.Random(options.seed))
+    
+    start = time.perf_counter()
+    data = codec.dump(snapshots)
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = codec.load(data)
+    decode_time = time.perf_counter() - start
+    if decoded != snapshots:
+        print("Erreur: les parties relues diffèrent")
+        return 1
+    
+    pickled = pickle.dumps(snapshots, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(pickled)
+    pickle_time = time.perf_counter() - start
+    
+    count = options.sessions
+    print(f"{count} parties, {len(codec)} mots")
+    print(f"instantanés: {len(data) / count:.1f} octets/partie, encodage {encode_time / count * 1e6:.2f} µs, "
+          f"décodage {decode_time / count * 1e6:.2f} µs")
+    print(f"pickle:      {len(pickled) / count:.1f} octets/partie, décodage {pickle_time / count * 1e6:.2f} µs")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,409 @@
+"""
+Solveur automatique du pendu par maximisation de l'information
+À chaque coup, le solveur choisit la lettre dont la réponse (positions révélées ou
+absence) partage le mieux les mots encore possibles : c'est la lettre qui maximise
+l'entropie de la partition des candidats par motif de révélation.
+
+Les premiers coups sont identiques d'une partie à l'autre pour une longueur de mot
+donnée : le début de l'arbre de décision est précalculé et enregistré sur disque,
+le reste est mémorisé au fil des parties.
+
+Usage:
+    python solver.py precompute [--depth N]   # Précalcule et enregistre l'arbre
+    python solver.py bench [--games N]        # Mesure vitesse, victoires et erreurs
+    python solver.py play MOT                 # Montre les coups joués pour un mot
+"""
+import os       # Module pour les chemins de fichiers
+import sys      # Module système pour la sortie
+import json     # Module pour enregistrer l'arbre de décision
+import math     # Module pour les logarithmes (entropie)
+import time     # Module pour mesurer la vitesse
+import random   # Module pour tirer les mots du banc d'essai
+import hashlib  # Module pour l'empreinte du dictionnaire
+import argparse # Module pour lire les options de la ligne de commande
+
+from dictionary import all_words
+from rules import ALPHABET, MAX_PENALTIES, is_playable, letter_mask
+
+# === PARAMÈTRES DU CACHE DE DÉCISIONS ===
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, "solver_cache.json")
+DEFAULT_PREFIX_DEPTH = 4           # Nombre de coups précalculés pour chaque longueur
+MAX_RUNTIME_DECISIONS = 200000     # Décisions mémorisées en cours de jeu au maximum
+CACHE_VERSION = 1                  # À incrémenter si le format du fichier change
+
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+
+def dictionary_fingerprint(words):
+    """
+    Calcule une empreinte du dictionnaire pour invalider un cache devenu obsolète
+    
+    Args:
+        words: liste des mots du solveur
+    
+    Returns:
+        str: empreinte SHA-1 hexadécimale
+    """
+    return hashlib.sha1("\n".join(sorted(words)).encode("utf-8")).hexdigest()
+
+def encode_key(key):
+    """
+    Convertit une clé de nœud (longueur, observations) en texte pour le fichier JSON
+    Exemple: (8, (('A', 0), ('E', 18))) -> "8|A0,E18"
+    """
+    length, observations = key
+    return f"{length}|" + ",".join(f"{letter}{mask}" for letter, mask in observations)
+
+def decode_key(text):
+    """
+    Convertit une clé texte du fichier JSON en clé de nœud (inverse de encode_key)
+    """
+    length, _, observations = text.partition("|")
+    if not observations:
+        return int(length), ()
+    return int(length), tuple((item[0], int(item[1:])) for item in observations.split(","))
+
+class EntropySolver:
+    """
+    Joueur automatique qui maximise l'information apportée par chaque lettre
+    Un nœud de l'arbre de décision est identifié par la longueur du mot et les
+    observations déjà faites : couples (lettre, masque des positions révélées) triés
+    """
+    
+    def __init__(self, words=None):
+        """
+        Prépare les masques de positions de chaque mot
+        
+        Args:
+            words: mots candidats (par défaut toute la base de dictionary.py)
+        """
+        # Seuls les mots composés de A-Z peuvent être trouvés avec le clavier
+        self.words = [word for word in dict.fromkeys(words or all_words()) if is_playable(word)]
+        self.fingerprint = dictionary_fingerprint(self.words)
+        
+        # === MASQUES DE POSITIONS ===
+        # masks[id][i] : positions de la lettre ALPHABET[i] dans le mot id
+        self.masks = [tuple(letter_mask(word, letter) for letter in ALPHABET) for word in self.words]
+        self.word_ids = {word: word_id for word_id, word in enumerate(self.words)}
+        
+        # Mots regroupés par longueur (la longueur est visible dès le début de la partie)
+        self.by_length = {}
+        for word_id, word in enumerate(self.words):
+            self.by_length.setdefault(len(word), []).append(word_id)
+        
+        # Ordre de repli quand aucun candidat ne correspond : lettres les plus fréquentes
+        counts = {letter: 0 for letter in ALPHABET}
+        for word in self.words:
+            for letter in set(word):
+                counts[letter] += 1
+        self.frequency_order = sorted(ALPHABET, key=lambda letter: -counts[letter])
+        
+        self.decisions = {}        # Clé de nœud -> lettre à jouer
+        self.prefix_depth = 0      # Profondeur de l'arbre précalculé
+        self.runtime_decisions = 0 # Décisions ajoutées en cours de jeu
+    
+    def candidates(self, length, observations):
+        """
+        Retourne les mots compatibles avec les observations
+        
+        Args:
+            length: longueur du mot à deviner
+            observations: couples (lettre, masque des positions révélées)
+        
+        Returns:
+            list: identifiants des mots possibles
+        """
+        masks = self.masks
+        constraints = [(LETTER_INDEX[letter], mask) for letter, mask in observations]
+        return [word_id for word_id in self.by_length.get(length, ())
+                if all(masks[word_id][index] == mask for index, mask in constraints)]
+    
+    def choose(self, candidates, guessed):
+        """
+        Choisit la lettre qui maximise l'entropie de la partition des candidats
+        
+        Args:
+            candidates: identifiants des mots possibles
+            guessed: lettres déjà proposées
+        
+        Returns:
+            str ou None: lettre à jouer (None si tout l'alphabet a été proposé)
+        """
+        count = len(candidates)
+        if count == 1:  # Mot trouvé : il ne reste qu'à proposer ses lettres
+            for letter in self.words[candidates[0]]:
+                if letter not in guessed:
+                    return letter
+        
+        best_letter = None
+        best_score = None
+        if count > 1:
+            masks = self.masks
+            log_count = math.log2(count)
+            for index, letter in enumerate(ALPHABET):
+                if letter in guessed:
+                    continue
+                
+                # === PARTITION DES CANDIDATS PAR MOTIF DE RÉVÉLATION ===
+                partition = {}
+                for word_id in candidates:
+                    mask = masks[word_id][index]
+                    partition[mask] = partition.get(mask, 0) + 1
+                absent = partition.get(0, 0)
+                if absent == count:
+                    continue  # Lettre absente de tous les candidats : erreur assurée
+                
+                entropy = log_count - sum(size * math.log2(size) for size in partition.values()) / count
+                # À information égale, préfère la lettre la plus souvent présente
+                score = (entropy, count - absent)
+                if best_score is None or score > best_score:
+                    best_letter, best_score = letter, score
+        
+        if best_letter is None:  # Aucun candidat : lettres les plus fréquentes d'abord
+            for letter in self.frequency_order:
+                if letter not in guessed:
+                    return letter
+        return best_letter
+    
+    def next_letter(self, length, observations):
+        """
+        Retourne la lettre à jouer dans un état de partie donné
+        
+        Args:
+            length: longueur du mot à deviner
+            observations: tuple trié des couples (lettre, masque) déjà observés
+        
+        Returns:
+            str ou None: lettre à jouer
+        """
+        key = (length, observations)
+        letter = self.decisions.get(key)
+        if letter is None:
+            guessed = {observed for observed, _ in observations}
+            letter = self.choose(self.candidates(length, observations), guessed)
+            # Mémorise la décision (dans la limite de la mémoire prévue)
+            if self.runtime_decisions < MAX_RUNTIME_DECISIONS:
+                self.decisions[key] = letter
+                self.runtime_decisions += 1
+        return letter
+    
+    def next_letter_for_pattern(self, pattern, guessed_letters):
+        """
+        Retourne la lettre à jouer à partir de ce que voit le joueur
+        
+        Args:
+            pattern: mot masqué, '_' pour les lettres non trouvées (ex: "C_A_")
+            guessed_letters: lettres déjà proposées (trouvées et fausses)
+        """
+        observations = tuple(sorted((letter, letter_mask(pattern, letter))
+                                    for letter in guessed_letters))
+        return self.next_letter(len(pattern), observations)
+    
+    def play(self, word, max_penalties=MAX_PENALTIES):
+        """
+        Joue une partie complète contre un mot
+        
+        Args:
+            word: mot à deviner
+            max_penalties: nombre d'erreurs entraînant la défaite
+        
+        Returns:
+            tuple: (victoire, erreurs, lettres proposées)
+        """
+        word_id = self.word_ids.get(word)
+        word_masks = self.masks[word_id] if word_id is not None else None
+        target = (1 << len(word)) - 1
+        revealed = 0
+        penalties = 0
+        guesses = 0
+        observations = ()
+        
+        while revealed != target and penalties < max_penalties:
+            letter = self.next_letter(len(word), observations)
+            if letter is None:
+                break  # Tout l'alphabet a été proposé (mot avec des caractères spéciaux)
+            if word_masks is not None:
+                mask = word_masks[LETTER_INDEX[letter]]
+            else:
+                mask = letter_mask(word, letter)
+            observations = tuple(sorted(observations + ((letter, mask),)))
+            guesses += 1
+            if mask:
+                revealed |= mask
+            else:
+                penalties += 1
+        
+        return revealed == target, penalties, guesses
+    
+    def precompute(self, depth=DEFAULT_PREFIX_DEPTH):
+        """
+        Précalcule les premiers niveaux de l'arbre de décision pour chaque longueur de mot
+        
+        Args:
+            depth: nombre de coups précalculés
+        
+        Returns:
+            int: nombre de nœuds calculés
+        """
+        computed = 0
+        for length, word_ids in self.by_length.items():
+            pending = [((), word_ids, 0)]
+            while pending:
+                observations, candidates, level = pending.pop()
+                if level >= depth or len(candidates) <= 1:
+                    continue  # Les feuilles triviales sont calculées à la volée
+                
+                guessed = {observed for observed, _ in observations}
+                letter = self.choose(candidates, guessed)
+                self.decisions[(length, observations)] = letter
+                computed += 1
+                
+                # === ENFANTS : UN PAR MOTIF DE RÉVÉLATION POSSIBLE ===
+                index = LETTER_INDEX[letter]
+                children = {}
+                for word_id in candidates:
+                    children.setdefault(self.masks[word_id][index], []).append(word_id)
+                for mask, child_candidates in children.items():
+                    child = tuple(sorted(observations + ((letter, mask),)))
+                    pending.append((child, child_candidates, level + 1))
+        
+        self.prefix_depth = max(self.prefix_depth, depth)
+        return computed
+    
+    def save(self, path=DEFAULT_CACHE_PATH):
+        """
+        Enregistre l'arbre de décision précalculé
+        
+        Args:
+            path: chemin du fichier JSON
+        """
+        data = {
+            "version": CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "depth": self.prefix_depth,
+            "decisions": {encode_key(key): letter for key, letter in self.decisions.items()},
+        }
+        # Écrit dans un fichier temporaire puis le renomme : pas de cache à moitié écrit
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temporary_path, path)
+    
+    def load(self, path=DEFAULT_CACHE_PATH):
+        """
+        Charge un arbre de décision enregistré s'il correspond au dictionnaire actuel
+        
+        Args:
+            path: chemin du fichier JSON
+        
+        Returns:
+            bool: True si le cache a été chargé
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if data.get("version") != CACHE_VERSION or data.get("fingerprint") != self.fingerprint:
+            print("Cache du solveur obsolète (dictionnaire modifié), il sera recalculé")
+            return False
+        
+        self.decisions.update((decode_key(key), letter) for key, letter in data["decisions"].items())
+        self.prefix_depth = data.get("depth", 0)
+        return True
+
+def load_solver(path=DEFAULT_CACHE_PATH, depth=DEFAULT_PREFIX_DEPTH, words=None):
+    """
+    Crée un solveur avec son arbre précalculé (chargé depuis le disque ou recalculé)
+    
+    Args:
+        path: chemin du cache (None pour ne pas utiliser le disque)
+        depth: profondeur précalculée si le cache doit être reconstruit
+        words: mots candidats (par défaut toute la base)
+    
+    Returns:
+        EntropySolver: solveur prêt à jouer
+    """
+    solver = EntropySolver(words)
+    if path is not None and solver.load(path):
+        return solver
+    
+    solver.precompute(depth)
+    if path is not None:
+        try:
+            solver.save(path)
+        except OSError as e:
+            print(f"Impossible d'enregistrer le cache du solveur: {e}")
+    return solver
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du solveur
+    """
+    parser = argparse.ArgumentParser(description="Solveur automatique de Pendu Deluxe")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="fichier de l'arbre précalculé")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    precompute_parser = commands.add_parser("precompute", help="précalcule et enregistre l'arbre")
+    precompute_parser.add_argument("--depth", type=int, default=DEFAULT_PREFIX_DEPTH)
+    
+    bench_parser = commands.add_parser("bench", help="mesure la vitesse et les résultats")
+    bench_parser.add_argument("--games", type=int, default=100000)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    
+    play_parser = commands.add_parser("play", help="montre les coups joués pour un mot")
+    play_parser.add_argument("word")
+    
+    options = parser.parse_args(argv)
+    
+    if options.command == "precompute":
+        solver = EntropySolver()
+        start = time.perf_counter()
+        computed = solver.precompute(options.depth)
+        solver.save(options.cache)
+        print(f"{computed} nœuds précalculés en {time.perf_counter() - start:.2f} s "
+              f"(profondeur {options.depth}) -> {options.cache}")
+    
+    elif options.command == "bench":
+        start = time.perf_counter()
+        solver = load_solver(options.cache)
+        print(f"Solveur prêt en {(time.perf_counter() - start) * 1e3:.1f} ms "
+              f"({len(solver.decisions)} décisions en cache, {len(solver.words)} mots)")
+        
+        rng = random.Random(options.seed)
+        words = [rng.choice(solver.words) for _ in range(options.games)]
+        start = time.perf_counter()
+        wins = penalties = guesses = 0
+        for word in words:
+            won, word_penalties, word_guesses = solver.play(word)
+            wins += won
+            penalties += word_penalties
+            guesses += word_guesses
+        elapsed = time.perf_counter() - start
+        
+        print(f"{options.games} parties en {elapsed:.2f} s: {options.games / elapsed:,.0f} parties/s")
+        print(f"Victoires: {wins / options.games:.1%} | erreurs moyennes: {penalties / options.games:.2f} "
+              f"| lettres proposées: {guesses / options.games:.2f}")
+    
+    elif options.command == "play":
+        solver = load_solver(options.cache)
+        word = options.word.upper()
+        guessed = set()
+        penalties = 0
+        while penalties < MAX_PENALTIES and not all(letter in guessed for letter in word):
+            pattern = "".join(letter if letter in guessed else "_" for letter in word)
+            letter = solver.next_letter_for_pattern(pattern, guessed)
+            if letter is None:
+                break
+            guessed.add(letter)
+            if letter not in word:
+                penalties += 1
+            print(f"{pattern}  ->  {letter} {'ok' if letter in word else 'erreur'}")
+        won = all(letter in guessed for letter in word)
+        print(f"{'Victoire' if won else 'Défaite'} avec {penalties} erreur(s)")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Joueurs automatiques de Pendu Deluxe
+Une stratégie reçoit ce que voit le joueur (GameView) et répond par une lettre ou par
+HINT pour demander un indice. Les parties sont jouées avec rules.Round, qui applique
+les mêmes règles que le jeu (lettres, indices, pénalités).
+
+Pour ajouter une stratégie : écrire une classe avec les méthodes new_game(length) et
+choose(view) puis l'ajouter au dictionnaire STRATEGIES. Une stratégie qui tire au hasard
+le fait avec son attribut rng (remplacé par le tournoi pour des parties reproductibles).
+"""
+import time     # Module pour mesurer le temps de décision
+import random   # Module pour la stratégie aléatoire
+from collections import namedtuple
+
+from candidates import CandidateCache
+from dictionary import all_words
+from rules import ALPHABET, HINT_PENALTY, Round, is_playable
+
+HINT = "HINT"  # Réponse d'une stratégie qui demande un indice
+
+# Ce que voit le joueur à chaque coup
+GameView = namedtuple("GameView", [
+    "pattern",              # Mot masqué, '_' pour les lettres cachées (ex: "C_A_")
+    "wrong_letters",        # Lettres proposées absentes du mot (frozenset)
+    "remaining_penalties",  # Pénalités encore possibles avant la défaite
+    "hint_available",       # True si un indice peut être demandé
+])
+
+def playable_words():
+    """
+    Mots de la base que le clavier permet de trouver (A-Z uniquement)
+    """
+    return [word for word in all_words() if is_playable(word)]
+
+def letter_frequencies(words):
+    """
+    Nombre de mots contenant chaque lettre
+    
+    Returns:
+        dict: lettre -> nombre de mots
+    """
+    counts = {letter: 0 for letter in ALPHABET}
+    for word in words:
+        for letter in set(word):
+            if letter in counts:
+                counts[letter] += 1
+    return counts
+
+def guessed_from(view):
+    """
+    Lettres déjà proposées ou révélées, déduites du motif et des lettres fausses
+    """
+    return set(view.pattern.replace("_", "")) | set(view.wrong_letters)
+
+class RandomStrategy:
+    """
+    Propose une lettre au hasard parmi celles pas encore jouées
+    """
+    
+    def __init__(self, words=None, rng=None):
+        self.rng = rng or random.Random()
+    
+    def new_game(self, length):
+        pass
+    
+    def choose(self, view):
+        guessed = guessed_from(view)
+        return self.rng.choice([letter for letter in ALPHABET if letter not in guessed])
+
+class FrequencyStrategy:
+    """
+    Propose les lettres dans l'ordre de leur fréquence dans toute la base
+    """
+    
+    def __init__(self, words=None, rng=None):
+        counts = letter_frequencies(words or playable_words())
+        self.order = sorted(ALPHABET, key=lambda letter: (-counts[letter], letter))
+    
+    def new_game(self, length):
+        pass
+    
+    def choose(self, view):
+        guessed = guessed_from(view)
+        for letter in self.order:
+            if letter not in guessed:
+                return letter
+
+class PatternFrequencyStrategy:
+    """
+    Garde les mots compatibles avec le motif et les lettres fausses, puis propose la
+    lettre présente dans le plus grand nombre d'entre eux
+    Le filtrage passe par un CandidateCache (candidates.py) : un état déjà rencontré
+    dans une autre partie n'est pas recalculé
+    Si aucun mot de la base ne correspond, demande un indice quand il ne fait pas perdre,
+    sinon revient à l'ordre de fréquence global
+    """
+    
+    def __init__(self, words=None, rng=None):
+        self.words = words or playable_words()
+        self.cache = CandidateCache(self.words)
+        self.fallback = FrequencyStrategy(self.words)
+    
+    def new_game(self, length):
+        pass
+    
+    def choose(self, view):
+        letter = self.cache.best_letter(view.pattern, "".join(view.wrong_letters))
+        if letter is not None:
+            return letter
+        
+        # Mot inconnu de la base
+        if view.hint_available and view.remaining_penalties > HINT_PENALTY:
+            return HINT
+        return self.fallback.choose(view)
+
+class EntropyStrategy:
+    """
+    Solveur de solver.py : lettre qui apporte le plus d'information sur le mot
+    """
+    
+    def __init__(self, words=None, rng=None):
+        from solver import EntropySolver  # Import à la demande : construction plus coûteuse
+        self.solver = EntropySolver(words)
+        self.solver.precompute()
+        self.fallback = FrequencyStrategy(self.solver.words)
+    
+    def new_game(self, length):
+        pass
+    
+    def choose(self, view):
+        guessed = guessed_from(view)
+        letter = self.solver.next_letter_for_pattern(view.pattern, guessed)
+        return letter if letter is not None else self.fallback.choose(view)
+
+# Stratégies disponibles pour le tournoi : nom -> classe
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "pattern": PatternFrequencyStrategy,
+    "entropy": EntropyStrategy,
+}
+
+def play_round(strategy, word, rng=random):
+    """
+    Fait jouer une partie complète à une stratégie
+    
+    Args:
+        strategy: stratégie (méthodes new_game et choose)
+        word: mot à deviner
+        rng: générateur aléatoire des indices
+    
+    Returns:
+        tuple: (Round terminée, nombre de décisions, secondes passées dans choose)
+    
+    Raises:
+        ValueError: si la stratégie propose un coup interdit (lettre déjà jouée...)
+    """
+    game_round = Round(word, rng=rng)
+    strategy.new_game(len(word))
+    decisions = 0
+    seconds = 0.0
+    while not game_round.game_over:
+        view = GameView(game_round.pattern, frozenset(game_round.wrong_letters),
+                        game_round.max_penalties - game_round.penalties, game_round.hint_available)
+        # Seul le temps de décision de la stratégie est mesuré
+        start = time.perf_counter()
+        decision = strategy.choose(view)
+        seconds += time.perf_counter() - start
+        decisions += 1
+        
+        if decision == HINT:
+            if not game_round.hint():
+                raise ValueError("indice demandé alors qu'aucun n'est disponible")
+        elif decision not in ALPHABET or not game_round.guess(decision):
+            raise ValueError(f"coup interdit: {decision!r}")
+    return game_round, decisions, seconds
@@ -0,0 +1,144 @@
+"""
+Tournoi des joueurs automatiques de Pendu Deluxe
+Toutes les stratégies jouent la même suite de mots (tirée avec une graine fixe) ;
+les parties sont réparties par paquets entre plusieurs processus. Avec --shared-cache,
+les processus partagent les comptes de lettres des états déjà filtrés (candidates.py).
+
+Usage:
+    python tournament.py                         # Toutes les stratégies, 2000 parties
+    python tournament.py pattern entropy --games 20000 -j 8 --seed 42
+    python tournament.py pattern -j 4 --shared-cache
+"""
+import os       # Module pour compter les cœurs du processeur
+import sys      # Module système pour la sortie
+import time     # Module pour mesurer le temps de décision
+import random   # Module pour la suite de mots et les indices
+import argparse # Module pour lire les options de la ligne de commande
+from concurrent.futures import ProcessPoolExecutor  # Parties sur plusieurs cœurs
+
+from candidates import SharedCountTable
+from strategies import STRATEGIES, play_round, playable_words
+
+CHUNK_SIZE = 250  # Parties par tâche envoyée à un processus
+
+_strategy_cache = {}  # Stratégies déjà construites dans ce processus
+_shared_table = None  # Table des comptes partagée entre les processus (optionnelle)
+
+def attach_shared_table(name):
+    """
+    Ouvre dans un processus du pool la table partagée créée par le processus principal
+    """
+    global _shared_table
+    _shared_table = SharedCountTable(name=name)
+
+def play_chunk(task):
+    """
+    Joue un paquet de parties pour une stratégie (exécuté dans un processus du pool)
+    
+    Args:
+        task: (nom de la stratégie, numéro du paquet, mots, graine)
+    
+    Returns:
+        tuple: (nom, numéro du paquet, résultats cumulés)
+    """
+    name, chunk, words, seed = task
+    strategy = _strategy_cache.get(name)
+    if strategy is None:
+        strategy = _strategy_cache[name] = STRATEGIES[name]()
+        if hasattr(strategy, "cache"):
+            strategy.cache.shared = _shared_table
+    
+    # Graines propres au paquet : résultats identiques quel que soit le nombre de processus
+    rng = random.Random(f"{seed}:{chunk}")  # Lettres révélées par les indices
+    if hasattr(strategy, "rng"):
+        strategy.rng = random.Random(f"{seed}:{chunk}:{name}")
+    results = {"games": 0, "wins": 0, "penalties": 0, "hints": 0, "decisions": 0, "seconds": 0.0}
+    for word in words:
+        game_round, decisions, seconds = play_round(strategy, word, rng)
+        results["games"] += 1
+        results["wins"] += game_round.won
+        results["penalties"] += game_round.penalties
+        results["hints"] += game_round.hints_used
+        results["decisions"] += decisions
+        results["seconds"] += seconds
+    return name, chunk, results
+
+def run_tournament(names, games, seed=0, processes=1, shared_cache=False):
+    """
+    Fait jouer la même suite de mots à chaque stratégie
+    
+    Args:
+        names: noms des stratégies (clés de STRATEGIES)
+        games: nombre de parties par stratégie
+        seed: graine de la suite de mots et des indices
+        processes: nombre de processus
+        shared_cache: partage les comptes de lettres des états filtrés entre les processus
+    
+    Returns:
+        dict: nom -> résultats cumulés (parties, victoires, pénalités, indices,
+        décisions, secondes passées à décider)
+    """
+    words = playable_words()
+    rng = random.Random(seed)
+    sequence = [rng.choice(words) for _ in range(games)]
+    tasks = [(name, chunk, sequence[start:start + CHUNK_SIZE], seed)
+             for name in names
+             for chunk, start in enumerate(range(0, games, CHUNK_SIZE))]
+    
+    totals = {name: {"games": 0, "wins": 0, "penalties": 0, "hints": 0, "decisions": 0, "seconds": 0.0}
+              for name in names}
+    table = SharedCountTable() if shared_cache and processes > 1 else None
+    if processes <= 1:
+        outcomes = map(play_chunk, tasks)
+    elif table is not None:
+        pool = ProcessPoolExecutor(processes, initializer=attach_shared_table, initargs=(table.name,))
+        outcomes = pool.map(play_chunk, tasks)
+    else:
+        pool = ProcessPoolExecutor(processes)
+        outcomes = pool.map(play_chunk, tasks)
+    try:
+        for name, _, results in outcomes:
+            for key, value in results.items():
+                totals[name][key] += value
+    finally:
+        if processes > 1:
+            pool.shutdown()
+        if table is not None:
+            table.close()
+    return totals
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du tournoi
+    """
+    parser = argparse.ArgumentParser(description="Tournoi des joueurs automatiques de Pendu Deluxe")
+    parser.add_argument("names", nargs="*", metavar="strategy",
+                        help=f"stratégies parmi {', '.join(STRATEGIES)} (toutes par défaut)")
+    parser.add_argument("--games", type=int, default=2000, help="parties par stratégie")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la suite de mots")
+    parser.add_argument("-j", "--processes", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus")
+    parser.add_argument("--shared-cache", action="store_true",
+                        help="partage les états déjà filtrés entre les processus (mémoire partagée)")
+    options = parser.parse_args(argv)
+    for name in options.names:
+        if name not in STRATEGIES:
+            parser.error(f"stratégie inconnue: {name}")
+    
+    start = time.perf_counter()
+    totals = run_tournament(options.names or list(STRATEGIES), options.games,
+                            options.seed, options.processes, options.shared_cache)
+    print(f"{options.games} parties par stratégie (graine {options.seed}, "
+          f"{options.processes} processus) en {time.perf_counter() - start:.2f} s")
+    
+    print(f"{'stratégie':>10} {'victoires':>10} {'pénalités':>10} {'indices':>8} {'décisions/s':>12}")
+    ranking = sorted(totals.items(), key=lambda item: (-item[1]["wins"], item[1]["penalties"]))
+    for name, results in ranking:
+        count = results["games"]
+        speed = results["decisions"] / results["seconds"] if results["seconds"] else 0
+        print(f"{name:>10} {results['wins'] / count:>10.1%} {results['penalties'] / count:>10.2f} "
+              f"{results['hints'] / count:>8.2f} {speed:>12,.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,556 @@
+"""
+Stockage compact des grands dictionnaires de Pendu Deluxe
+Les mots sont rangés dans un arbre préfixe (trie) stocké dans des tableaux d'octets
+plutôt que dans des listes de chaînes Python : chaque mot n'est stocké qu'une fois et
+ses catégories / niveaux de difficulté sont des bits (un tableau de bits par étiquette).
+
+Le trie est rangé en largeur : les enfants d'un nœud sont contigus et le premier
+enfant du nœud i est 1 + (somme des nombres d'enfants des nœuds avant i). Seuls la
+lettre et le nombre d'enfants de chaque nœud sont stockés (2 octets par nœud), les
+positions se retrouvent grâce à des sommes partielles échantillonnées.
+
+- WordStore.sample(tag) : tire un mot d'une catégorie ou d'un niveau
+- WordStore.match("C_A_", "XZ") : mots compatibles avec un motif du pendu
+- WordStore.category_views() / level_views() : dictionnaires nom -> liste de mots
+  utilisables à la place de WORD_CATEGORIES (len, indexation, random.choice, in...)
+
+Usage:
+    python wordstore.py build -o mots.pdw                   # Base intégrée
+    python wordstore.py build -o mots.pdw --dictionary mots.pdd
+    python wordstore.py stats mots.pdw
+    python wordstore.py match mots.pdw C_A_ --exclude XZ
+"""
+import os       # Module pour connaître la taille des fichiers
+import sys      # Module système pour la sortie
+import json     # Module pour l'en-tête du fichier
+import time     # Module pour mesurer la durée de construction
+import random   # Module pour le tirage des mots
+import struct   # Module pour la taille de l'en-tête
+import hashlib  # Module pour l'empreinte de la base
+import argparse # Module pour lire les options de la ligne de commande
+from array import array  # Tableaux d'entiers compacts
+from bisect import bisect_right  # Recherche dans les sommes partielles
+from collections import deque  # File de la construction en largeur
+from collections.abc import Sequence
+
+from dictionary import WORD_CATEGORIES, load_compiled_dictionary, all_words
+
+STORE_MAGIC = b"PDSTORE2"
+NO_WORD = -1      # Mot absent de la base
+CHILD_BLOCK = 32  # Nœuds entre deux sommes partielles du nombre d'enfants
+BYTE_VALUES = [bytes([value]) for value in range(256)]  # Octet -> bytes d'un caractère
+BYTE_BITS = [tuple(value >> bit & 1 for bit in range(8)) for value in range(256)]  # Octet -> 8 bits
+BYTE_POSITIONS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]  # Bits à 1
+
+class RankBitmap:
+    """
+    Tableau de bits avec comptage (rank) et recherche du k-ième bit à 1 (select)
+    Un total partiel tous les 64 bits suffit : le reste se compte avec int.bit_count
+    """
+    
+    def __init__(self, bits, size):
+        """
+        Args:
+            bits: bytearray des bits (bit i = octet i // 8, bit i % 8)
+            size: nombre de bits
+        """
+        self.bits = bits
+        self.size = size
+        
+        # === TOTAUX PARTIELS ===
+        # samples[b] = nombre de bits à 1 avant le bloc de 64 bits numéro b
+        self.samples = array("I")
+        total = 0
+        for start in range(0, len(bits), 8):
+            self.samples.append(total)
+            total += int.from_bytes(bits[start:start + 8], "little").bit_count()
+        self.count = total
+    
+    @classmethod
+    def from_flags(cls, flags):
+        """
+        Construit le tableau à partir d'une suite de booléens
+        """
+        flags = list(flags)
+        bits = bytearray((len(flags) + 7) // 8)
+        for i, flag in enumerate(flags):
+            if flag:
+                bits[i >> 3] |= 1 << (i & 7)
+        return cls(bits, len(flags))
+    
+    def __getitem__(self, i):
+        return self.bits[i >> 3] >> (i & 7) & 1
+    
+    def rank(self, i):
+        """
+        Nombre de bits à 1 avant la position i
+        """
+        block = i >> 6
+        start = block << 3
+        value = int.from_bytes(self.bits[start:start + 8], "little") & ((1 << (i & 63)) - 1)
+        return self.samples[block] + value.bit_count()
+    
+    def select(self, k):
+        """
+        Position du k-ième bit à 1 (k commence à 0)
+        """
+        block = bisect_right(self.samples, k) - 1
+        start = block << 3
+        value = int.from_bytes(self.bits[start:start + 8], "little")
+        for _ in range(k - self.samples[block]):
+            value &= value - 1  # Retire le bit à 1 le plus faible
+        return (block << 6) + (value & -value).bit_length() - 1
+    
+    def positions(self):
+        """
+        Positions de tous les bits à 1, dans l'ordre (octets nuls sautés)
+        """
+        return [(i << 3) + bit for i, value in enumerate(self.bits) if value for bit in BYTE_POSITIONS[value]]
+    
+    def memory_bytes(self):
+        return len(self.bits) + self.samples.itemsize * len(self.samples)
+
+class TagView(Sequence):
+    """
+    Liste en lecture seule des mots d'une catégorie ou d'un niveau
+    Les mots sont reconstruits depuis le trie à la demande
+    """
+    
+    def __init__(self, store, name, members):
+        self.store = store
+        self.name = name
+        self.members = members  # RankBitmap sur les numéros de mots
+        # Empreinte utilisée par sampler.py pour valider l'état des sacs : celle des mots
+        # de l'étiquette (toujours rangés dans le même ordre), sinon celle de la base
+        self.fingerprint = store.tag_fingerprints.get(name) or f"{store.fingerprint}:{name}"
+    
+    def __len__(self):
+        return self.members.count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.store.word(self.members.select(index))
+    
+    def __contains__(self, word):
+        word_id = self.store.find(word)
+        return word_id != NO_WORD and bool(self.members[word_id])
+
+class WordStore:
+    """
+    Trie en tableaux d'octets avec une étiquette (catégorie ou niveau) par tableau de bits
+    Les mots sont numérotés dans l'ordre de leur nœud terminal (par longueur puis
+    alphabétique)
+    """
+    
+    def __init__(self, letters, child_counts, terminals, tag_members, categories, levels, fingerprint,
+                 tag_fingerprints=None):
+        """
+        Args:
+            letters: array('B'), octet de la lettre de chaque nœud (0 pour la racine)
+            child_counts: array('B'), nombre d'enfants de chaque nœud
+            terminals: RankBitmap, nœuds qui terminent un mot
+            tag_members: un RankBitmap par étiquette, sur les numéros de mots
+            categories: noms des catégories
+            levels: noms des niveaux de difficulté (étiquettes suivantes)
+            fingerprint: empreinte de la liste de mots
+            tag_fingerprints: étiquette -> empreinte de ses mots (absent des anciens fichiers)
+        """
+        self.letters = letters
+        self.child_counts = child_counts
+        self.terminals = terminals
+        self.tag_members = tag_members
+        self.categories = list(categories)
+        self.levels = list(levels)
+        self.tags = self.categories + self.levels
+        self.fingerprint = fingerprint
+        self.tag_fingerprints = tag_fingerprints or {}
+        
+        # child_starts[b] = premier enfant du nœud b * CHILD_BLOCK
+        self.child_starts = array("I")
+        total = 1
+        for start in range(0, len(child_counts), CHILD_BLOCK):
+            self.child_starts.append(total)
+            total += sum(child_counts[start:start + CHILD_BLOCK])
+    
+    @classmethod
+    def build(cls, categories, levels=None):
+        """
+        Construit le trie à partir de listes de mots
+        
+        Args:
+            categories: nom de catégorie -> liste de mots
+            levels: nom de niveau de difficulté -> liste de mots (optionnel)
+        
+        Returns:
+            WordStore: base construite
+        """
+        levels = levels or {}
+        groups = list(categories.values()) + list(levels.values())
+        
+        # Étiquettes de chaque mot (un mot présent dans plusieurs listes n'est gardé qu'une fois)
+        word_tags = {}
+        for bit, group in enumerate(groups):
+            for word in group:
+                word_tags[word] = word_tags.get(word, 0) | (1 << bit)
+        words = sorted(word.encode("utf-8") for word in word_tags)
+        
+        letters = array("B", [0])
+        child_counts = array("B", [0])
+        terminal_flags = [False]
+        tag_flags = [[] for _ in groups]
+        
+        # === CONSTRUCTION EN LARGEUR ===
+        # Chaque nœud couvre une plage de mots triés partageant le même préfixe ; les
+        # nœuds sont traités dans l'ordre de leur numéro, enfants créés ensemble
+        pending = deque([(0, len(words), 0)])  # (début, fin, profondeur) du nœud suivant
+        node = 0
+        while pending:
+            start, end, depth = pending.popleft()
+            if start < end and len(words[start]) == depth:
+                # Le mot égal au préfixe est trié avant ceux qui le prolongent
+                terminal_flags[node] = True
+                tags = word_tags[words[start].decode("utf-8")]
+                for bit, flags in enumerate(tag_flags):
+                    flags.append(tags >> bit & 1)
+                start += 1
+            
+            children = 0
+            i = start
+            while i < end:
+                letter = words[i][depth]
+                j = i + 1
+                while j < end and words[j][depth] == letter:
+                    j += 1
+                letters.append(letter)
+                child_counts.append(0)
+                terminal_flags.append(False)
+                pending.append((i, j, depth + 1))
+                children += 1
+                i = j
+            child_counts[node] = children
+            node += 1
+        
+        fingerprint = hashlib.sha1(b"\n".join(words)).hexdigest()
+        # Empreinte des mots de chaque étiquette (dans l'ordre des numéros de mots) : le
+        # rechargement à chaud ne compare que les étiquettes dont l'empreinte change
+        tag_words = {name: [] for name in list(categories) + list(levels)}
+        for word in sorted(words, key=len):  # Ordre des numéros : longueur puis alphabétique
+            tags = word_tags[word.decode("utf-8")]
+            for bit, name in enumerate(tag_words):
+                if tags >> bit & 1:
+                    tag_words[name].append(word)
+        tag_fingerprints = {name: hashlib.sha1(b"\n".join(group)).hexdigest()
+                            for name, group in tag_words.items()}
+        return cls(letters, child_counts, RankBitmap.from_flags(terminal_flags),
+                   [RankBitmap.from_flags(flags) for flags in tag_flags],
+                   categories, levels, fingerprint, tag_fingerprints)
+    
+    # === NAVIGATION DANS LE TRIE ===
+    
+    def first_child(self, node):
+        """
+        Numéro du premier enfant d'un nœud
+        """
+        block_start = node - node % CHILD_BLOCK
+        return self.child_starts[node // CHILD_BLOCK] + sum(self.child_counts[block_start:node])
+    
+    def parent(self, node):
+        """
+        Numéro du parent d'un nœud (le nœud dont la plage d'enfants le contient)
+        """
+        block = bisect_right(self.child_starts, node) - 1
+        parent = block * CHILD_BLOCK
+        start = self.child_starts[block]
+        child_counts = self.child_counts
+        while start + child_counts[parent] <= node:
+            start += child_counts[parent]
+            parent += 1
+        return parent
+    
+    def __len__(self):
+        return self.terminals.count
+    
+    def word(self, word_id):
+        """
+        Reconstruit un mot en remontant de son nœud terminal jusqu'à la racine
+        """
+        node = self.terminals.select(word_id)
+        chars = []
+        while node:
+            chars.append(self.letters[node])
+            node = self.parent(node)
+        return bytes(reversed(chars)).decode("utf-8")
+    
+    def find(self, word):
+        """
+        Cherche un mot
+        
+        Returns:
+            int: numéro du mot, ou NO_WORD s'il est absent
+        """
+        node = 0
+        letters = self.letters
+        for char in word.encode("utf-8"):
+            first = self.first_child(node)
+            for child in range(first, first + self.child_counts[node]):
+                if letters[child] == char:
+                    node = child
+                    break
+            else:
+                return NO_WORD
+        return self.terminals.rank(node) if self.terminals[node] else NO_WORD
+    
+    def __contains__(self, word):
+        return self.find(word) != NO_WORD
+    
+    def tags_of(self, word):
+        """
+        Retourne les catégories et niveaux d'un mot (liste vide s'il est absent)
+        """
+        word_id = self.find(word)
+        if word_id == NO_WORD:
+            return []
+        return [name for name, members in zip(self.tags, self.tag_members) if members[word_id]]
+    
+    def sample(self, tag, rng=random):
+        """
+        Tire un mot d'une catégorie ou d'un niveau
+        
+        Args:
+            tag: nom de la catégorie ou du niveau
+            rng: générateur aléatoire
+        
+        Returns:
+            str: mot tiré
+        """
+        members = self.tag_members[self.tags.index(tag)]
+        return self.word(members.select(rng.randrange(members.count)))
+    
+    def match(self, pattern, excluded=""):
+        """
+        Parcourt les mots compatibles avec un motif du pendu
+        
+        Args:
+            pattern: mot masqué, '_' pour les lettres cachées (ex: "C_A_")
+            excluded: lettres proposées absentes du mot
+        
+        Yields:
+            str: mots compatibles, dans l'ordre alphabétique
+        """
+        length = len(pattern)
+        wanted = pattern.encode("ascii")
+        # Une case cachée ne peut contenir ni une lettre déjà révélée ni une lettre exclue
+        banned = set(wanted.replace(b"_", b"")) | set(excluded.encode("ascii"))
+        hidden = ord("_")
+        letters, child_counts, terminals = self.letters, self.child_counts, self.terminals
+        
+        pending = [(0, 0)]  # (nœud, profondeur)
+        while pending:
+            node, depth = pending.pop()
+            if depth == length:
+                if terminals[node]:
+                    yield self.word(terminals.rank(node))
+                continue
+            want = wanted[depth]
+            first = self.first_child(node)
+            # Enfants empilés à l'envers : les mots sortent dans l'ordre alphabétique
+            for child in range(first + child_counts[node] - 1, first - 1, -1):
+                letter = letters[child]
+                if letter == want if want != hidden else letter not in banned:
+                    pending.append((child, depth + 1))
+    
+    def length_groups(self):
+        """
+        Retourne tous les mots regroupés par longueur (en octets UTF-8), en un seul
+        parcours du trie niveau par niveau : les mots d'un niveau ont des numéros
+        consécutifs, et seuls les préfixes d'un niveau existent à la fois
+        
+        Returns:
+            dict: longueur -> (b"MOT\\nMOT...", numéro du premier mot, nombre de mots)
+        """
+        letters, child_counts, bits = self.letters, self.child_counts, self.terminals.bits
+        groups = {}
+        start, end, prefixes, depth = 0, 1, [b""], 0
+        while start < end:
+            # === MOTS QUI SE TERMINENT À CE NIVEAU ===
+            flags = [flag for value in bits[start >> 3:(end + 7) >> 3] for flag in BYTE_BITS[value]]
+            flags = flags[start & 7:(start & 7) + end - start]
+            words = [prefix for prefix, flag in zip(prefixes, flags) if flag]
+            if words:
+                groups[depth] = (b"\n".join(words), self.terminals.rank(start), len(words))
+            
+            # === PRÉFIXES DU NIVEAU SUIVANT (enfants contigus, dans l'ordre des parents) ===
+            child = end
+            next_prefixes = []
+            for prefix, count in zip(prefixes, child_counts[start:end]):
+                next_prefixes.extend([prefix + BYTE_VALUES[letter] for letter in letters[child:child + count]])
+                child += count
+            start, end, prefixes, depth = end, child, next_prefixes, depth + 1
+        return groups
+    
+    def words_by_id(self):
+        """
+        Retourne tous les mots (en octets UTF-8) dans l'ordre de leurs numéros
+        """
+        words = []
+        for _, (text, _, _) in sorted(self.length_groups().items()):
+            words.extend(text.split(b"\n"))
+        return words
+    
+    def tag_word_ids(self, tag):
+        """
+        Numéros des mots d'une catégorie ou d'un niveau, dans l'ordre
+        """
+        return self.tag_members[self.tags.index(tag)].positions()
+    
+    def category_views(self):
+        """
+        Retourne les catégories sous la forme utilisée par le jeu (nom -> liste de mots)
+        """
+        return {name: TagView(self, name, self.tag_members[i]) for i, name in enumerate(self.categories)}
+    
+    def level_views(self):
+        """
+        Retourne les niveaux de difficulté sous la forme nom -> liste de mots
+        """
+        offset = len(self.categories)
+        return {name: TagView(self, name, self.tag_members[offset + i]) for i, name in enumerate(self.levels)}
+    
+    def memory_bytes(self):
+        """
+        Taille des tableaux du trie et des étiquettes, en octets
+        """
+        size = len(self.letters) + len(self.child_counts) + self.child_starts.itemsize * len(self.child_starts)
+        return size + sum(bitmap.memory_bytes() for bitmap in [self.terminals] + self.tag_members)
+    
+    # === FICHIER ===
+    
+    def save(self, path):
+        """
+        Enregistre la base : en-tête JSON puis contenu brut des tableaux
+        """
+        header = {
+            "categories": self.categories,
+            "levels": self.levels,
+            "fingerprint": self.fingerprint,
+            "tag_fingerprints": self.tag_fingerprints,
+            "nodes": len(self.letters),
+            "words": len(self),
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(STORE_MAGIC + struct.pack("<I", len(encoded)) + encoded)
+            f.write(self.letters.tobytes())
+            f.write(self.child_counts.tobytes())
+            for bitmap in [self.terminals] + self.tag_members:
+                f.write(bitmap.bits)
+        os.replace(temporary_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Charge une base enregistrée par save
+        
+        Raises:
+            ValueError: si le fichier n'est pas une base de mots compacte
+        """
+        with open(path, "rb") as f:
+            if f.read(len(STORE_MAGIC)) != STORE_MAGIC:
+                raise ValueError(f"{path} n'est pas une base de mots compacte")
+            (size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(size))
+            nodes, words = header["nodes"], header["words"]
+            
+            letters = array("B", f.read(nodes))
+            child_counts = array("B", f.read(nodes))
+            terminals = RankBitmap(bytearray(f.read((nodes + 7) // 8)), nodes)
+            tag_members = [RankBitmap(bytearray(f.read((words + 7) // 8)), words)
+                           for _ in header["categories"] + header["levels"]]
+        return cls(letters, child_counts, terminals, tag_members,
+                   header["categories"], header["levels"], header["fingerprint"],
+                   header.get("tag_fingerprints"))
+
+def pools_store(pools):
+    """
+    Retourne la WordStore dont viennent des listes de mots (None pour des listes ordinaires)
+    
+    Args:
+        pools: nom -> mots (listes, ou vues TagView)
+    """
+    return getattr(next(iter(pools.values()), None), "store", None)
+
+def is_word_store(path):
+    """
+    Indique si un fichier est une base de mots compacte (et non un dictionnaire compilé)
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(STORE_MAGIC)) == STORE_MAGIC
+    except OSError:
+        return False
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande de la base compacte
+    """
+    parser = argparse.ArgumentParser(description="Base de mots compacte de Pendu Deluxe")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build_parser = commands.add_parser("build", help="construit la base")
+    build_parser.add_argument("-o", "--output", required=True, help="fichier de la base à écrire")
+    build_parser.add_argument("--dictionary", help="dictionnaire compilé (par défaut la base intégrée)")
+    build_parser.add_argument("-j", "--processes", type=int, default=os.cpu_count() or 1,
+                              help="processus pour mesurer la difficulté")
+    
+    stats_parser = commands.add_parser("stats", help="affiche la taille de la base")
+    stats_parser.add_argument("store")
+    
+    match_parser = commands.add_parser("match", help="mots compatibles avec un motif")
+    match_parser.add_argument("store")
+    match_parser.add_argument("pattern", help="motif, '_' pour les lettres cachées (ex: C_A_)")
+    match_parser.add_argument("--exclude", default="", help="lettres absentes du mot")
+    
+    options = parser.parse_args(argv)
+    
+    if options.command == "build":
+        from difficulty import score_words, difficulty_bands  # Seulement pour la construction
+        from rules import is_playable
+        
+        if options.dictionary:
+            categories = load_compiled_dictionary(options.dictionary)
+            words = [word for group in categories.values() for word in group]
+        else:
+            categories, words = WORD_CATEGORIES, all_words()
+        
+        start = time.perf_counter()
+        # Niveaux de difficulté mesurés (voir difficulty.py)
+        scores = score_words([word for word in dict.fromkeys(words) if is_playable(word)],
+                             options.processes)
+        store = WordStore.build(categories, difficulty_bands(scores))
+        store.save(options.output)
+        print(f"{len(store)} mots, {len(store.letters)} nœuds construits en "
+              f"{time.perf_counter() - start:.2f} s -> {options.output}")
+    
+    elif options.command == "stats":
+        store = WordStore.load(options.store)
+        print(f"{len(store)} mots, {len(store.letters)} nœuds, "
+              f"{store.memory_bytes() / 1e6:.1f} Mo en mémoire "
+              f"(fichier: {os.path.getsize(options.store) / 1e6:.1f} Mo)")
+        for name, words in list(store.category_views().items()) + list(store.level_views().items()):
+            print(f"{name:>16}: {len(words):>8} mots (ex: {store.sample(name)})")
+    
+    elif options.command == "match":
+        store = WordStore.load(options.store)
+        for word in store.match(options.pattern.upper(), options.exclude.upper()):
+            print(word)
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())